@@ -106,6 +106,339 @@ class Solution:
         return []  # No solution found (won't happen per problem constraints)
 
 
+# [VECTORIZED SOLUTION - NumPy argsort + searchsorted]
+# Time complexity: O(n log n) - but every step runs in compiled NumPy code, not the interpreter:
+#                  - Converting the input to an int64 array: O(n) (free for an existing int64 ndarray)
+#                  - argsort of the values: O(n log n)
+#                  - One vectorized searchsorted for all n complements: n × O(log n) = O(n log n)
+#                  - Masking and argmax to find the first completed pair: O(n)
+#                  - Total: O(n) + O(n log n) + O(n log n) + O(n) = O(n log n)
+# Space complexity: O(n) - A handful of int64 arrays of length n (sorted values, order, positions)
+#                   at 8 bytes per element, instead of a dict of boxed ints
+# Explanation: Stable-argsort the values once, then binary-search the complement (target - x) of
+#              every element at the same time. Element j completes a pair if its complement exists
+#              at some earlier index; the first such j and the latest matching earlier index are
+#              exactly what the hash map Solution would return, so the [i, j] contract is unchanged.
+# Why this complexity: The hash map is O(n) on paper, but pays ~100 ns of interpreter overhead per
+#                      element. The sort is O(n log n) but costs a few ns per element in C, so it
+#                      wins on large arrays. Small inputs (below NUMPY_MIN_SIZE, where the fixed cost
+#                      of the NumPy calls dominates), non-integer input (floats would be truncated
+#                      by the int64 cast) and environments without NumPy fall back to the hash map
+#                      Solution.
+# NUMPY_MIN_SIZE is the crossover reported by the benchmark harness:
+#   python 1_arrays_and_hashing/benchmark.py --problem two_sum --solution Solution --solution NumpySolution
+import os
+import sys
+
+np = None  # NumPy is optional and costs ~100 ms to import, so _numpy() imports it on first use
+try:
+    from data_structures_algorithms._compat import load_numpy
+except ImportError:  # Run as a script from a source checkout: the package sits next to this directory
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from data_structures_algorithms._compat import load_numpy
+
+
+def _numpy():
+    # The numpy module, imported the first time a vectorized path runs; None if it is not installed
+    return load_numpy(globals())  # Also binds it as this module's `np`
+
+NUMPY_MIN_SIZE = 1_000
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+def _int64_target(target, lo, hi):
+    # True if `target` is an integer and every target - v for lo <= v <= hi fits in int64, so the
+    # vectorized complements neither truncate a fractional target nor wrap around
+    if not isinstance(target, int) and not (np is not None and isinstance(target, np.integer)):
+        return False
+    target = int(target)
+    return INT64_MIN <= target <= INT64_MAX and INT64_MIN <= target - hi and target - lo <= INT64_MAX
+
+
+class NumpySolution:
+    def twoSum(self, nums, target):
+        n = len(nums)
+        if n < NUMPY_MIN_SIZE or _numpy() is None:
+            return Solution().twoSum(nums, target)
+
+        # Accepts lists, integer ndarrays and anything exposing an integer buffer (e.g. array('q')).
+        # Floats, mixed or nested input would be truncated / rounded by an int64 cast, so anything
+        # that is not a flat integer array uses the exact hash map instead
+        try:
+            values = np.asarray(nums)
+        except ValueError:  # Ragged nested sequences
+            values = None
+        if values is None or values.ndim != 1 or values.dtype.kind not in "iu":
+            return Solution().twoSum(nums, target)
+        # target - values is computed in int64: the target must be an integer, and every complement
+        # must fit (a target beyond int64, or near its limits, would raise or wrap around)
+        if not _int64_target(target, int(values.min()), int(values.max())):
+            return Solution().twoSum(nums, target)
+        if values.dtype.kind == "u" and values.max() > INT64_MAX:
+            return Solution().twoSum(nums, target)
+        values = values.astype(np.int64, copy=False)  # target - values must not wrap around in uint
+
+        # Stable sort keeps equal values in index order, so order[left] is the EARLIEST index
+        # holding a given value
+        order = np.argsort(values, kind="stable")
+        sorted_values = values[order]
+
+        # Binary-search every complement at once
+        complements = target - values
+        left = np.searchsorted(sorted_values, complements, side="left")
+        clipped = np.minimum(left, n - 1)
+
+        # Index j completes a pair if its complement exists at an index smaller than j.
+        # When the complement equals nums[j] itself, order[left] is the first occurrence of that
+        # value, which is only < j if there is another copy before j (so i != j holds).
+        found = (left < n) & (sorted_values[clipped] == complements) \
+            & (order[clipped] < np.arange(n))
+        if not found.any():
+            return []  # No solution found (won't happen per problem constraints)
+
+        # First completed pair, same as the moment the hash map Solution returns
+        j = int(np.argmax(found))
+        complement = complements[j]
+        lo = int(left[j])
+        hi = int(np.searchsorted(sorted_values, complement, side="right"))
+        # Latest earlier index holding the complement, same as seen[complement] in Solution
+        candidates = order[lo:hi]
+        i = int(candidates[np.searchsorted(candidates, j) - 1])
+        return [i, j]
+
+
+# [BATCHED QUERIES - Reusable Value Index]
+# Time complexity: O(n log n) once to build, then O(d) per query, where d = number of distinct values
+#                  - Build: stable sort of n values O(n log n) + one pass to record the first two
+#                    indices of every distinct value O(n)
+#                  - query(target): for each distinct value v, O(1) hash lookup of (target - v): O(d)
+#                  - query_many(m targets) with NumPy: one (rows × d) complement matrix per chunk and a
+#                    vectorized searchsorted over it: m × d × O(log d), all in compiled code
+#                  - Total for m targets: O(n log n) + O(m × d) instead of m × O(n) dict rebuilds
+# Space complexity: O(d) - Sorted distinct values plus their first two indices (a second copy is only
+#                   needed when target = 2 × value); query_many adds one chunk of at most
+#                   QUERY_CHUNK_ELEMENTS complements at a time
+# Explanation: Solution rebuilds its `seen` dict for every call. When the same nums are queried with
+#              many targets, build the value index once: for every distinct value keep its first index
+#              (and second, for pairs like 3 + 3 = 6). A query walks the distinct values in sorted order
+#              and looks up each complement, returning the pair for the smallest value that has one.
+# Why this complexity: The index-build cost is paid once and amortized over all queries; each query
+#                      touches only distinct values, and batches run as NumPy array operations.
+QUERY_CHUNK_ELEMENTS = 1 << 22  # Complements evaluated per NumPy step (~32 MB of int64)
+
+
+class TwoSumIndex:
+    def __init__(self, nums):
+        # Record the first two indices of every value (enumerate visits indices in order)
+        positions = {}
+        for i, num in enumerate(nums):
+            if num not in positions:
+                positions[num] = [i, -1]
+            elif positions[num][1] == -1:
+                positions[num][1] = i
+        # Hash map {value: [first_index, second_index or -1]} and the distinct values sorted
+        self._positions = positions
+        self._values = sorted(positions)
+
+        # The int64 arrays are exact only for plain ints within range: floats would be truncated
+        self._arrays = None
+        if len(self._values) >= NUMPY_MIN_SIZE and _numpy() is not None \
+                and all(type(v) is int for v in self._values) \
+                and INT64_MIN <= self._values[0] and self._values[-1] <= INT64_MAX:
+            self._arrays = (
+                np.array(self._values, dtype=np.int64),
+                np.array([positions[v][0] for v in self._values], dtype=np.int64),
+                np.array([positions[v][1] for v in self._values], dtype=np.int64),
+            )
+
+    def query(self, target):
+        if self._arrays is not None:
+            return self.query_many([target])[0]
+        return self._query_python(target)
+
+    def _query_python(self, target):
+        positions = self._positions
+        for value in self._values:
+            complement = target - value
+            if complement not in positions:
+                continue
+            if complement != value:
+                i, j = positions[value][0], positions[complement][0]
+                return [min(i, j), max(i, j)]
+            if positions[value][1] != -1:  # value + value needs two copies
+                return list(positions[value])  # A copy: callers must not alias the index
+        return []  # No pair sums to target
+
+    def query_many(self, targets):
+        if self._arrays is None:
+            return [self.query(target) for target in targets]
+
+        # Integer targets whose complements fit in int64 are vectorized; any other target (a float,
+        # or one far outside the value range) takes the exact hash map lookup of query()
+        lo, hi = self._values[0], self._values[-1]
+        results = [None] * len(targets)
+        vectorized = []
+        for r, target in enumerate(targets):
+            if _int64_target(target, lo, hi):
+                vectorized.append(r)
+            else:
+                results[r] = self._query_python(target)
+        found_pairs = self._query_arrays(np.array([targets[r] for r in vectorized], dtype=np.int64))
+        for r, pair in zip(vectorized, found_pairs):
+            results[r] = pair
+        return results
+
+    def _query_arrays(self, targets):
+        values, first, second = self._arrays
+        d = len(values)
+        results = []
+        rows = max(1, QUERY_CHUNK_ELEMENTS // d)
+        for start in range(0, len(targets), rows):
+            chunk = targets[start:start + rows]
+            # complements[r, c] = chunk[r] - values[c]: one row per target
+            complements = chunk[:, None] - values[None, :]
+            pos = np.searchsorted(values, complements)
+            clipped = np.minimum(pos, d - 1)
+            # Complement present, and not the value itself unless it occurs twice
+            hit = (values[clipped] == complements) \
+                & ((clipped != np.arange(d)) | (second != -1))
+            has_pair = hit.any(axis=1)
+            # Smallest value with a complement in each row
+            a = np.argmax(hit, axis=1)
+            b = clipped[np.arange(len(chunk)), a]
+            i = first[a]
+            j = np.where(a == b, second[a], first[b])
+            lo, hi = np.minimum(i, j), np.maximum(i, j)
+            for found, x, y in zip(has_pair.tolist(), lo.tolist(), hi.tolist()):
+                results.append([x, y] if found else [])
+        return results
+
+
+# [STREAMING SOLUTION - Chunked Hash Map with External Sort Fallback]
+# Time complexity: O(n) without a memory cap, O(n log n) once the cap is hit
+#                  - Reading the iterable chunk by chunk: O(n) total, stopping at the first pair
+#                  - Hash map phase: n × O(1) lookups/insertions = O(n), same as Solution
+#                  - External phase: sorting runs of at most max_items pairs: (n / max_items) runs ×
+#                    O(max_items log max_items) = O(n log max_items), then a k-way merge read from both
+#                    ends: O(n log r) for r runs, then the two-pointer scan: O(n)
+#                  - Total with the cap: O(n log n) (plus sequential disk I/O of the spilled runs)
+# Space complexity: O(min(n, max_items)) in memory - the hash map is never allowed past max_items
+#                   entries; beyond that data lives in temporary run files on disk
+# Explanation: Pull numbers from any iterable (file, socket, generator) in chunks of chunk_size and run
+#              the Solution hash map over them, returning as soon as a pair completes - the rest of the
+#              stream is never read. If the `seen` map would exceed max_items, switch to an external
+#              SortingSolution: spill the map and then every further max_items numbers as sorted runs of
+#              (value, index) to temp files, merge the runs ascending for the left pointer and descending
+#              for the right pointer, and do the usual two-pointer scan on the merged streams.
+# Why this complexity: Without a cap this is Solution fed lazily. With a cap, memory is bounded by one
+#                      run plus one read block per run, at the price of sorting and reading the whole
+#                      stream (a pair can only be confirmed once everything has been seen).
+import heapq
+from array import array
+from itertools import islice
+
+STREAM_CHUNK_SIZE = 1 << 16  # Numbers pulled from the iterable at a time
+RUN_BLOCK_ITEMS = 1 << 12    # (value, index) pairs read per block when merging spilled runs
+
+
+def _chunks(iterable, size):
+    # Yield lists of up to `size` items from any iterable without materializing it
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _spill_run(pairs, directory, runs):
+    # Sort (value, index) pairs and write them as interleaved int64s to a new run file
+    pairs.sort()
+    flat = array("q")
+    for value, index in pairs:
+        flat.append(value)
+        flat.append(index)
+    path = os.path.join(directory, f"run{len(runs)}.bin")
+    with open(path, "wb") as f:
+        flat.tofile(f)
+    runs.append((path, len(pairs)))
+
+
+def _read_run(path, count, reverse=False):
+    # Yield the (value, index) pairs of a run file block by block, ascending or descending
+    with open(path, "rb") as f:
+        starts = range(0, count, RUN_BLOCK_ITEMS)
+        for start in (reversed(starts) if reverse else starts):
+            block = array("q")
+            f.seek(start * 2 * block.itemsize)
+            block.fromfile(f, 2 * min(RUN_BLOCK_ITEMS, count - start))
+            pairs = zip(block[0::2], block[1::2])
+            yield from (reversed(list(pairs)) if reverse else pairs)
+
+
+class StreamingSolution:
+    def twoSum(self, nums, target, max_items=None, chunk_size=STREAM_CHUNK_SIZE, spill_dir=None):
+        if max_items is None:
+            chunks = _chunks(nums, chunk_size)
+        else:
+            max_items = max(1, max_items)
+            iterator = iter(nums)
+            # Never pull more numbers than the cap still has room for, so `seen` (and each spilled
+            # run below) holds at most max_items entries
+            chunks = iter(lambda: list(islice(iterator, min(chunk_size, max_items - len(seen)))), [])
+
+        # Phase 1: Solution's hash map over the stream, exiting at the first completed pair
+        seen = {}
+        i = 0
+        for chunk in chunks:
+            for offset, num in enumerate(chunk):
+                complement = target - num
+                if complement in seen:
+                    return [seen[complement], i + offset]
+                seen[num] = i + offset
+            i += len(chunk)
+            if max_items is not None and len(seen) >= max_items:
+                break
+        else:
+            return []  # Stream exhausted without a pair
+
+        # Phase 2: memory cap reached - external sort + two pointers over the rest of the stream
+        import tempfile  # Only needed once we spill; keeps the module cheap to import
+
+        with tempfile.TemporaryDirectory(dir=spill_dir) as directory:
+            runs = []
+            # No pair exists inside the prefix already seen, so its latest index per value suffices
+            _spill_run([(num, index) for num, index in seen.items()], directory, runs)
+            del seen
+            buffer = []
+            chunks = iter(lambda: list(islice(iterator, min(chunk_size, max_items - len(buffer)))), [])
+            for chunk in chunks:
+                buffer.extend(zip(chunk, range(i, i + len(chunk))))
+                i += len(chunk)
+                if len(buffer) >= max_items:
+                    _spill_run(buffer, directory, runs)
+                    buffer = []
+            if buffer:
+                _spill_run(buffer, directory, runs)
+                buffer = []
+
+            ascending = heapq.merge(*(_read_run(path, count) for path, count in runs))
+            descending = heapq.merge(*(_read_run(path, count, reverse=True) for path, count in runs),
+                                     reverse=True)
+            left_pos, right_pos = 0, sum(count for _, count in runs) - 1
+            if right_pos < 1:
+                return []
+            (left_value, left_index), (right_value, right_index) = next(ascending), next(descending)
+            while left_pos < right_pos:
+                current_sum = left_value + right_value
+                if current_sum == target:
+                    return [min(left_index, right_index), max(left_index, right_index)]
+                elif current_sum < target:
+                    left_value, left_index = next(ascending)  # Need larger sum
+                    left_pos += 1
+                else:
+                    right_value, right_index = next(descending)  # Need smaller sum
+                    right_pos -= 1
+        return []  # No solution found
+
+
 # Test Cases
 # Test Case 1: Basic case
 nums1 = [3, 4, 5, 6]
@@ -131,6 +464,52 @@ target4 = 3
 # Output: [0, 1]
 # Explanation: Minimum array size, only one possible pair
 
+# Test Case 5: Large input for NumpySolution (above NUMPY_MIN_SIZE, so the vectorized path runs)
+if __name__ == "__main__":  # Built only when run as a script, not on import
+    nums5 = list(range(0, 8000, 4)) + [1, 2]
+    target5 = 3
+# Output: [2000, 2001]
+# Explanation: All fillers are multiples of 4, so only 1 + 2 = 3 reaches the target; the pair sits
+#              at the last two indices, the worst case for the single-pass hash map
+
+# Test Case 6: Many targets against one TwoSumIndex
+nums6 = [3, 4, 5, 6, 3]
+targets6 = [7, 10, 6, 100]
+# Output: [[0, 1], [1, 3], [0, 4], []]
+# Explanation: The index is built once and reused for every target. 7 = 3 + 4, 10 = 4 + 6,
+#              6 = 3 + 3 uses both copies of 3 (indices 0 and 4), and no pair reaches 100
+
+# Test Case 7: Streaming input with a memory cap
+nums7 = iter([10, 20, 30, 40, 3, 4])
+target7 = 7
+max_items7 = 2
+# Output: [4, 5]
+# Explanation: nums7 is a one-shot iterator, so StreamingSolution reads it lazily. The `seen` map hits
+#              the 2-item cap after 10 and 20, so the stream is spilled in sorted runs of 2 and the
+#              pair 3 + 4 is found by the external two-pointer merge
+
+# Test Case 8: Float input for NumpySolution
+if __name__ == "__main__":  # Built only when run as a script, not on import
+    nums8 = [0.5] * 1000 + [1.5, 1.5]
+    target8 = 3.0
+# Output: [1000, 1001]
+# Explanation: An int64 cast would turn every value into 0 or 1 and miss 1.5 + 1.5; only integer
+#              arrays take the vectorized path, so floats go through the exact hash map
+
+# Test Case 9: Float values and targets against a large TwoSumIndex
+# nums9 = [i + 0.5 for i in range(1000)] + [0.25, 0.75]  (built on demand, not at import)
+# Output: TwoSumIndex(nums9).query(1.0) == [1000, 1001]; TwoSumIndex(list(range(1000))).query(3.5) == []
+# Explanation: The int64 arrays are only built when every distinct value is a plain int, and only
+#              integer targets whose complements fit in int64 are vectorized; everything else uses
+#              the exact hash map lookup
+
+# Test Case 10: Target outside int64 for NumpySolution
+# nums10 = list(range(2000)), target10 = 2**70  (built on demand, not at import)
+# Output: []
+# Explanation: Every complement target - x would overflow int64, so the hash map Solution answers;
+#              targets whose complements all fit (e.g. 2**63 - 1 against non-negative values) stay
+#              vectorized
+
 
 # Summary of Approaches
 # | Approach           | Time       | Space    | Pros                              | Cons                           |
@@ -138,6 +517,12 @@ target4 = 3
 # | Brute Force        | O(n²)      | O(1)     | Simple, no extra space            | Very slow for large inputs     |
 # | Sorting + 2 Ptr    | O(n log n) | O(n)     | Faster than brute force           | Sorting overhead, extra space  |
 # | Hash Map           | O(n)       | O(n)     | Fastest, single pass, optimal     | Uses extra space               |
+# | NumPy Vectorized   | O(n log n) | O(n)     | Compiled loops, fastest on large  | Needs NumPy, always full pass, |
+# |                    |            |          | int arrays, compact int64 storage | slower than hash map when small|
+# | Value Index (batch)| O(n log n) | O(d)     | Build once, O(d) per query,       | Build cost wasted for a single |
+# |                    | + O(d)/qry |          | vectorized batches of targets     | query; per query, not per pair |
+# | Streaming          | O(n), or   | O(cap)   | Any iterable, exits at first pair,| Capped mode reads whole stream |
+# |                    | O(n log n) |          | bounded memory with disk spill    | and pays sort + disk I/O       |
 #
 # Winner: Hash Map Solution - Achieves optimal O(n) time complexity with a single pass through the array.
 #         The space-time tradeoff is worthwhile as O(n) space is acceptable for most use cases,
@@ -94,6 +94,122 @@ class Solution:
         return all(count == 0 for count in counter)
 
 
+# [UNICODE-AWARE - Strategy Picked from the Input]
+# Time complexity: O(n × d) for small alphabets, O(n) otherwise - where d = distinct characters
+#                  - Length check: O(1)
+#                  - Latin-1 check and encode: O(1) for ASCII (str.isascii reads a flag), otherwise
+#                    O(n) - CPython already stores Latin-1 text one byte per char, so encoding is a copy
+#                  - Distinct characters of s: set() built in C: O(n)
+#                  - d ≤ FEW_DISTINCT: 2d calls of .count(), each a C scan of n chars: O(n × d), with d
+#                    bounded by FEW_DISTINCT that is O(n), and it stops at the first mismatch
+#                  - Otherwise: Counter(s) == Counter(t), counted in C: O(n) + O(n) + O(d)
+# Space complexity: O(d) - The set (or counters) of distinct characters, at most 256 entries on the
+#                   Latin-1 path; plus an O(n) byte copy of each string on the non-ASCII Latin-1 path
+# Explanation: Solution assumes lowercase ASCII (ord(c) - ord('a')) and breaks on anything else, while
+#              OptimizedSolution is correct for any text but counts in two Python-level loops. This
+#              version never assumes an alphabet. ASCII/Latin-1 strings are encoded to bytes so every
+#              character is a small cached int. If s uses few distinct characters, each one is counted in
+#              both strings with the C-level .count() scan; with a larger alphabet (multilingual text),
+#              both strings are tallied by collections.Counter, whose counting loop also runs in C.
+# Why this complexity: Every pass over the n characters happens in C instead of the interpreter; the
+#                      per-character .count() strategy only runs while d is small enough for d scans
+#                      to beat one hashing pass (FEW_DISTINCT, measured on 1e6-char strings).
+from collections import Counter
+
+FEW_DISTINCT = 48
+
+
+def _same_counts(a, b):
+    # a and b are equal-length str or bytes: same multiset of characters?
+    distinct = set(a)
+    if len(distinct) <= FEW_DISTINCT:
+        return all(a.count(x) == b.count(x) for x in distinct)
+    return Counter(a) == Counter(b)
+
+
+class UnicodeSolution:
+    def isAnagram(self, s: str, t: str) -> bool:
+        # Early exit: if lengths differ, can't be anagrams
+        if len(s) != len(t):
+            return False
+
+        if s.isascii() and t.isascii():
+            return _same_counts(s.encode("ascii"), t.encode("ascii"))
+        try:
+            s_bytes, t_bytes = s.encode("latin-1"), t.encode("latin-1")
+        except UnicodeEncodeError:
+            # Outside Latin-1 (CJK, emoji, ...): count the characters themselves
+            return _same_counts(s, t)
+        return _same_counts(s_bytes, t_bytes)
+
+
+# [BULK QUERIES - Precomputed Multiset-Hash Signatures]
+# Time complexity: O(N × k) once to build, then O(k) per query - N candidates of average length k
+#                  - Build: one signature per candidate, one O(1) table lookup per character: O(N × k)
+#                  - Query: signature of the query O(k) + dict lookup O(1) + verification against the
+#                    one stored representative of the matching class, O(k) with UnicodeSolution
+#                  - m queries: O(m × k), instead of m × N calls to isAnagram at O(k) each
+# Space complexity: O(N) - One 64-bit signature per anagram class plus one representative string and
+#                   the candidate indices of the class; no per-candidate count vectors are stored
+# Explanation: Give every character a fixed pseudo-random 64-bit value (splitmix64 of its code point)
+#              and define a string's signature as the sum of its characters' values plus a length term,
+#              mod 2^64. Addition is order-independent, so all anagrams share a signature, while
+#              different multisets collide with probability ~2^-64. Candidates are grouped by
+#              signature, and each query is a single dict lookup; a hit is verified against the class
+#              representative so a hash collision can never produce a wrong answer.
+# Why this complexity: The counting work for the candidates is paid once at build time; each query
+#                      then costs only its own length, regardless of how many candidates there are.
+from functools import lru_cache
+
+_U64 = (1 << 64) - 1
+_LENGTH_MIX = 0xD6E8FEB86659FD93  # Odd constant folding the length into the signature
+
+
+@lru_cache(maxsize=None)
+def _char_value(char):
+    # splitmix64 finalizer of the code point: a fixed, well-mixed 64-bit value per character
+    z = (ord(char) + 0x9E3779B97F4A7C15) & _U64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _U64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _U64
+    return z ^ (z >> 31)
+
+
+def anagram_signature(s):
+    # Order-independent 64-bit multiset hash: equal for all anagrams of s
+    return (sum(map(_char_value, s)) + len(s) * _LENGTH_MIX) & _U64
+
+
+class AnagramIndex:
+    def __init__(self, candidates):
+        # {signature: [(representative, [candidate indices]), ...]} - almost always one class per key
+        self._classes = {}
+        for i, word in enumerate(candidates):
+            classes = self._classes.setdefault(anagram_signature(word), [])
+            for representative, indices in classes:
+                if UnicodeSolution().isAnagram(representative, word):
+                    indices.append(i)
+                    break
+            else:
+                classes.append((word, [i]))
+
+    def matches(self, query):
+        # Indices of all candidates that are anagrams of query
+        for representative, indices in self._classes.get(anagram_signature(query), ()):
+            if UnicodeSolution().isAnagram(representative, query):  # Rules out hash collisions
+                return list(indices)
+        return []
+
+    def contains(self, query):
+        # Is query an anagram of any candidate?
+        return bool(self.matches(query))
+
+    def matches_many(self, queries):
+        return [self.matches(query) for query in queries]
+
+    def contains_many(self, queries):
+        return [self.contains(query) for query in queries]
+
+
 # Test Cases
 
 # Test Case 1: Basic anagram
@@ -127,6 +243,20 @@ t5 = "abcd"
 # Output: False
 # Explanation: Different lengths means they can't be anagrams (caught by early exit).
 
+# Test Case 6: Multilingual strings (UnicodeSolution)
+s6 = "Café 東京"
+t6 = "京東 éfaC"
+# Output: True
+# Explanation: Same characters including 'é' and two CJK characters. Solution would index its 26-slot
+#              array with ord('東') - ord('a') and raise IndexError; UnicodeSolution counts them directly.
+
+# Test Case 7: One index, many queries (AnagramIndex)
+candidates7 = ["listen", "google", "enlist", "inlets", "banana"]
+queries7 = ["silent", "elgoog", "apple"]
+# Output: contains_many -> [True, True, False], matches("silent") -> [0, 2, 3]
+# Explanation: Signatures of all five candidates are computed once. "silent" hits the class
+#              {listen, enlist, inlets}, "elgoog" hits {google}, and "apple" has no class at all.
+
 
 # Summary of Approaches
 # | Approach              | Time       | Space    | Pros                              | Cons                           |
@@ -136,6 +266,10 @@ t5 = "abcd"
 # |                       |            |          | character set                     | needed for comparison          |
 # | Fixed Array           | O(n)       | O(1)     | Optimal time and space, fastest   | Only works for limited charset |
 # |                       |            |          | in practice, single pass possible | (lowercase English here)       |
+# | Unicode-aware         | O(n)       | O(d)     | Any alphabet, all counting in C,  | Picks a strategy per input,    |
+# |                       |            |          | bytes fast path for Latin-1       | more code than a fixed array   |
+# | Signature Index       | O(N×k) once| O(N)     | O(k) per query however many       | Build cost only pays off for   |
+# | (bulk queries)        | + O(k)/qry |          | candidates, exact via verification| repeated queries               |
 #
 # Winner: Fixed Array (Optimal Solution) - Achieves O(n) time with guaranteed O(1) space by
 #         exploiting the constraint of lowercase English letters. Uses a clever increment/decrement
@@ -81,6 +81,326 @@ class Solution:
         return False
 
 
+# [Solution 4: Compact Hash Set - Open Addressing over array('q')]
+# Time complexity: O(n) - Same single pass as Solution:
+#                  - n iterations, each one hash + a short linear probe: O(1) expected at load ≤ 2/3
+#                  - Resizing doubles the table, so total rehash work is 1 + 2 + 4 + ... < 2n = O(n)
+#                    (and none at all when len(nums) is known up front and the table is pre-sized)
+#                  - Total: n × O(1) + O(n) = O(n)
+# Space complexity: O(n) - but with a much smaller constant: one flat table of raw int64 slots
+#                   (8 bytes each, 1.5-3 slots per element) ≈ 12-24 bytes per element. Python's set
+#                   peaks around 50 bytes per element (1e6 ints, tracemalloc), and values that are
+#                   not already held elsewhere also pay ~28 bytes each for the boxed int
+# Explanation: Int64HashSet stores values directly in an array('q') whose size is a power of two.
+#              A value's home slot comes from Fibonacci hashing (multiply by 2^64/φ, keep the top bits);
+#              on collision we walk to the next slot (linear probing) until we find the value or an
+#              empty slot. containsDuplicate adds each number and stops as soon as one was already there.
+# Why this complexity: Linear probing keeps a lookup within a few adjacent 8-byte slots of one
+#                      contiguous buffer, and the ≤ 2/3 load factor keeps the expected probe length
+#                      constant. The probe loop runs in the interpreter, so it trades some speed against
+#                      the C-level set for the memory saving. Values must fit in a signed 64-bit int.
+from array import array
+
+_EMPTY = -(1 << 63)                 # Marks a free slot; the value itself is tracked separately
+_GOLDEN = 0x9E3779B97F4A7C15        # 2^64 / golden ratio, for Fibonacci hashing
+_U64 = (1 << 64) - 1
+
+
+class Int64HashSet:
+    def __init__(self, capacity=8):
+        # Smallest power-of-two table that holds `capacity` values at load ≤ 2/3
+        self._allocate(max(3, (capacity * 3 // 2).bit_length()))
+        self._size = 0              # Values stored in the table
+        self._has_empty = False     # Whether the sentinel value -2^63 itself was added
+
+    def _allocate(self, bits):
+        self._mask = (1 << bits) - 1
+        self._shift = 64 - bits
+        self._table = array("q", [_EMPTY]) * (1 << bits)
+
+    def _slot(self, value):
+        # Home slot from the top `bits` bits of value × golden, then probe linearly
+        table, mask = self._table, self._mask
+        slot = ((value * _GOLDEN) & _U64) >> self._shift
+        while True:
+            current = table[slot]
+            if current == value or current == _EMPTY:
+                return slot
+            slot = (slot + 1) & mask
+
+    def add(self, value):
+        # Returns True if value was newly added, False if it was already present
+        if value == _EMPTY:
+            added, self._has_empty = not self._has_empty, True
+            return added
+        slot = self._slot(value)
+        if self._table[slot] == value:
+            return False
+        self._table[slot] = value
+        self._size += 1
+        if self._size * 3 > len(self._table) * 2:
+            self._resize()
+        return True
+
+    def _resize(self):
+        # Double the table and re-insert every stored value
+        old = self._table
+        self._allocate(len(old).bit_length())
+        table = self._table
+        for value in old:
+            if value != _EMPTY:
+                table[self._slot(value)] = value
+
+    def __contains__(self, value):
+        if value == _EMPTY:
+            return self._has_empty
+        return self._table[self._slot(value)] == value
+
+    def __len__(self):
+        return self._size + self._has_empty
+
+
+class CompactHashSetSolution:
+    def containsDuplicate(self, nums):
+        # Pre-size when the length is known so the table never has to grow
+        seen = Int64HashSet(len(nums) if hasattr(nums, "__len__") else 8)
+        for num in nums:
+            if not seen.add(num):  # Already present: duplicate found
+                return True
+        return False
+
+
+# [Solution 5: Bloom Filter Pre-pass + Exact Confirmation]
+# Time complexity: O(n × h) = O(n) - Two passes over the array, h = number of hash functions:
+#                  - Pass 1: n Bloom filter insertions, each setting h bits: O(n × h)
+#                  - Pass 2: n membership tests in the small candidate set: n × O(1) = O(n)
+#                  - h = log2(1/error_rate) ≈ 7 for 1%, a constant: O(n × h) = O(n)
+# Space complexity: O(n × log(1/p)) bits + O(c) - The filter needs n × 1.44 × log2(1/p) bits
+#                   (≈ 1.2 bytes per element at p = 1%), plus exact sets of the c candidates, where
+#                   c ≈ p × n false positives + the true duplicates
+# Explanation: Pass 1 inserts every number into a Bloom filter. The filter can answer "definitely not
+#              seen" or "maybe seen"; every "maybe seen" number becomes a candidate. Every real duplicate
+#              is a candidate (its second occurrence finds all its bits already set), so pass 2 re-scans
+#              the array and tracks only the candidates in an exact set: a candidate seen twice is a
+#              real duplicate. False positives merely cost a slot in the candidate set, so the answer
+#              stays exact.
+# Why this complexity: Instead of one set entry per distinct value (tens of bytes each), the memory
+#                      is ~1.2 bytes per element plus a candidate set that is small when the data is
+#                      mostly unique. The price is a second pass, so nums must be re-iterable.
+import math
+
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate=0.01):
+        # Optimal size for `capacity` items: m = -n ln p / (ln 2)², h = (m / n) ln 2
+        capacity = max(capacity, 1)
+        self._bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._hashes = max(1, round(self._bits / capacity * math.log(2)))
+        self._array = bytearray((self._bits + 7) // 8)
+
+    def _positions(self, item):
+        # Double hashing: h1 + i × h2 from the two halves of one mixed 64-bit hash
+        mixed = (hash(item) * _GOLDEN) & _U64
+        h1, h2 = mixed >> 32, (mixed & 0xFFFFFFFF) | 1
+        bits = self._bits
+        return [(h1 + i * h2) % bits for i in range(self._hashes)]
+
+    def add(self, item):
+        # Set the item's bits; returns True if they were all set already ("maybe seen before")
+        array = self._array
+        present = True
+        for position in self._positions(item):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not array[byte] & mask:
+                present = False
+                array[byte] |= mask
+        return present
+
+    def __contains__(self, item):
+        array = self._array
+        return all(array[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+
+class BloomFilterSolution:
+    def containsDuplicate(self, nums, error_rate=0.01):
+        # Pass 1: every number whose bits were all set already is a candidate duplicate
+        bloom = BloomFilter(len(nums), error_rate)
+        candidates = set()
+        for num in nums:
+            if bloom.add(num):
+                candidates.add(num)
+        if not candidates:
+            return False  # No "maybe seen" at all: every value is definitely unique
+        del bloom
+
+        # Pass 2: confirm exactly, tracking only the candidates
+        seen = set()
+        for num in nums:
+            if num in candidates:
+                if num in seen:
+                    return True
+                seen.add(num)
+        return False  # Every candidate was a false positive
+
+
+# [Solution 6: Non-mutating Sort - np.sort / sorted() copy]
+# Time complexity: O(n log n) - Same shape as SortingSolution:
+#                  - Copying and sorting: O(n) + O(n log n) (np.sort in C for numeric arrays,
+#                    otherwise Timsort on a new list)
+#                  - Adjacent comparison: O(n), vectorized as sorted[1:] == sorted[:-1] in NumPy, or
+#                    map(operator.eq, ...) over the sorted copy, which loops in C instead of bytecode
+#                  - Total: O(n log n)
+# Space complexity: O(n) - One sorted copy of the input (8 bytes per element for int64/float64 arrays)
+#                   plus one boolean array of n - 1 comparisons on the NumPy path
+# Explanation: SortingSolution calls nums.sort(), silently reordering the caller's list, so callers had
+#              to copy defensively (two copies at peak). This version never mutates nums: it sorts its
+#              own copy once and checks whether any two neighbours are equal.
+# Why this complexity: Sorting still dominates, but both the sort and the adjacent check run in
+#                      compiled code; the NumPy path is taken for 1-D integer (or float) ndarrays
+#                      and for lists of at least NUMPY_MIN_SIZE plain ints, everything else uses
+#                      the sorted() copy.
+import operator
+import os
+import sys
+from itertools import islice
+
+np = None  # NumPy is optional and costs ~100 ms to import, so _numpy() imports it on first use
+try:
+    from data_structures_algorithms._compat import all_ints as _all_ints, is_ndarray as _is_ndarray, load_numpy
+except ImportError:  # Run as a script from a source checkout: the package sits next to this directory
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from data_structures_algorithms._compat import all_ints as _all_ints, is_ndarray as _is_ndarray, load_numpy
+
+
+def _numpy():
+    # The numpy module, imported the first time a vectorized path runs; None if it is not installed
+    return load_numpy(globals())  # Also binds it as this module's `np`
+
+NUMPY_MIN_SIZE = 256  # Measured crossover vs sorted() on lists of distinct ints (~200)
+
+
+class NonMutatingSortingSolution:
+    def containsDuplicate(self, nums):
+        if (_is_ndarray(nums) or len(nums) >= NUMPY_MIN_SIZE) and _numpy() is not None:
+            try:
+                values = np.asarray(nums)
+            except ValueError:  # Ragged nested sequences
+                values = None
+            # Only a flat array of values that compare exactly like the originals: integers, or a
+            # float ndarray given as such. Tuples would become a 2D array, and an int/float mix
+            # would be rounded to float64 (2**53 + 1 == 2**53), so those use sorted()
+            if values is not None and values.ndim == 1 and (
+                    values.dtype.kind in "biu" or (_is_ndarray(nums) and values.dtype.kind == "f")):
+                ordered = np.sort(values)  # np.sort returns a sorted copy
+                return bool((ordered[1:] == ordered[:-1]).any())
+
+        ordered = sorted(nums)  # New list, nums is left untouched
+        return any(map(operator.eq, ordered, islice(ordered, 1, None)))
+
+
+# [Solution 7: Parallel Hash-Partitioned Shards - Process Pool + Shared Memory]
+# Time complexity: O(n) partitioning + O((n / p) log(n / p)) per core, with p worker processes:
+#                  - Hashing every value to a shard id: O(n), vectorized
+#                  - Grouping values by shard (stable radix argsort on small shard ids): O(n)
+#                  - Each shard of ~n / s values is sorted and neighbour-checked in a worker:
+#                    O((n / s) log(n / s)), and p shards run at the same time
+#                  - Total wall time ≈ O(n) (serial, in C) + O((n / p) log(n / p)) (parallel)
+# Space complexity: O(n) - One int64 copy of the input in shared memory (8 bytes per element, read by
+#                   all workers without pickling), plus one sorted shard per running worker
+# Explanation: A duplicate can only exist between equal values, and equal values have equal hashes, so
+#              if values are split into shards by hash, every duplicate lies inside a single shard and
+#              the shards can be checked independently. The parent lays the values out shard by shard in
+#              a SharedMemory block; each worker attaches to it, sorts its own slice and looks for equal
+#              neighbours. The first worker to find a duplicate raises a flag byte in the shared block:
+#              shards not yet started are cancelled, and shards that start later return immediately.
+# Why this complexity: The per-shard sort, which dominates, is split across cores; what stays serial is
+#                      the vectorized O(n) hashing and layout in the parent, which bounds the speedup.
+#                      Process start-up costs tens of milliseconds, so below PARALLEL_MIN_SIZE (and for
+#                      non-integer input, or without NumPy) this falls back to Solution.
+# Note: workers look this module up by name. That works with the default "fork" start method on Linux;
+#       with "spawn" the module must be importable in the child.
+
+PARALLEL_MIN_SIZE = 1 << 20
+SHARDS_PER_WORKER = 4       # More shards than workers: finer cancellation and load balancing
+_FLAG_BYTES = 8             # Byte 0 of the shared block is the "duplicate found" flag
+
+
+def _shard_has_duplicate(shm_name, start, stop):
+    # Worker: check values[start:stop] of the shared block for equal neighbours after sorting
+    from multiprocessing import shared_memory
+
+    np = _numpy()  # Not inherited by "spawn" workers
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        if shm.buf[0]:
+            return False  # Another shard already found a duplicate
+        values = np.ndarray((stop - start,), dtype=np.int64, buffer=shm.buf,
+                            offset=_FLAG_BYTES + start * 8)
+        ordered = np.sort(values)
+        del values  # Release the view before closing the shared block
+        found = bool((ordered[1:] == ordered[:-1]).any())
+        if found:
+            shm.buf[0] = 1
+        return found
+    finally:
+        shm.close()
+
+
+class ParallelSolution:
+    def containsDuplicate(self, nums, workers=None):
+        if len(nums) < PARALLEL_MIN_SIZE or _numpy() is None:
+            return Solution().containsDuplicate(nums)
+        # Same guard as NonMutatingSortingSolution, limited to integers: tuples would become a 2D
+        # array, ragged rows raise, and floats or big ints would not hash to int64 shards exactly
+        if not _is_ndarray(nums) and not _all_ints(nums):
+            return Solution().containsDuplicate(nums)
+        try:
+            values = np.asarray(nums)
+        except ValueError:  # Ragged nested sequences
+            return Solution().containsDuplicate(nums)
+        if values.ndim != 1 or values.dtype.kind not in "iu":
+            return Solution().containsDuplicate(nums)
+        # Equality-preserving int64 view (uint64 is reinterpreted, smaller ints are widened)
+        if values.dtype.itemsize == 8:
+            values = values.view(np.int64)
+        else:
+            values = values.astype(np.int64)
+
+        workers = workers or os.cpu_count() or 1
+        bits = max(1, (workers * SHARDS_PER_WORKER - 1).bit_length())
+        shards = 1 << bits
+        # Fibonacci hash → top `bits` bits: equal values always get the same shard
+        shard_ids = ((values.view(np.uint64) * np.uint64(_GOLDEN)) >> np.uint64(64 - bits)) \
+            .astype(np.uint16)
+        bounds = np.concatenate(([0], np.cumsum(np.bincount(shard_ids, minlength=shards))))
+
+        # Imported here: multiprocessing is only worth its import time when this path runs
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        from multiprocessing import shared_memory
+
+        n = len(values)
+        shm = shared_memory.SharedMemory(create=True, size=_FLAG_BYTES + n * 8)
+        try:
+            shm.buf[0] = 0
+            layout = np.ndarray((n,), dtype=np.int64, buffer=shm.buf, offset=_FLAG_BYTES)
+            # Stable sort of small integer keys is a radix sort in NumPy: O(n)
+            np.take(values, np.argsort(shard_ids, kind="stable"), out=layout)
+            del layout, shard_ids
+
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_shard_has_duplicate, shm.name, int(start), int(stop))
+                           for start, stop in zip(bounds[:-1], bounds[1:]) if stop - start > 1]
+                for future in as_completed(futures):
+                    if future.result():
+                        shm.buf[0] = 1  # Shards that start from now on return at once
+                        pool.shutdown(wait=True, cancel_futures=True)
+                        return True
+            return False
+        finally:
+            shm.close()
+            shm.unlink()
+
+
 # Test Cases
 # Test Case 1: Array with duplicates
 nums1 = [1, 2, 3, 3]
@@ -102,6 +422,50 @@ nums4 = [5, 5, 5, 5]
 # Output: True
 # Explanation: The number 5 appears multiple times (4 times total)
 
+# Test Case 5: Extreme 64-bit values for CompactHashSetSolution
+nums5 = [-(1 << 63), (1 << 63) - 1, 0, -(1 << 63)]
+# Output: True
+# Explanation: -2^63 appears twice. It is also the table's empty-slot marker, which is why the
+#              set tracks that one value with a separate flag instead of storing it in a slot
+
+# Test Case 6: Bloom filter false positives do not change the answer
+if __name__ == "__main__":  # Built only when run as a script, not on import
+    nums6 = list(range(1000))
+# Output: False
+# Explanation: With error_rate=0.5 the filter reports many "maybe seen" values, but pass 2 finds
+#              each candidate only once, so BloomFilterSolution still answers False exactly
+
+# Test Case 7: Input order is preserved
+nums7 = [3, 1, 2, 1]
+# Output: True, and nums7 is still [3, 1, 2, 1] afterwards
+# Explanation: NonMutatingSortingSolution sorts a copy; SortingSolution would leave [1, 1, 2, 3]
+
+# Test Case 8: Tuples are not flattened into a 2D array
+if __name__ == "__main__":  # Built only when run as a script, not on import
+    nums8 = [(i, 0) for i in range(300)]
+# Output: False
+# Explanation: np.asarray would build a 300 × 2 array whose rows all contain 0; only a 1-D
+#              integer array takes the NumPy path, so NonMutatingSortingSolution sorts the tuples
+
+# Test Case 9: Ints and floats are not rounded to float64
+if __name__ == "__main__":  # Built only when run as a script, not on import
+    nums9 = [2 ** 53 + 1, float(2 ** 53)] + list(range(300))
+# Output: False
+# Explanation: As one float64 array both first values would be 2^53; the mixed list is sorted as
+#              Python numbers instead, which compare exactly
+
+# Test Case 10: Parallel shards on a large array
+# nums10 = list(range(2_000_000)) + [1_999_999]  (built on demand, not at import: 2M elements)
+# Output: True
+# Explanation: Both copies of 1_999_999 hash to the same shard, so exactly one worker sees them
+#              side by side after sorting, while every other shard reports no duplicate
+
+# Test Case 11: Tuples and ragged rows above PARALLEL_MIN_SIZE
+# nums11 = [(i, 0) for i in range(1 << 20)], and [(i,) if i % 2 else (i, 0) for i in range(1 << 20)]
+# Output: False for both (ParallelSolution)
+# Explanation: Only a 1-D integer array built from plain ints is sharded; np.asarray would raise
+#              "too deep" / "inhomogeneous" on these, so they go to the hash set Solution
+
 
 # Summary of Approaches
 # | Approach           | Time       | Space    | Pros                              | Cons                           |
@@ -109,6 +473,14 @@ nums4 = [5, 5, 5, 5]
 # | Brute Force        | O(n²)      | O(1)     | No extra space, simple logic      | Very slow for large arrays     |
 # | Sorting            | O(n log n) | O(1)*    | Better than brute force           | Modifies input, still not O(n) |
 # | Hash Set           | O(n)       | O(n)     | Optimal time, single pass         | Uses extra space               |
+# | Compact Hash Set   | O(n)       | O(n)     | ~8 bytes/slot instead of ~60+     | Interpreted probing is slower  |
+# |                    |            |          | per element, contiguous buffer    | than set; int64 values only    |
+# | Sorting (copy)     | O(n log n) | O(n)     | Never mutates input, C-level sort | Extra copy, still not O(n)     |
+# |                    |            |          | and compare (NumPy when numeric)  |                                |
+# | Bloom Filter       | O(n)       | O(n)bits | ~1.2 bytes/element at 1% error,   | Two passes (re-iterable input),|
+# | + Confirmation     |            | + O(c)   | exact answer, any hashable value  | no early exit in pass 1        |
+# | Parallel Shards    | O(n) +     | O(n)     | Uses every core, no pickling of   | Needs NumPy, process start-up, |
+# |                    | O(n/p lg n)|          | data, early cancel across shards  | serial partition step in parent|
 #
 # * Python's sort uses O(n) space internally, but we consider auxiliary space
 #
@@ -122,6 +122,447 @@ class Solution:
         return list(anagram_map.values())
 
 
+# [VECTORIZED] - NumPy Letter Histograms for All Strings at Once
+# Time complexity: O(N + n log n) - where N = total characters across all n strings
+#                  - Joining and encoding every string into one uint8 buffer: O(N)
+#                  - Letter histograms for all strings with one bincount over string_id × 26 + letter
+#                    (processed in chunks of strings to bound the temporaries): O(N)
+#                  - One 64-bit key per histogram row (dot product with 26 random weights): O(n × 26)
+#                  - Sorting the n keys: O(n log n), plus an O(n × 26) check of neighbouring rows
+#                  - Building the output lists: O(n)
+#                  - Total: O(N) + O(N) + O(n) + O(n log n) + O(n) = O(N + n log n)
+# Space complexity: O(N + n) - The encoded buffer (1 byte per character) plus a compact n × 26 matrix
+#                   of uint8 counts (26 bytes per string for words under 256 characters) and one uint64
+#                   key per string, instead of one 26-element tuple of Python ints per string
+# Explanation: Concatenate all strings into one byte buffer and turn each byte into its letter number
+#              0-25. Tagging every letter with the id of the string it came from, a single bincount over
+#              (id × 26 + letter) yields every string's 26-letter histogram at once. Each histogram row is
+#              hashed to a uint64 key; sorting the keys puts every group next to each other, and
+#              neighbouring rows with equal keys are compared in full, so a hash collision is detected
+#              (and falls back to the exact np.unique(axis=0) over the rows) instead of merging groups.
+#              Groups are then ordered by first appearance and filled in input order, matching Solution.
+# Why this complexity: The per-character Python loop of Solution becomes one pass in compiled code, and
+#                      the hashing of tuples becomes a sort of 64-bit integers. np.unique(axis=0) would
+#                      give the group ids directly, but it sorts rows as opaque 26-byte records, which
+#                      measured ~5x slower than Solution itself. Inputs below NUMPY_MIN_SIZE, or without
+#                      NumPy, use Solution; strings outside lowercase a-z use SortingSolution.
+import os
+import sys
+
+np = None  # NumPy is optional and costs ~100 ms to import, so _numpy() imports it on first use
+try:
+    from data_structures_algorithms._compat import load_numpy
+except ImportError:  # Run as a script from a source checkout: the package sits next to this directory
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from data_structures_algorithms._compat import load_numpy
+
+
+def _numpy():
+    # The numpy module, imported the first time a vectorized path runs; None if it is not installed
+    return load_numpy(globals())  # Also binds it as this module's `np`
+
+NUMPY_MIN_SIZE = 256      # Measured crossover vs Solution on 3-8 letter words (~200)
+HISTOGRAM_CHUNK = 1 << 16  # Strings per bincount, bounds the int64/uint64 temporaries
+_ROW_WEIGHTS = None        # 26 fixed random odd uint64 weights for hashing histogram rows
+
+
+class NumpySolution:
+    def groupAnagrams(self, strs):
+        n = len(strs)
+        global _ROW_WEIGHTS
+        # Alphabet first, at every size: Solution (and the histograms below) only know a-z.
+        # ASCII letters that are all lowercase means a-z only; these are C-level scans of the text
+        joined = "".join(strs)
+        if joined and not (joined.isascii() and joined.isalpha() and joined.islower()):
+            return SortingSolution().groupAnagrams(strs)
+        if n < NUMPY_MIN_SIZE or _numpy() is None:
+            return Solution().groupAnagrams(strs)
+
+        letters = np.frombuffer(joined.encode("ascii"), dtype=np.uint8) - np.uint8(ord("a"))
+
+        lengths = np.fromiter(map(len, strs), dtype=np.int64, count=n)
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        longest = int(lengths.max())
+        count_dtype = np.uint8 if longest < 1 << 8 else np.uint16 if longest < 1 << 16 else np.uint32
+        if _ROW_WEIGHTS is None:
+            _ROW_WEIGHTS = np.random.default_rng(0x5EED).integers(
+                0, 1 << 64, size=26, dtype=np.uint64, endpoint=False) | np.uint64(1)
+
+        # hist[i] = letter counts of strs[i]; keys[i] = 64-bit hash of that row (wraps mod 2^64)
+        hist = np.empty((n, 26), dtype=count_dtype)
+        keys = np.empty(n, dtype=np.uint64)
+        for start in range(0, n, HISTOGRAM_CHUNK):
+            stop = min(start + HISTOGRAM_CHUNK, n)
+            ids = np.repeat(np.arange(stop - start), lengths[start:stop])
+            codes = ids * 26 + letters[offsets[start]:offsets[stop]]
+            counts = np.bincount(codes, minlength=(stop - start) * 26).reshape(-1, 26)
+            hist[start:stop] = counts
+            keys[start:stop] = (counts.astype(np.uint64) * _ROW_WEIGHTS).sum(axis=1, dtype=np.uint64)
+
+        # Equal keys become neighbours; a stable sort keeps input order inside every run
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        starts_group = np.empty(n, dtype=bool)
+        starts_group[0] = True
+        np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=starts_group[1:])
+        sorted_hist = hist[order]
+        same_rows = (sorted_hist[1:] == sorted_hist[:-1]).all(axis=1)
+        if (~starts_group[1:] & ~same_rows).any():
+            # Two different histograms share a key: group by the exact rows instead
+            _, inverse = np.unique(hist, axis=0, return_inverse=True)
+            order = np.argsort(inverse.ravel(), kind="stable")
+            sorted_hist = hist[order]
+            starts_group[1:] = ~(sorted_hist[1:] == sorted_hist[:-1]).all(axis=1)
+
+        # Renumber groups by first appearance so the output order matches Solution
+        group_sizes = np.diff(np.append(np.flatnonzero(starts_group), n))
+        first_index = order[starts_group]
+        by_first = np.argsort(first_index)
+        order = order.tolist()
+        group_starts = np.flatnonzero(starts_group)[by_first].tolist()
+        result = []
+        for start, size in zip(group_starts, group_sizes[by_first].tolist()):
+            result.append([strs[i] for i in order[start:start + size]])
+        return result
+
+
+# [COMPACT KEYS] - Packed Integer Signatures and Index Arrays
+# Time complexity: O(n × k)
+#                  - Iterate through n strings: O(n)
+#                  - Packed key of a string of length k: one table lookup + big-int add per char, both
+#                    driven from C by sum(map(...)): O(k)
+#                  - Appending the string's index to its group's array: O(1) amortized
+#                  - Combined: O(n) × O(k) = O(n × k)
+# Space complexity: O(n + g) - for g groups
+#                  - One packed int key per group: 26 × w bits with w = bits needed for the string length
+#                    (~44 bytes for words under 32 letters), instead of a 26-tuple (~264 bytes) of ints
+#                  - Group members as array('I') of 4-byte input indices instead of lists of 8-byte
+#                    string references; the strings themselves are not copied or referenced
+# Explanation: A letter count never exceeds the string's length k, so every count fits in
+#              w = k.bit_length() bits. Give letter i the bit field [w × i, w × (i + 1)) and add 1 << (w × i)
+#              for every occurrence: no field can overflow into the next, so the sum encodes the exact
+#              count vector. The width is appended in the low 6 bits, so keys of different widths can
+#              never clash. groupAnagramIndices returns the groups as index arrays; groupAnagrams maps
+#              them back to strings for a drop-in result. Strings outside lowercase a-z get their sorted
+#              form as key instead (str keys never equal int keys).
+# Why this complexity: Same O(n × k) counting as Solution, but each group costs one small int plus
+#                      4 bytes per member, which is what dominates memory with millions of groups.
+from array import array
+
+_WIDTH_BITS = 6  # Low bits of a packed key that store the field width
+_FIELD_TABLES = {}  # width -> {letter: 1 << (width × letter index)}
+
+
+def packed_anagram_key(s):
+    # Exact, order-independent int key for a lowercase string (sorted string for anything else)
+    width = max(len(s).bit_length(), 1)
+    table = _FIELD_TABLES.get(width)
+    if table is None:
+        table = _FIELD_TABLES[width] = {
+            chr(ord("a") + i): 1 << (width * i + _WIDTH_BITS) for i in range(26)}
+    try:
+        return sum(map(table.__getitem__, s)) | width
+    except KeyError:
+        return "".join(sorted(s))
+
+
+class PackedKeySolution:
+    def groupAnagramIndices(self, strs):
+        # {packed key: array of input indices}; dicts keep groups in first-appearance order
+        groups = {}
+        for i, s in enumerate(strs):
+            key = packed_anagram_key(s)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = array("I")
+            group.append(i)
+        return list(groups.values())
+
+    def groupAnagrams(self, strs):
+        return [[strs[i] for i in group] for group in self.groupAnagramIndices(strs)]
+
+
+# [INCREMENTAL] - Streaming Grouper with Checkpoints
+# Time complexity: O(k) per update, O(n) per snapshot - where k is the length of the word
+#                  - add / remove / group_of: packed key of the word O(k) + two dict operations O(1)
+#                  - add_many(m words): m × O(k)
+#                  - snapshot(): one pass over the stored words: O(n)
+#                  - save / load: one pass over the distinct words: O(d × k)
+# Space complexity: O(d × k) - One entry per distinct word (with its multiplicity) and one packed key
+#                   per group; repeated words only bump a counter
+# Explanation: Keep the grouping itself as the state: {packed key: {word: count}}. A new word is
+#              counted into its group, a removed word is counted out (and an emptied group dropped), so
+#              nothing is ever regrouped. Groups and the words inside them keep first-insertion order,
+#              so snapshot() returns the same groups as Solution on the words currently held (repeated
+#              copies of a word are listed next to each other).
+#              save() writes the groups to a JSON checkpoint (atomically, via a temp file), and load()
+#              rebuilds the grouper from it without replaying the word stream.
+# Why this complexity: Each update touches only the one group its key points to; the cost of
+#                      regrouping everything is replaced by O(k) of work per event.
+
+
+class AnagramGrouper:
+    def __init__(self, words=()):
+        self._groups = {}  # {packed key: {word: count}}
+        self._size = 0
+        self.add_many(words)
+
+    def add(self, word):
+        group = self._groups.setdefault(packed_anagram_key(word), {})
+        group[word] = group.get(word, 0) + 1
+        self._size += 1
+
+    def add_many(self, words):
+        for word in words:
+            self.add(word)
+
+    def remove(self, word):
+        # Remove one occurrence of word; KeyError if it is not held
+        key = packed_anagram_key(word)
+        group = self._groups.get(key)
+        if group is None or word not in group:
+            raise KeyError(word)
+        if group[word] == 1:
+            del group[word]
+            if not group:
+                del self._groups[key]
+        else:
+            group[word] -= 1
+        self._size -= 1
+
+    def group_of(self, word):
+        # All held words that are anagrams of word (word itself need not be held)
+        group = self._groups.get(packed_anagram_key(word), {})
+        return [w for w, count in group.items() for _ in range(count)]
+
+    def snapshot(self):
+        return [[w for w, count in group.items() for _ in range(count)]
+                for group in self._groups.values()]
+
+    def __len__(self):
+        return self._size
+
+    def save(self, path):
+        # Write to a temp file and rename, so a crash never leaves a half-written checkpoint
+        state = {"version": 1, "groups": [list(group.items()) for group in self._groups.values()]}
+        import json  # Checkpoint-only dependency, imported here to keep module import cheap
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        import json
+
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("version") != 1:
+            raise ValueError(f"unsupported checkpoint version: {state.get('version')!r}")
+        grouper = cls()
+        for group in state["groups"]:
+            for word, count in group:
+                grouper._groups.setdefault(packed_anagram_key(word), {})[word] = count
+                grouper._size += count
+        return grouper
+
+
+# [OUT-OF-CORE] - Hash-Partitioned Spill Files
+# Time complexity: O(n × k) - Two passes over the data:
+#                  - Partition pass: packed key O(k) + mixed hash of the key O(1) per word, plus
+#                    buffered sequential writes of every word to one of P partition files: O(n × k)
+#                  - Group pass: each partition is read back and grouped like PackedKeySolution:
+#                    O(n_p × k) for its n_p words, summed over all P partitions: O(n × k)
+#                  - Total: O(n × k) + O(n × k) = O(n × k), plus sequential disk I/O of the corpus
+# Space complexity: O(n / P × k) in memory - one partition's words and keys at a time (one per worker
+#                   in the process pool), plus P write buffers of SPILL_BUFFER_WORDS words each;
+#                   the whole corpus lives on disk, O(n × k)
+# Explanation: All anagrams share one key, so hashing the key to one of P partitions sends every group
+#              wholly into a single partition file. Words are streamed in (from any iterable, or a file
+#              with one word per line), buffered per partition and appended to the files in bulk as
+#              length-prefixed UTF-8 records, so a word may contain any character. Each
+#              partition is then grouped on its own - optionally in a process pool - and its groups are
+#              yielded before the next partition is loaded. Groups come out partition by partition; inside
+#              a group, words keep input order.
+# Why this complexity: Same linear work as the in-memory solutions, but peak memory follows the size of
+#                      a partition (n / P) rather than the corpus, which is the point for data larger than
+#                      RAM. The key hash is mixed (see _key_partition), so partitions are even.
+# Note: pool workers look this module up by name, which works with the default "fork" start method.
+import struct
+import zlib
+
+SPILL_PARTITIONS = 64
+SPILL_BUFFER_WORDS = 1 << 14  # Words buffered per partition before one bulk write
+_RECORD_HEADER = struct.Struct("<I")  # Byte length of the UTF-8 word that follows
+_PARTITION_MIX = 0x9E3779B97F4A7C15  # 2^64 / golden ratio, for Fibonacci hashing
+_U64 = (1 << 64) - 1
+
+
+def _key_partition(key, partitions):
+    # Same partition in every process (str hashes are salted per process, so use crc32 for them).
+    # A packed key's low bits are its field width, so `key % partitions` would put most words in a
+    # handful of partitions: fold the key to 61 bits with hash() (not salted for ints), Fibonacci-mix
+    # it and scale the 64-bit result to [0, partitions), so the top bits pick the partition
+    if isinstance(key, int):
+        return ((hash(key) * _PARTITION_MIX) & _U64) * partitions >> 64
+    return zlib.crc32(key.encode("utf-8", "surrogatepass")) % partitions
+
+
+def _group_partition_file(path):
+    # Group the words of one partition file (runs in the parent or in a pool worker)
+    with open(path, "rb") as f:
+        data = f.read()
+    words, pos, end = [], 0, len(data)
+    while pos < end:
+        (size,) = _RECORD_HEADER.unpack_from(data, pos)
+        pos += _RECORD_HEADER.size
+        words.append(data[pos:pos + size].decode("utf-8", "surrogatepass"))
+        pos += size
+    return PackedKeySolution().groupAnagrams(words)
+
+
+class ExternalSolution:
+    def groupAnagramsStream(self, words, partitions=SPILL_PARTITIONS, workers=None, spill_dir=None):
+        # Generator of groups; memory is bounded by one partition (per worker)
+        import tempfile
+
+        with tempfile.TemporaryDirectory(dir=spill_dir) as directory:
+            paths = [os.path.join(directory, f"part{p}.bin") for p in range(partitions)]
+            buffers = [[] for _ in range(partitions)]
+
+            def flush(p):
+                chunk = bytearray()
+                for word in buffers[p]:
+                    data = word.encode("utf-8", "surrogatepass")
+                    chunk += _RECORD_HEADER.pack(len(data))
+                    chunk += data
+                with open(paths[p], "ab") as f:
+                    f.write(chunk)
+                buffers[p].clear()
+
+            # Pass 1: route every word to the partition of its anagram key
+            for word in words:
+                p = _key_partition(packed_anagram_key(word), partitions)
+                buffers[p].append(word)
+                if len(buffers[p]) >= SPILL_BUFFER_WORDS:
+                    flush(p)
+            for p in range(partitions):
+                if buffers[p]:
+                    flush(p)
+            del buffers
+            used = [path for path in paths if os.path.exists(path)]
+
+            # Pass 2: group each partition independently and stream its groups out
+            if not workers or workers <= 1:
+                for path in used:
+                    yield from _group_partition_file(path)
+                    os.remove(path)
+                return
+
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # At most `workers` partitions in flight, so results cannot pile up in memory
+                pending = [pool.submit(_group_partition_file, path) for path in used[:workers]]
+                next_path = workers
+                while pending:
+                    groups = pending.pop(0).result()
+                    if next_path < len(used):
+                        pending.append(pool.submit(_group_partition_file, used[next_path]))
+                        next_path += 1
+                    yield from groups
+
+    def groupAnagramsFile(self, path, **options):
+        # Group a file with one word per line without loading it into memory
+        with open(path, encoding="utf-8") as f:
+            yield from self.groupAnagramsStream((line.rstrip("\n") for line in f), **options)
+
+    def groupAnagrams(self, strs):
+        return list(self.groupAnagramsStream(strs))
+
+
+# [PARALLEL] - Map-Reduce over a Process Pool
+# Time complexity: O(n × k / p) per core + O(n × k) serial transfer - with p worker processes
+#                  - Map: each worker computes packed keys for its chunk and splits its partial groups
+#                    into R reduce partitions by key: O(n × k / p) wall time
+#                  - Reduce: reduce partition r merges the partial groups of every chunk for its keys
+#                    only, R partitions spread over p workers: O(n / p) wall time
+#                  - Parent: pickling the chunks out and the index groups back, ordering g groups by
+#                    first appearance O(g log g) and mapping indices to strings O(n)
+#                  - Total: O(n × k / p) parallel + O(n × k + g log g) serial
+# Space complexity: O(n × k) - The chunks, partial groups and merged groups each exist once in the
+#                   parent while they are passed between map and reduce steps
+# Explanation: Split the list into chunks; every worker builds its chunk's groups as
+#              {packed key: indices}, already split by key into R partitions. Reduce task r receives
+#              partition r of every chunk and merges them (chunks arrive in order, so indices stay
+#              sorted). Because every key lives in exactly one partition, the reduces are independent and
+#              none of them is a single global merge. Groups are then ordered by their first index and
+#              turned back into strings, so the output matches Solution.
+# Why this complexity: Key computation, the dominant O(n × k) part of Solution, is split over p cores,
+#                      but every word is pickled to a worker and every index pickled back, a serial
+#                      cost in the parent that bounds the speedup. Measure where it starts to pay off
+#                      (the fallback threshold is overridden so small sizes are timed too) with:
+#   python 1_arrays_and_hashing/benchmark.py --problem group_anagrams --solution Solution \
+#       --solution ParallelSolution --override PARALLEL_MIN_SIZE=0 --no-memory
+# Note: pool workers look this module up by name, which works with the default "fork" start method.
+PARALLEL_MIN_SIZE = 1 << 17
+CHUNKS_PER_WORKER = 4   # Map chunks per worker, for load balancing
+PARTITIONS_PER_WORKER = 2
+
+
+def _map_chunk(words, offset, partitions):
+    # Map: {packed key: indices} for one chunk, split into reduce partitions
+    partials = [{} for _ in range(partitions)]
+    for i, word in enumerate(words, offset):
+        key = packed_anagram_key(word)
+        partial = partials[_key_partition(key, partitions)]
+        group = partial.get(key)
+        if group is None:
+            group = partial[key] = array("I")
+        group.append(i)
+    return partials
+
+
+def _reduce_partition(partials):
+    # Reduce: merge one partition of every chunk, in chunk order
+    merged = {}
+    for partial in partials:
+        for key, indices in partial.items():
+            group = merged.get(key)
+            if group is None:
+                merged[key] = indices
+            else:
+                group.extend(indices)
+    return list(merged.values())
+
+
+class ParallelSolution:
+    def groupAnagrams(self, strs, workers=None):
+        workers = workers or os.cpu_count() or 1
+        n = len(strs)
+        if n < PARALLEL_MIN_SIZE:
+            # Same packed keys as the workers, so the grouping never depends on the input size
+            return PackedKeySolution().groupAnagrams(strs)
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        partitions = workers * PARTITIONS_PER_WORKER
+        chunk_size = -(-n // (workers * CHUNKS_PER_WORKER))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            maps = [pool.submit(_map_chunk, strs[start:start + chunk_size], start, partitions)
+                    for start in range(0, n, chunk_size)]
+            mapped = [future.result() for future in maps]  # Chunk order
+            reduces = [pool.submit(_reduce_partition, [partials[r] for partials in mapped])
+                       for r in range(partitions)]
+            del mapped
+            groups = [group for future in reduces for group in future.result()]
+
+        # First-appearance order across partitions, like Solution
+        groups.sort(key=lambda group: group[0])
+        return [[strs[i] for i in group] for group in groups]
+
+
 # Test Cases
 
 # Test Case 1: Multiple anagram groups
@@ -146,6 +587,66 @@ input4 = ["abc", "bca", "cab", "acb", "bac", "cba"]
 # Output: [["abc", "bca", "cab", "acb", "bac", "cba"]]
 # Explanation: All six strings are anagrams of each other with {a:1, b:1, c:1}
 
+# Test Case 5: Large input for NumpySolution (above NUMPY_MIN_SIZE, so the vectorized path runs)
+if __name__ == "__main__":  # Built only when run as a script, not on import
+    input5 = ["eat", "tea", "tan", "ate", "nat", "bat", ""] * 200
+# Output: [["eat", "tea", "ate", ...] (600 strings), ["tan", "nat", ...] (400), ["bat", ...] (200),
+#          ["", ...] (200)]
+# Explanation: 1400 strings but only 4 distinct histograms; groups come out in order of first
+#              appearance with strings in input order, exactly like Solution
+
+# Test Case 6: Groups as index arrays (PackedKeySolution.groupAnagramIndices)
+input6 = ["act", "pots", "tops", "cat", "stop", "hat"]
+# Output: [array('I', [0, 3]), array('I', [1, 2, 4]), array('I', [5])]
+# Explanation: Same groups as Test Case 1, stored as positions in input6. "act" and "cat" have length 3,
+#              so each letter gets a 2-bit field; both set the 'a', 'c' and 't' fields to 1 and share a key
+
+# Test Case 7: Words arriving over time (AnagramGrouper)
+stream7 = ["act", "pots", "cat", "tops"]
+# Output: after add_many(stream7), add("stop"), remove("pots"):
+#         snapshot() -> [["act", "cat"], ["tops", "stop"]], group_of("tac") -> ["act", "cat"]
+# Explanation: Every update touches only its own group; removing "pots" leaves the rest of its group
+#              in place, and the result equals Solution on ["act", "cat", "tops", "stop"]
+
+# Test Case 8: Corpus streamed through spill files (ExternalSolution)
+input8 = ["act", "pots", "tops", "cat", "stop", "hat"]
+# Output: the groups of Test Case 1 in partition order, e.g. [["act", "cat"], ["hat"], ["pots", "tops", "stop"]]
+# Explanation: Each group lands whole in one partition file because all its words share a key;
+#              groups are emitted partition by partition
+
+# Test Case 9: Any character survives the spill files (ExternalSolution)
+input9 = ["a\rb", "ba\r", "x"]
+# Output: [["a\rb", "ba\r"], ["x"]] (groups in partition order)
+# Explanation: Words are spilled as length-prefixed UTF-8 records rather than lines, so "\r" or
+#              "\n" inside a word is never mistaken for a line break on reload
+
+# Test Case 10: Map-reduce (ParallelSolution with PARALLEL_MIN_SIZE lowered to 0, workers=2)
+input10 = ["act", "pots", "tops", "cat", "stop", "hat"]
+# Output: [["act", "cat"], ["pots", "tops", "stop"], ["hat"]]
+# Explanation: Chunks are grouped in separate processes; "act" and "cat" may come from different
+#              chunks but share a key, so the same reduce partition merges them
+
+
+# Test Case 11: Reduce partitions stay balanced (_key_partition with R = 32)
+# input11 = 100_000 random lowercase words of 3-8 letters  (built on demand, not at import)
+# Output: every partition receives 100_000 / 32 ≈ 3125 words, give or take a few percent
+# Explanation: The key's low 6 bits only hold the field width (2-4 for these lengths), so reducing
+#              the raw key mod 32 used just 3 partitions, one with two thirds of the words; the
+#              mixed hash spreads the keys evenly
+
+# Test Case 12: Letters outside a-z on a small input (NumpySolution)
+input12 = ["Zt", "tZ", "tt"]
+# Output: [["Zt", "tZ"], ["tt"]]
+# Explanation: The alphabet is checked before the size, so even below NUMPY_MIN_SIZE the input goes
+#              to SortingSolution; Solution would count 'Z' as 't' (ord('Z') - ord('a') = -7 wraps
+#              to index 19) and merge all three, or raise IndexError for other characters
+
+# Test Case 13: Letters outside a-z on a small input (ParallelSolution)
+input13 = ["Zt", "tZ", "tt"]
+# Output: [["Zt", "tZ"], ["tt"]]
+# Explanation: Below PARALLEL_MIN_SIZE the work stays in the parent but uses PackedKeySolution, whose
+#              keys (sorted strings outside a-z) are the ones the map workers compute for large inputs
+
 
 # Summary of Approaches
 # | Approach              | Time          | Space     | Pros                           | Cons                        |
@@ -153,6 +654,16 @@ input4 = ["abc", "bca", "cab", "acb", "bac", "cba"]
 # | Brute Force           | O(n² × k logk)| O(n × k)  | Simple, no extra structures    | Very slow for large inputs  |
 # | Sorting               | O(n × k logk) | O(n × k)  | Intuitive, works for any chars | Sorting is slower than needed|
 # | Character Count       | O(n × k)      | O(n × k)  | Optimal time, avoids sorting   | Assumes lowercase letters   |
+# | Packed Int Keys       | O(n × k)      | O(n + g)  | ~6x smaller keys, 4-byte index | Callers must map indices    |
+# |                       |               |           | per member, exact              | back to strings             |
+# | Incremental Grouper   | O(k) / update | O(d × k)  | Add/remove over time, no       | Keeps every distinct word   |
+# |                       |               |           | regrouping, checkpoints        | in memory                   |
+# | Out-of-core Partitions| O(n × k)      | O(n/P × k)| Corpora larger than RAM,       | Disk I/O, group order is    |
+# |                       |               |  in memory| optional process pool          | partition order             |
+# | Map-Reduce (p cores)  | O(n × k / p)  | O(n × k)  | Key computation on all cores,  | Pickling every word and     |
+# |                       | + transfer    |           | independent partitioned merges | index is serial overhead    |
+# | NumPy Histograms      | O(N + n logn) | O(N + n)  | Counting runs in C, 26 bytes   | Needs NumPy, only pays off  |
+# |                       |               |           | per string key                 | for large inputs            |
 #
 # Winner: Character Count (Optimal) - Best time complexity O(n × k) by replacing sorting 
 # with linear character counting. Uses the key insight that anagrams have identical 
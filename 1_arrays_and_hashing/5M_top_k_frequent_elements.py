@@ -50,6 +50,7 @@ class BruteForceSolution:
 # Why this complexity: Using a heap of size k instead of sorting all n elements reduces 
 #                     the sorting factor from O(n log n) to O(n log k).
 import heapq
+import sys
 
 class HeapSolution:
     def topKFrequent(self, nums, k):
@@ -91,6 +92,10 @@ class HeapSolution:
 #            collecting elements until we have k elements - all in O(n) time!
 class Solution:
     def topKFrequent(self, nums, k):
+        # NumPy arrays go to the vectorized engine (see NumpySolution below)
+        if _is_ndarray(nums):
+            return NumpySolution().topKFrequent(nums, k)
+
         # Count frequencies
         freq_map = {}
         for num in nums:
@@ -114,6 +119,588 @@ class Solution:
         return result
 
 
+# [Streaming Approximate - Space-Saving]
+# Time complexity: O(log m) amortized per update, O(m log m) per topk() - m = number of counters
+#                  - update of a tracked element: dict increment, O(1)
+#                  - update of an untracked element when all m counters are taken: evict the smallest
+#                    counter through a lazy min-heap, O(log m) amortized (stale heap entries are
+#                    re-pushed with their current count once, when they reach the top)
+#                  - topk(): sort the m counters, O(m log m)
+#                  - n updates: O(n log m), independent of the number of distinct elements
+# Space complexity: O(m) - Exactly m = ceil(1 / epsilon) counters however many distinct values the
+#                   stream has, where the exact freq_map grows with every new distinct value
+# Explanation: Track at most m candidates with a counter each. A tracked element's counter is simply
+#              incremented. An untracked element takes over the counter of the current minimum: its
+#              count becomes min + 1, and it records min as its possible overestimation (error). Each
+#              estimate satisfies true ≤ count ≤ true + error, error ≤ N / m = epsilon × N after N
+#              updates, and every element occurring more than epsilon × N times is always tracked.
+# Why this complexity: Memory is fixed by the error bound instead of by the stream's cardinality; the
+#                      answer is exact whenever the k-th largest count exceeds the largest error.
+import math
+
+
+class SpaceSavingTopK:
+    def __init__(self, k, epsilon=1e-3, capacity=None):
+        self.k = k
+        # m counters bound the overestimation of every count by N / m
+        self.capacity = max(capacity or math.ceil(1 / epsilon), k)
+        self._counts = {}  # element -> estimated count
+        self._errors = {}  # element -> maximum overestimation of its count
+        self._heap = []    # (count, element) - may hold stale, smaller counts
+        self.total = 0     # N: number of updates seen
+
+    def update(self, x, count=1):
+        self.total += count
+        counts = self._counts
+        if x in counts:
+            counts[x] += count
+            return
+        if len(counts) < self.capacity:
+            counts[x] = count
+            self._errors[x] = 0
+            heapq.heappush(self._heap, (count, x))
+            return
+        # Evict the true minimum: skip entries whose element was incremented since they were pushed
+        heap = self._heap
+        while True:
+            stale_count, victim = heap[0]
+            current = counts[victim]
+            if current == stale_count:
+                break
+            heapq.heapreplace(heap, (current, victim))
+        heapq.heappop(heap)
+        del counts[victim], self._errors[victim]
+        counts[x] = current + count
+        self._errors[x] = current
+        heapq.heappush(heap, (current + count, x))
+
+    def update_many(self, xs):
+        update = self.update
+        for x in xs:
+            update(x)
+
+    def estimate(self, x):
+        # (estimated count, maximum overestimation); (0, 0) for an untracked element
+        return self._counts.get(x, 0), self._errors.get(x, 0)
+
+    def topk(self):
+        # k elements with the largest estimated counts, most frequent first (ties: smaller first)
+        ranked = heapq.nsmallest(self.k, self._counts.items(), key=lambda item: (-item[1], item[0]))
+        return [x for x, _ in ranked]
+
+    def is_exact(self):
+        # True if the top k is guaranteed correct: each of its lower bounds beats every outsider's
+        # upper bound (outsiders are either tracked with a smaller count or untracked, ≤ error max)
+        ranked = sorted(self._counts.items(), key=lambda item: -item[1])
+        if len(ranked) <= self.k:
+            # Every eviction leaves a nonzero error behind, so all-zero errors mean no evictions
+            return not any(self._errors.values())
+        kth_lower = min(count - self._errors[x] for x, count in ranked[:self.k])
+        outsider_upper = ranked[self.k][1]
+        return kth_lower > outsider_upper
+
+
+class StreamingSolution:
+    def topKFrequent(self, nums, k, epsilon=1e-3):
+        sketch = SpaceSavingTopK(k, epsilon)
+        sketch.update_many(nums)
+        return sketch.topk()
+
+
+# [Sliding Window - Frequency Bucket Linked List]
+# Time complexity: O(1) per event, O(k) per topk()
+#                  - add(x): counter +1 moves x from its frequency node to the next node up (created
+#                    right after it if missing): O(1)
+#                  - expiring the oldest event: counter -1 moves it one node down: O(1); each event
+#                    expires once, so expiry is O(1) amortized per add
+#                  - topk(): walk the non-empty frequency nodes from the highest down: O(k), because
+#                    every node holds at least one element
+# Space complexity: O(W) - The window's events (deque) plus one counter and at most one frequency node
+#                   per distinct value inside the window
+# Explanation: Like an LFU cache, keep a doubly linked list of frequency nodes in increasing order, each
+#              holding the set of values that currently occur exactly that many times in the window.
+#              A value only ever moves one frequency up (new event) or one down (expired event), i.e. to
+#              an adjacent node, so no search or sort is needed. The window is either the last `window`
+#              events (count-based) or the events of the last `duration` seconds (time-based).
+# Why this complexity: Solution has to recount the whole window for every answer; here every event
+#                      updates the ordering in O(1), and reading the top k never looks past k elements.
+#                      Within one frequency, values are listed in the order they reached it.
+import time
+from collections import deque
+
+
+class _FrequencyNode:
+    __slots__ = ("freq", "values", "lower", "higher")
+
+    def __init__(self, freq, lower, higher):
+        self.freq = freq
+        self.values = {}  # Insertion-ordered set of the values with this frequency
+        self.lower = lower
+        self.higher = higher
+
+
+class SlidingWindowTopK:
+    def __init__(self, k, window=None, duration=None, clock=time.monotonic):
+        if (window is None) == (duration is None):
+            raise ValueError("give exactly one of window (events) or duration (seconds)")
+        self.k = k
+        self.window = window
+        self.duration = duration
+        self._clock = clock
+        self._events = deque()  # Values (count window) or (timestamp, value) (time window)
+        self._node_of = {}      # value -> its _FrequencyNode
+        self._lowest = None     # Node with the lowest frequency, where new values enter
+        self._highest = None    # Node with the highest frequency, start of topk()
+
+    def _move(self, x, node, freq):
+        # Move x out of `node` (None if untracked) into the adjacent node for `freq` (0 = drop it)
+        if freq:
+            if node is None:
+                # New value: frequency 1 can only be the lowest node
+                target = self._lowest
+                if target is None or target.freq != 1:
+                    target = self._link(1, None, target)
+            elif freq > node.freq:
+                target = node.higher
+                if target is None or target.freq != freq:
+                    target = self._link(freq, node, node.higher)
+            else:
+                target = node.lower
+                if target is None or target.freq != freq:
+                    target = self._link(freq, node.lower, node)
+            target.values[x] = None
+            self._node_of[x] = target
+        else:
+            del self._node_of[x]
+        if node is not None:
+            del node.values[x]
+            if not node.values:
+                self._unlink(node)
+
+    def _link(self, freq, lower, higher):
+        node = _FrequencyNode(freq, lower, higher)
+        if lower is not None:
+            lower.higher = node
+        else:
+            self._lowest = node
+        if higher is not None:
+            higher.lower = node
+        else:
+            self._highest = node
+        return node
+
+    def _unlink(self, node):
+        if node.lower is not None:
+            node.lower.higher = node.higher
+        else:
+            self._lowest = node.higher
+        if node.higher is not None:
+            node.higher.lower = node.lower
+        else:
+            self._highest = node.lower
+
+    def _increment(self, x):
+        node = self._node_of.get(x)
+        self._move(x, node, node.freq + 1 if node is not None else 1)
+
+    def _decrement(self, x):
+        node = self._node_of[x]
+        self._move(x, node, node.freq - 1)
+
+    def advance(self, now=None):
+        # Expire events that have left the window
+        events = self._events
+        if self.window is not None:
+            while len(events) > self.window:
+                self._decrement(events.popleft())
+        else:
+            now = self._clock() if now is None else now
+            while events and events[0][0] <= now - self.duration:
+                self._decrement(events.popleft()[1])
+
+    def add(self, x, timestamp=None):
+        if self.window is not None:
+            self._events.append(x)
+        else:
+            timestamp = self._clock() if timestamp is None else timestamp
+            self._events.append((timestamp, x))
+        self._increment(x)
+        self.advance(timestamp)
+
+    def add_many(self, xs):
+        for x in xs:
+            self.add(x)
+
+    def count(self, x):
+        node = self._node_of.get(x)
+        return node.freq if node is not None else 0
+
+    def topk(self, now=None):
+        # k most frequent values in the window, highest frequency first. For a time window, pass
+        # `now` on the same clock as the timestamps given to add() (default: the window's clock)
+        if self.duration is not None:
+            self.advance(now)
+        result = []
+        node = self._highest
+        while node is not None and len(result) < self.k:
+            for x in node.values:
+                result.append(x)
+                if len(result) == self.k:
+                    break
+            node = node.lower
+        return result
+
+
+class SlidingWindowSolution:
+    def topKFrequent(self, nums, k, window=None):
+        # Top k of the last `window` elements of nums (all of nums by default)
+        tracker = SlidingWindowTopK(k, window=window or max(len(nums), 1))
+        tracker.add_many(nums)
+        return tracker.topk()
+
+
+# [Vectorized - np.unique / bincount + argpartition]
+# Time complexity: O(n log n) with np.unique, O(n + r) with bincount - r = value range (max - min + 1)
+#                  - Counting: np.unique(return_counts=True) sorts the values, O(n log n); for integers
+#                    whose range r is at most about 2n, np.bincount counts in one O(n + r) pass instead
+#                  - Selecting the top k of the d distinct counts: np.argpartition, O(d)
+#                  - Ordering the k winners: O(k log k)
+#                  - Total: O(n log n) or O(n + r), all in compiled code
+# Space complexity: O(d) for np.unique, O(r) for bincount - d = distinct values; no per-element Python
+#                   objects and no len(nums) + 1 bucket lists
+# Explanation: Count every distinct value with one vectorized call, then use argpartition to move the k
+#              largest counts to the front without sorting the rest. Ties are broken deterministically:
+#              results are ordered by count (highest first), then by value (smallest first), and when
+#              several values tie for the k-th place the smallest ones are kept. Solution calls this
+#              engine automatically for ndarray input; plain lists of at least NUMPY_MIN_SIZE numbers
+#              can use it through NumpySolution.
+# Why this complexity: The counting loop, the dict, and the bucket lists all disappear into array
+#                      operations; argpartition is linear, so selecting k costs no more than counting.
+import os
+
+np = None  # NumPy is optional and costs ~100 ms to import, so _numpy() imports it on first use
+try:
+    from data_structures_algorithms._compat import all_ints as _all_ints, is_ndarray as _is_ndarray, load_numpy
+except ImportError:  # Run as a script from a source checkout: the package sits next to this directory
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from data_structures_algorithms._compat import all_ints as _all_ints, is_ndarray as _is_ndarray, load_numpy
+
+
+def _numpy():
+    # The numpy module, imported the first time a vectorized path runs; None if it is not installed
+    return load_numpy(globals())  # Also binds it as this module's `np`
+
+NUMPY_MIN_SIZE = 256  # Measured crossover vs Solution on list input (~175)
+
+
+class NumpySolution:
+    def topKFrequent(self, nums, k):
+        if _is_ndarray(nums):
+            _numpy()  # Already imported by the caller; binds the module-level name
+            if nums.dtype.kind not in "biuf" or nums.size == 0:
+                return Solution().topKFrequent(nums.tolist(), k)
+            nums = nums.ravel()
+        elif len(nums) < NUMPY_MIN_SIZE or _numpy() is None or not _all_ints(nums):
+            # Tuples, strings, floats or an int/str mix would be reshaped or converted by
+            # np.asarray before counting; Solution counts the original objects
+            return Solution().topKFrequent(nums, k)
+        else:
+            values = np.asarray(nums)
+            if values.dtype.kind not in "iu":  # Ints beyond 64 bits become an object array
+                return Solution().topKFrequent(nums, k)
+            nums = values
+
+        # Count: bincount over a small integer range, np.unique otherwise (values come out sorted)
+        lo = hi = None
+        if nums.dtype.kind in "biu":
+            lo, hi = int(nums.min()), int(nums.max())
+        if lo is not None and hi - lo < 2 * nums.size + 1024:
+            # Shift into [0, hi - lo] in a wide dtype: int8 - (-128) would wrap in int8 itself
+            wide = np.uint64 if nums.dtype == np.uint64 else np.int64
+            counts = np.bincount((nums.astype(wide) - wide(lo)).astype(np.intp))
+            values = np.flatnonzero(counts)
+            counts = counts[values]
+            values = (values.astype(wide) + wide(lo)).astype(nums.dtype)  # Bools stay bools
+        else:
+            values, counts = np.unique(nums, return_counts=True)
+
+        k = min(k, len(values))
+        if k <= 0:
+            return []
+        if k < len(values):
+            # Count of the k-th most frequent value; everything above it is in, ties fill the rest
+            kth_count = counts[np.argpartition(-counts, k - 1)[k - 1]]
+            above = np.flatnonzero(counts > kth_count)
+            ties = np.flatnonzero(counts == kth_count)[:k - len(above)]  # Smallest values first
+            chosen = np.concatenate((above, ties))
+        else:
+            chosen = np.arange(len(values))
+
+        # Highest count first, then smallest value
+        order = np.lexsort((values[chosen], -counts[chosen]))
+        return values[chosen][order].tolist()
+
+
+# [Adaptive - Compact Buckets / Heap / Quickselect]
+# Time complexity: O(n) for counting, then O(d + f), O(d log k) or O(d) expected for selection
+#                  (d = distinct values, f = maximum frequency)
+#                  - Counting with collections.Counter (C loop): O(n)
+#                  - "bucket" when f ≤ d: counting sort of the d values by frequency into one flat list
+#                    with a prefix-sum offset per frequency: O(d + f) = O(d)
+#                  - "heap" when k is small next to d: heapq.nlargest keeps a size-k heap: O(d log k)
+#                  - "quickselect" otherwise: partition the distinct values around random pivot
+#                    frequencies until the k largest are split off: O(d) expected, + O(k log k) to order
+# Space complexity: O(d) - Counter of d values plus one flat list of d values (bucket), a k-element
+#                   heap, or the shrinking candidate lists of quickselect; never len(nums) + 1 lists
+# Explanation: Solution allocates len(nums) + 1 bucket lists even though only frequencies up to the
+#              maximum f can be occupied, and usually f is tiny. Here the selection strategy follows the
+#              data: with f ≤ d, the buckets become a counting sort (counts per frequency → offsets → one
+#              flat list of d values ordered by frequency); with k much smaller than d, a size-k heap;
+#              and with a large k and a high maximum frequency, quickselect.
+# Why this complexity: Peak memory is O(d) in every strategy, following the number of distinct values
+#                      rather than len(nums), and each strategy runs in the regime where its cost is
+#                      lowest. Results are ordered by frequency, highest first.
+from collections import Counter
+import random
+
+HEAP_MAX_K_RATIO = 1 / 16  # Use the heap while k ≤ d × ratio (log k stays small)
+
+
+def top_k_strategy(distinct, k, max_freq):
+    # Strategy AdaptiveSolution uses for d distinct values, k requested and maximum frequency f
+    if k >= distinct:
+        return "all"
+    if max_freq <= distinct:
+        return "bucket"
+    if k <= distinct * HEAP_MAX_K_RATIO:
+        return "heap"
+    return "quickselect"
+
+
+def _quickselect_top_k(items, k):
+    # The k (value, freq) items with the largest frequencies, in no particular order
+    chosen = []
+    while k > 0:
+        pivot = random.choice(items)[1]
+        higher = [item for item in items if item[1] > pivot]
+        if len(higher) >= k:
+            items = higher
+            continue
+        equal = [item for item in items if item[1] == pivot]
+        chosen += higher
+        k -= len(higher)
+        if len(equal) >= k:
+            chosen += equal[:k]
+            break
+        chosen += equal
+        k -= len(equal)
+        items = [item for item in items if item[1] < pivot]
+    return chosen
+
+
+class AdaptiveSolution:
+    def topKFrequent(self, nums, k):
+        freq_map = Counter(nums)
+        if not freq_map or k <= 0:
+            return []
+        distinct = len(freq_map)
+        max_freq = max(freq_map.values())
+        strategy = top_k_strategy(distinct, k, max_freq)
+
+        if strategy == "all":
+            return sorted(freq_map, key=freq_map.__getitem__, reverse=True)
+
+        if strategy == "bucket":
+            # Counting sort by frequency: offsets[f] = first slot of frequency f, highest f first
+            per_freq = [0] * (max_freq + 1)
+            for freq in freq_map.values():
+                per_freq[freq] += 1
+            offsets = per_freq  # Reused in place: per_freq[f] is read before offsets[f] is written
+            start = 0
+            for freq in range(max_freq, 0, -1):
+                offsets[freq], start = start, start + per_freq[freq]
+            flat = [None] * distinct
+            for num, freq in freq_map.items():
+                flat[offsets[freq]] = num
+                offsets[freq] += 1
+            return flat[:k]
+
+        if strategy == "heap":
+            return heapq.nlargest(k, freq_map, key=freq_map.__getitem__)
+
+        chosen = _quickselect_top_k(list(freq_map.items()), k)
+        chosen.sort(key=lambda item: item[1], reverse=True)
+        return [num for num, _ in chosen]
+
+
+# [Mergeable Summaries - Distributed Aggregation]
+# Time complexity: O(n) to build, O(d) to serialize, O(d1 + d2) to merge - d = entries in a summary
+#                  - Building on a worker: Counter (exact) or SpaceSavingTopK (sketch) over its n values
+#                  - to_bytes(): sort the d integer keys O(d log d), then one varint per field: O(d)
+#                  - merge(): one pass over the union of both key sets, O(d1 + d2); the sketch variant
+#                    then keeps the `capacity` largest counters: O((d1 + d2) log m)
+# Space complexity: O(d) - exact: one entry per distinct value; sketch: at most `capacity` entries.
+#                   On the wire, keys are sorted and delta-encoded, so most keys and counts take 1-3
+#                   bytes instead of a pickled dict entry
+# Explanation: Each worker builds a TopKSummary of its share of the data, serializes it with to_bytes()
+#              and ships it; the coordinator decodes the summaries with from_bytes() and folds them
+#              together with merge(). Exact summaries add counts key by key, so merging is associative
+#              and commutative and the result equals counting the concatenated input. Sketch summaries
+#              (Space-Saving) treat a key missing from a full summary as having that summary's minimum
+#              count, both as count and as error, and then keep the largest `capacity` counters; the
+#              merged overestimation stays within (N1 + N2) / capacity.
+# Why this complexity: A summary is a few bytes per distinct key instead of the raw values, and merges
+#                      cost only the size of the summaries, so the global top k never needs the data.
+# Wire format: b"TKS1", kind byte (0 exact, 1 sketch), varints k, capacity (0 = exact), total, entries,
+#              then per entry: key (zigzag varint of the first key, then varint deltas between sorted
+#              keys), count, and error (sketch only). Keys must be integers (NumPy integer scalars
+#              included; they are decoded as int).
+import operator
+
+_SUMMARY_MAGIC = b"TKS1"
+
+
+def _write_varint(out, value):
+    # Unsigned LEB128: 7 bits per byte, high bit set on all but the last byte
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+class TopKSummary:
+    def __init__(self, k, capacity=None):
+        # capacity=None: exact counts; otherwise a Space-Saving sketch with `capacity` counters
+        self.k = k
+        self.capacity = capacity
+        self._sketch = SpaceSavingTopK(k, capacity=capacity) if capacity else None
+        self._counts = Counter() if self._sketch is None else None
+
+    @property
+    def exact(self):
+        return self._sketch is None
+
+    @property
+    def total(self):
+        return sum(self._counts.values()) if self.exact else self._sketch.total
+
+    def _entries(self):
+        # {key: (count, error)}
+        if self.exact:
+            return {key: (count, 0) for key, count in self._counts.items()}
+        sketch = self._sketch
+        return {key: (count, sketch._errors[key]) for key, count in sketch._counts.items()}
+
+    def update(self, x, count=1):
+        if self.exact:
+            self._counts[x] += count
+        else:
+            self._sketch.update(x, count)
+
+    def update_many(self, xs):
+        if self.exact:
+            self._counts.update(xs)
+        else:
+            self._sketch.update_many(xs)
+
+    def topk(self):
+        # Most frequent first; ties broken by the smaller key, so every merge order gives one answer
+        if not self.exact:
+            return self._sketch.topk()
+        ranked = heapq.nsmallest(self.k, self._counts.items(), key=lambda item: (-item[1], item[0]))
+        return [key for key, _ in ranked]
+
+    def merge(self, other):
+        # New summary for the union of both inputs (neither operand is modified)
+        if self.exact != other.exact or self.k != other.k or self.capacity != other.capacity:
+            raise ValueError("can only merge summaries with the same k, kind and capacity")
+        merged = TopKSummary(self.k, self.capacity)
+        if self.exact:
+            merged._counts = self._counts + other._counts
+            return merged
+
+        # A key missing from a full sketch may still have occurred up to that sketch's minimum count
+        mine, theirs = self._entries(), other._entries()
+        floor_mine = min(c for c, _ in mine.values()) if len(mine) >= self._sketch.capacity else 0
+        floor_theirs = min(c for c, _ in theirs.values()) if len(theirs) >= other._sketch.capacity else 0
+        combined = {}
+        for key in mine.keys() | theirs.keys():
+            count_a, error_a = mine.get(key, (floor_mine, floor_mine))
+            count_b, error_b = theirs.get(key, (floor_theirs, floor_theirs))
+            combined[key] = (count_a + count_b, error_a + error_b)
+        kept = heapq.nlargest(merged._sketch.capacity, combined.items(), key=lambda item: item[1][0])
+        merged._set_sketch(dict(kept), self._sketch.total + other._sketch.total)
+        return merged
+
+    def _set_sketch(self, entries, total):
+        sketch = self._sketch
+        sketch._counts = {key: count for key, (count, _) in entries.items()}
+        sketch._errors = {key: error for key, (_, error) in entries.items()}
+        sketch._heap = [(count, key) for key, count in sketch._counts.items()]
+        heapq.heapify(sketch._heap)
+        sketch.total = total
+
+    def to_bytes(self):
+        entries = self._entries()
+        out = bytearray(_SUMMARY_MAGIC)
+        out.append(0 if self.exact else 1)
+        for value in (self.k, self.capacity or 0, self.total, len(entries)):
+            _write_varint(out, value)
+        previous = None
+        for original in sorted(entries):
+            try:
+                key = operator.index(original)  # np.int64 keys from update_many(ndarray) become int
+            except TypeError:
+                raise TypeError(f"summary keys must be integers, got {type(original).__name__}") from None
+            if previous is None:
+                _write_varint(out, (key << 1) if key >= 0 else ((-key << 1) - 1))  # zigzag
+            else:
+                _write_varint(out, key - previous)
+            previous = key
+            count, error = entries[original]
+            _write_varint(out, count)
+            if not self.exact:
+                _write_varint(out, error)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if data[:4] != _SUMMARY_MAGIC:
+            raise ValueError("not a TopKSummary")
+        kind, pos = data[4], 5
+        k, pos = _read_varint(data, pos)
+        capacity, pos = _read_varint(data, pos)
+        total, pos = _read_varint(data, pos)
+        size, pos = _read_varint(data, pos)
+        summary = cls(k, capacity if kind else None)
+        entries = {}
+        key = None
+        for _ in range(size):
+            raw, pos = _read_varint(data, pos)
+            key = ((raw >> 1) if not raw & 1 else -((raw + 1) >> 1)) if key is None else key + raw
+            count, pos = _read_varint(data, pos)
+            error = 0
+            if kind:
+                error, pos = _read_varint(data, pos)
+            entries[key] = (count, error)
+        if kind:
+            summary._set_sketch(entries, total)
+        else:
+            summary._counts = Counter({key: count for key, (count, _) in entries.items()})
+        return summary
+
+
 # Test Cases
 # Test Case 1
 nums1 = [1, 2, 2, 3, 3, 3]
@@ -141,6 +728,93 @@ k4 = 2
 # Explanation: Both -1 and 2 appear 2 times (tied for most frequent),
 #              while 1, 3, and 4 appear once. We return any 2 of the most frequent.
 
+# Test Case 5: Zipfian stream through a fixed-size sketch (SpaceSavingTopK)
+if __name__ == "__main__":  # Built only when run as a script, not on import
+    nums5 = [rank for rank in range(1, 201) for _ in range(2000 // rank)]
+    k5 = 3
+# Output: [1, 2, 3], the same as Solution().topKFrequent(nums5, 3), with only 20 counters
+#         (SpaceSavingTopK(3, capacity=20)) for 200 distinct values
+# Explanation: Value r occurs 2000 // r times (Zipf, exponent 1), N = 11662 updates. Any count may be
+#              overestimated by up to N / 20 ≈ 583, but the frequent values claim their counters early
+#              and keep them, so their errors stay small and is_exact() confirms the answer
+
+# Test Case 6: Top k of the last W events (SlidingWindowTopK(1, window=4))
+events6 = [5, 5, 5, 1, 2, 2, 2]
+# Output: topk() after each event -> [5], [5], [5], [5], [5], [2], [2]
+# Explanation: After the 6th event the window is [5, 1, 2, 2]: two copies of 5 have expired, so 2 (twice)
+#              beats 5 and 1 (once each). Each expiry moved 5 one frequency node down in O(1).
+
+# Test Case 7: Ties broken deterministically (NumpySolution, or Solution given an ndarray)
+nums7 = [4, 1, -1, 2, -1, 2, 3]
+k7 = 3
+# Output: [-1, 2, 1]
+# Explanation: -1 and 2 occur twice and come first, smaller value first. 1, 3 and 4 tie for the
+#              3rd place with one occurrence each, so the smallest, 1, is kept
+
+# Test Case 8: Huge input, tiny maximum frequency (AdaptiveSolution)
+# nums8 = list(range(50_000_000)) * 2  (built on demand, not at import), k8 = 3
+# Output: 3 of the values (every value occurs exactly twice)
+# Explanation: d = 5e7 but f = 2, so the "bucket" strategy needs a 3-slot offset table and one flat list
+#              of d values, where Solution would allocate 1e8 + 1 empty bucket lists first
+
+# Test Case 9: Partial summaries from several processes (TopKSummary)
+nums9 = [1, 2, 2, 3, 3, 3, 7, 7, 7, 7, 2, 1, 1, 1]
+k9 = 2
+# Output: [1, 7]; each of 3 worker processes summarizes one third of nums9, returns to_bytes(), and
+#         the parent folds TopKSummary.from_bytes(...) together with merge() in any order; run the
+#         file as a script to check every order against Solution (check_distributed_merge below)
+# Explanation: Exact merges add counts (1: 4, 7: 4, 3: 3, 2: 3), the same as
+#              Solution().topKFrequent(nums9, 2); 1 and 7 tie, so both are returned, 1 first
+
+
+def _summarize_share(share, k):
+    # Test Case 9 worker: summary of one share of the input, shipped back in the wire format
+    summary = TopKSummary(k)
+    summary.update_many(share)
+    return summary.to_bytes()
+
+
+def check_distributed_merge(nums, k, workers=3):
+    # Summarize `workers` shares of nums in separate processes, then merge the decoded summaries in
+    # every order; each merge must give Solution's answer on the whole input
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import reduce
+    from itertools import permutations
+
+    size = -(-len(nums) // workers)
+    shares = [nums[start:start + size] for start in range(0, len(nums), size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        blobs = list(pool.map(_summarize_share, shares, [k] * len(shares)))
+    expected = Solution().topKFrequent(nums, k)
+    for order in permutations(blobs):
+        merged = reduce(TopKSummary.merge, map(TopKSummary.from_bytes, order))
+        assert merged.topk() == expected, (merged.topk(), expected)
+    return expected
+
+
+if __name__ == "__main__":  # Worker processes re-import this file, so the pool only starts here
+    print("Test Case 9:", check_distributed_merge(nums9, k9))
+
+# Test Case 10: Small and boolean dtypes (NumpySolution, or Solution given an ndarray)
+# nums10 = np.array([-128, 127, 127, 5], dtype=np.int8), k10 = 1
+# Output: [127]; and [True] for np.array([True, True, False]) with k = 1
+# Explanation: Values are shifted by the minimum in int64, not in int8 where -128 + 128 would wrap
+#              negative, and the counted values are cast back to the input dtype, so bools come
+#              back as True / False rather than 1 / 0
+
+# Test Case 11: NumPy integer keys on the wire (TopKSummary)
+# nums11 = np.array([5, 5, -3, 9, 5, -3], dtype=np.int64), k11 = 2
+# Output: [5, -3]; summary.update_many(nums11) stores np.int64 keys, and
+#         TopKSummary.from_bytes(summary.to_bytes()).topk() returns the same keys as plain ints
+# Explanation: to_bytes() normalizes every key with operator.index, so any integer type serializes;
+#              floats and strings still raise TypeError
+
+# Test Case 12: Lists that NumPy would convert (NumpySolution)
+# [(1, 2)] * 200 + [(3, 4)] * 100 -> [(1, 2)]; [1] * 200 + ["1"] * 100 -> [1];
+# [2**53 + 1] * 200 + [float(2**53)] * 150 + list(range(10)) -> [9007199254740993] (k = 1 each)
+# Explanation: Only lists of plain ints are converted with np.asarray; tuples (ragged or not),
+#              strings, floats and ints beyond 64 bits are counted by Solution as the original objects
+
 
 # Summary of Approaches
 # | Approach           | Time       | Space    | Pros                              | Cons                           |
@@ -148,6 +822,16 @@ k4 = 2
 # | Brute Force        | O(n log n) | O(n)     | Simple to implement               | Slower due to sorting          |
 # | Min Heap           | O(n log k) | O(n)     | Better than sorting when k << n   | More complex than bucket sort  |
 # | Bucket Sort        | O(n)       | O(n)     | Optimal linear time, elegant      | Requires bounded frequency     |
+# | NumPy unique +     | O(n log n) | O(d)     | Compiled counting, linear select, | Needs NumPy, numeric values    |
+# | argpartition       | or O(n + r)|          | deterministic tie-breaking        | only                           |
+# | Adaptive (compact  | O(n) + O(d)| O(d)     | Memory follows distinct values,   | Three code paths, picks by     |
+# | bucket/heap/qsel.) | or O(dlogk)|          | not len(nums); strategy per input | thresholds                     |
+# | Mergeable Summary  | O(n) build | O(d)     | Serializable, associative merge,  | Sketch merge is approximate;   |
+# | (distributed)      | O(d) merge |          | compact varint wire format        | integer keys only on the wire  |
+# | Sliding Window     | O(1)/event | O(W)     | Top k of the last W events or     | Keeps the whole window's       |
+# | (freq linked list) | O(k)/topk  |          | seconds, exact, no recounting     | events in memory               |
+# | Space-Saving       | O(n log m) | O(m)     | Fixed memory on unbounded streams,| Approximate: counts can be off |
+# | (streaming)        |            |          | error ≤ N/m, exactness check      | by N/m, order of ties          |
 #
 # Winner: Bucket Sort (Solution) - Achieves optimal O(n) time complexity by exploiting the fact
 #         that frequencies are naturally bounded by array length. This eliminates the need for
@@ -0,0 +1,335 @@
+# PROBLEM: Encode and Decode Strings
+# Design an algorithm to encode a list of strings to a single string. The encoded string is then
+# decoded back to the original list of strings.
+# Please implement encode and decode.
+#
+# Example 1:
+# Input: ["neet","code","love","you"]
+# Output: ["neet","code","love","you"]
+#
+# Example 2:
+# Input: ["we","say",":","yes"]
+# Output: ["we","say",":","yes"]
+#
+# Constraints:
+# - 0 <= strs.length < 100
+# - 0 <= strs[i].length < 200
+# - strs[i] contains only UTF-8 characters
+
+
+# [BRUTE FORCE] - Delimiter with Escaping
+# Time complexity: O(n) - Where n is the total number of characters in all strings
+#                  - Encode: two str.replace passes per string plus one join: O(n)
+#                  - Decode: a Python loop visits every character once, checking for the
+#                    escape and delimiter characters: O(n) - but with a large constant, since
+#                    each character costs several bytecode instructions
+# Space complexity: O(n) - The encoded string (up to 2n when every character needs escaping)
+#                   and the decoded list
+# Explanation: Every string is written followed by the delimiter ':'. So that ':' inside a string
+#              cannot be mistaken for the delimiter, it is escaped as '/:', and '/' itself as '//'.
+#              Decoding walks the characters: '/' means "take the next character literally",
+#              ':' ends the current string, anything else is appended.
+# Why this complexity: Linear, but decoding has to inspect every single character because the
+#                      string contents themselves decide where a string ends.
+class BruteForceSolution:
+    def encode(self, strs):
+        return "".join(s.replace("/", "//").replace(":", "/:") + ":" for s in strs)
+
+    def decode(self, s):
+        result = []
+        current = []
+        i = 0
+        while i < len(s):
+            char = s[i]
+            if char == "/":
+                current.append(s[i + 1])  # Escaped character, taken literally
+                i += 2
+                continue
+            if char == ":":
+                result.append("".join(current))
+                current = []
+            else:
+                current.append(char)
+            i += 1
+        return result
+
+
+# [OPTIMAL] - Length Prefix ("len#str")
+# Time complexity: O(n) - Where n is the total number of characters and m the number of strings
+#                  - Encode: one f-string per string plus one join: O(n)
+#                  - Decode: per string, str.index finds the next '#' among the few length
+#                    digits and one slice copies the string: O(m) Python steps, O(n) copying in C
+# Space complexity: O(n) - The encoded string (n + about 2-4 characters per string) and the output
+# Explanation: Each string is written as its length, a '#', and the string itself. Decoding reads
+#              digits up to the '#', then takes exactly that many characters as the string - whatever
+#              they are - and continues right after them.
+# Why this complexity: The decoder jumps from header to header; it never looks inside a string.
+# THE TRICK: Length prefixing instead of delimiters!
+#            A delimiter forces every character to be checked (and escaped), because any character
+#            could be part of the data. A length prefix tells the decoder where the string ends, so
+#            the contents can contain '#', digits, or anything else, and are copied in one slice.
+#            The same idea frames messages in most binary protocols (HTTP/2, protobuf, ...).
+class Solution:
+    def encode(self, strs):
+        return "".join(f"{len(s)}#{s}" for s in strs)
+
+    def decode(self, s):
+        result = []
+        i = 0
+        while i < len(s):
+            j = s.index("#", i)
+            length = int(s[i:j])
+            result.append(s[j + 1:j + 1 + length])
+            i = j + 1 + length
+        return result
+
+
+# [BASELINE] - pickle
+# Time complexity: O(n) - pickle writes / reads each string with a length prefix in C
+# Space complexity: O(n) - The pickle bytes (~n + 1-5 bytes per string, plus a small header)
+# Explanation: pickle.dumps serializes the list, pickle.loads rebuilds it. This is what
+#              multiprocessing uses to ship arguments (e.g. the word chunks in 4M_group_anagrams.py).
+# Why this complexity: Also length-prefixed, all in C. But the output is Python-only and unsafe to
+#                      load from untrusted peers, and it cannot be decoded incrementally.
+import pickle
+
+
+class PickleSolution:
+    def encode(self, strs):
+        return pickle.dumps(strs, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, data):
+        return pickle.loads(data)
+
+
+# [BINARY WIRE CODEC] - Varint Length Prefix over bytes / memoryview
+# Time complexity: O(n) - Where n is the total number of UTF-8 bytes and m the number of strings
+#                  - Encode: UTF-8 encode every string and look up its header (C-level map), sum the
+#                    sizes, allocate the output once and fill it with batched joins: O(m) + O(n)
+#                  - Decode: per string, read the varint header (one byte below 128) and decode its
+#                    bytes: O(m) Python steps + O(n) decoding in C. All-ASCII buffers (every header
+#                    is then one byte and byte lengths equal character lengths) are decoded to one
+#                    str in a single C pass and cut into strings with str slices
+#                  - Streaming decode: the same per frame, over one reusable buffer filled by readinto()
+# Space complexity: O(n) - The output holds n bytes plus 1 header byte per string under 128 bytes
+#                   (2 bytes up to 16 KB). Decoding copies nothing but the result strings; streaming
+#                   needs one buffer of chunk_size (or of the largest single frame)
+# Explanation: Same framing as Solution, but binary: each string is its UTF-8 length as an unsigned
+#              LEB128 varint (7 bits per byte, high bit = "more bytes follow") followed by its UTF-8
+#              bytes. encode_into() adds up the exact size first, sizes the output once (a new
+#              bytearray for encode(), or a caller's buffer reused across messages) and copies the
+#              frames in with batched joins. decode_views() returns memoryview slices that
+#              share the input buffer (no copies at all); decode() turns long strings into str straight
+#              from such views, while strings under SMALL_STRING bytes are sliced and decoded, which
+#              measured ~1.5x faster than creating a view object per short string. iter_decode() reads
+#              a file or socket in chunks into one buffer, yields every complete string, and moves only
+#              the unfinished tail frame to the front before the next read.
+# Why this complexity: Counting lengths in bytes makes the format language-neutral (any UTF-8 decoder
+#                      can read it) and lets the decoder hand out buffer slices without copying. The
+#                      varint keeps the per-string overhead at 1 byte for the usual short strings,
+#                      and there is nothing to escape or scan.
+# Wire format: frame* ; frame = varint(len(utf8)) utf8. An empty list encodes to b"".
+from itertools import chain
+
+STREAM_CHUNK_SIZE = 1 << 16  # Bytes requested per read by iter_decode
+SMALL_STRING = 1024  # Strings shorter than this (bytes) are sliced + decoded instead of viewed
+ENCODE_BATCH = 4096  # Strings joined per step while filling the preallocated output
+
+_ONE_BYTE = [bytes((n,)) for n in range(0x80)]  # Header of every string shorter than 128 bytes
+
+
+def _varint(value):
+    # Unsigned LEB128 bytes of value
+    if value < 0x80:
+        return _ONE_BYTE[value]
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _read_header(buf, pos, end):
+    # (length, position after the header), or None if the header is cut off at `end`
+    result = shift = 0
+    while pos < end:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+    return None
+
+
+def _decode_frames(buf, view, pos, end, append, raw=False):
+    # Decode the complete frames in buf[pos:end] through append() (memoryview slices if `raw`).
+    # Returns (pos, needed): the start of the first unfinished frame and its total size, or 0 while
+    # even its header is incomplete. `buf` is bytes / bytearray or the memoryview itself.
+    sliceable = buf is not view
+    while pos < end:
+        length = buf[pos]
+        start = pos + 1
+        if length >= 0x80:
+            header = _read_header(buf, pos, end)
+            if header is None:
+                return pos, 0
+            length, start = header
+        stop = start + length
+        if stop > end:
+            return pos, stop - pos
+        if raw:
+            append(view[start:stop])
+        elif sliceable and length < SMALL_STRING:
+            append(buf[start:stop].decode("utf-8"))
+        else:
+            append(str(view[start:stop], "utf-8"))
+        pos = stop
+    return pos, 0
+
+
+class VarintSolution:
+    def encode(self, strs):
+        out = bytearray()
+        self.encode_into(strs, out)
+        return out
+
+    def encode_into(self, strs, out, offset=0):
+        # Write the frames into the bytearray `out` at `offset`, growing it once to the exact size
+        # if it is too small; returns the end offset
+        encoded = [s.encode("utf-8") for s in strs]
+        lengths = list(map(len, encoded))
+        if max(lengths, default=0) < 0x80:  # Table lookup, no Python call per string
+            headers = list(map(_ONE_BYTE.__getitem__, lengths))
+            size = sum(lengths) + len(headers)
+        else:
+            headers = list(map(_varint, lengths))
+            size = sum(lengths) + sum(map(len, headers))
+        if len(out) < offset + size:
+            out.extend(bytes(offset + size - len(out)))
+        # Frames are joined in batches: one join over everything would pin an 80-byte buffer
+        # descriptor per item (~3x the output size in temporaries)
+        pos = offset
+        for i in range(0, len(encoded), ENCODE_BATCH):
+            piece = b"".join(chain.from_iterable(zip(headers[i:i + ENCODE_BATCH], encoded[i:i + ENCODE_BATCH])))
+            out[pos:pos + len(piece)] = piece
+            pos += len(piece)
+        return pos
+
+    def decode_views(self, data):
+        # memoryview slices of `data`, one per string: zero-copy (valid while `data` is alive)
+        view = memoryview(data)
+        views = []
+        pos, _ = _decode_frames(view, view, 0, len(view), views.append, raw=True)
+        if pos < len(view):
+            raise ValueError("truncated frame")
+        return views
+
+    def decode(self, data):
+        result = []
+        if isinstance(data, (bytes, bytearray)) and data.isascii():
+            # Every header is one byte and every character one byte: decode once, cut with slices
+            text = data.decode("ascii")
+            end = len(text)
+            pos = 0
+            while pos < end:
+                stop = pos + 1 + ord(text[pos])
+                if stop > end:
+                    raise ValueError("truncated frame")
+                result.append(text[pos + 1:stop])
+                pos = stop
+            return result
+        view = memoryview(data)
+        buf = data if isinstance(data, (bytes, bytearray)) else view
+        pos, _ = _decode_frames(buf, view, 0, len(view), result.append)
+        if pos < len(view):
+            raise ValueError("truncated frame")
+        return result
+
+    def iter_decode(self, reader, chunk_size=STREAM_CHUNK_SIZE):
+        # Generator of strings from a binary reader: readinto() (files, socket.makefile("rb")),
+        # recv_into() (sockets) or read(). Raises ValueError if the stream ends inside a frame.
+        readinto = getattr(reader, "readinto", None) or getattr(reader, "recv_into", None)
+        buf = bytearray(max(chunk_size, 16))  # Room for at least one full varint header
+        view = memoryview(buf)
+        start = end = 0  # Unconsumed bytes are buf[start:end]
+        decoded = []
+        while True:
+            start, needed = _decode_frames(buf, view, start, end, decoded.append)
+            yield from decoded
+            decoded.clear()
+
+            # Move the unfinished frame to the front; grow the buffer if it cannot fit
+            tail = end - start
+            if needed > len(buf):
+                view.release()
+                buf = buf[start:end] + bytes(max(needed, 2 * len(buf)) - tail)
+                view = memoryview(buf)
+            elif start:
+                buf[:tail] = buf[start:end]
+            start, end = 0, tail
+
+            if readinto is not None:
+                count = readinto(view[end:])
+            else:
+                chunk = reader.read(len(buf) - end)
+                count = len(chunk)
+                buf[end:end + count] = chunk
+            if not count:
+                if end:
+                    raise ValueError("stream ended inside a frame")
+                return
+            end += count
+
+
+# Test Cases
+
+# Test Case 1: Basic
+strs1 = ["neet", "code", "love", "you"]
+# Output: ["neet", "code", "love", "you"]
+# Explanation: Solution encodes to "4#neet4#code4#love3#you" and decodes it back.
+
+# Test Case 2: Strings containing the delimiters
+strs2 = ["we", "say", ":", "yes", "4#ab", "/"]
+# Output: ["we", "say", ":", "yes", "4#ab", "/"]
+# Explanation: BruteForceSolution escapes ":" and "/"; Solution reads "4#ab" as data because its
+#              length prefix (4) says where the string ends, so the '#' inside is never parsed.
+
+# Test Case 3: Edge cases - empty list vs list with one empty string
+strs3a = []
+strs3b = [""]
+# Output: [] and [""]
+# Explanation: The empty list encodes to nothing; [""] encodes to "0#" (Solution) or b"\x00"
+#              (VarintSolution), so the two stay distinguishable.
+
+# Test Case 4: Non-ASCII and long strings (VarintSolution)
+strs4 = ["Café", "東京", "x" * 300]
+# Output: ["Café", "東京", "x" * 300]
+# Explanation: Lengths are UTF-8 byte counts: "Café" is 5 bytes (header b"\x05"), "東京" 6 bytes, and
+#              the 300-byte string needs a two-byte varint header b"\xac\x02" (300 = 0b10_0101100).
+
+# Test Case 5: Streaming decode from a file-like reader (VarintSolution.iter_decode)
+if __name__ == "__main__":  # Built only when run as a script, not on import
+    strs5 = ["alpha", "beta", "gamma"] * 1000
+# Output: list(iter_decode(io.BytesIO(encode(strs5)), chunk_size=16)) == strs5
+# Explanation: With a 16-byte buffer most reads end mid-frame; the unfinished frame is moved to the
+#              front of the buffer and completed by the next read.
+
+
+# Summary of Approaches
+# | Approach              | Time | Space | Pros                                  | Cons                              |
+# |-----------------------|------|-------|---------------------------------------|-----------------------------------|
+# | Delimiter + escaping  | O(n) | O(n)  | Human-readable, no lengths needed     | Python loop over every character, |
+# |                       |      |       |                                       | escaping can double the size      |
+# | Length prefix         | O(n) | O(n)  | Simple, any content, one slice per    | Text only; lengths in characters, |
+# | ("len#str")           |      |       | string                                | not portable byte counts          |
+# | pickle                | O(n) | O(n)  | All in C, fastest to write            | Python-only, unsafe for untrusted |
+# |                       |      |       |                                       | input, no incremental decoding    |
+# | Varint binary codec   | O(n) | O(n)  | Language-neutral bytes, 1-byte header,| Per-string Python loop, slower    |
+# |                       |      |       | zero-copy views, streaming decode     | than pickle's C loop              |
+#
+# Winner: Length prefix (Solution) for the interview question - it makes the encoding independent of
+#         the string contents with one idea. For shipping strings between processes or services,
+#         VarintSolution: the same trick in binary, compact, decodable from a buffer without copies
+#         or incrementally from a socket, and safe to read from untrusted peers.
@@ -0,0 +1,490 @@
+# [PROBLEM STATEMENT]
+# Product of Array Except Self
+#
+# Given an integer array nums, return an array answer such that answer[i] is equal to the product
+# of all the elements of nums except nums[i].
+# The product of any prefix or suffix of nums is guaranteed to fit in a 32-bit integer.
+# You must write an algorithm that runs in O(n) time and without using the division operation.
+#
+# Example 1:
+# Input: nums = [1, 2, 3, 4]
+# Output: [24, 12, 8, 6]
+#
+# Example 2:
+# Input: nums = [-1, 1, 0, -3, 3]
+# Output: [0, 0, 9, 0, 0]
+
+
+# [Brute Force - Multiply Everything Else]
+# Time complexity: O(n²) - For each of the n positions we multiply the other n - 1 elements:
+#                  n × (n - 1) multiplications = O(n²)
+# Space complexity: O(1) - Only the running product, besides the output array
+# Explanation: For every index i, walk the whole array and multiply every element whose index is
+#              not i.
+# Why this complexity: Every product is rebuilt from scratch, although neighbouring answers share
+#                      all but two of their factors.
+class BruteForceSolution:
+    def productExceptSelf(self, nums):
+        n = len(nums)
+        answer = []
+        for i in range(n):
+            product = 1
+            for j in range(n):
+                if j != i:
+                    product *= nums[j]
+            answer.append(product)
+        return answer
+
+
+# [Optimized - Prefix and Suffix Product Arrays]
+# Time complexity: O(n) - Three passes of n steps each:
+#                  - prefix[i] = product of nums[:i], left to right: O(n)
+#                  - suffix[i] = product of nums[i + 1:], right to left: O(n)
+#                  - answer[i] = prefix[i] × suffix[i]: O(n)
+#                  - Total: 3 × O(n) = O(n)
+# Space complexity: O(n) - Two helper arrays of n products besides the output
+# Explanation: Everything except nums[i] is "everything to its left" times "everything to its
+#              right". Both sides are running products, so each array is filled with one
+#              multiplication per element.
+# Why this complexity: Each factor is multiplied into a running product once per direction instead
+#                      of once per answer.
+class PrefixSuffixSolution:
+    def productExceptSelf(self, nums):
+        n = len(nums)
+        prefix = [1] * n
+        for i in range(1, n):
+            prefix[i] = prefix[i - 1] * nums[i - 1]
+        suffix = [1] * n
+        for i in range(n - 2, -1, -1):
+            suffix[i] = suffix[i + 1] * nums[i + 1]
+        return [left * right for left, right in zip(prefix, suffix)]
+
+
+# [Optimal - Prefix Pass into the Output, Suffix as a Running Product]
+# Time complexity: O(n) - Two passes of n steps each:
+#                  - Left to right: answer[i] = product of nums[:i], then extend the prefix: O(n)
+#                  - Right to left: answer[i] *= product of nums[i + 1:], then extend it: O(n)
+#                  - Total: 2 × O(n) = O(n)
+# Space complexity: O(1) - Apart from the output array (which the problem does not count), only two
+#                   running products
+# Explanation: The same prefix × suffix idea, but the prefix products are written straight into the
+#              answer, and the suffix products never need an array: walking right to left, one
+#              variable holds the product of everything already passed, which is exactly what
+#              answer[i] is still missing.
+# Why this complexity: Two linear passes, and nothing is divided, so zeros need no special case: a
+#                      zero simply zeroes every running product that includes it.
+# THE TRICK: answer[i] = (product of everything left of i) × (product of everything right of i).
+#            Both halves are running products, one per direction, so every answer costs O(1).
+class Solution:
+    def productExceptSelf(self, nums):
+        n = len(nums)
+        answer = [1] * n
+        prefix = 1
+        for i in range(n):
+            answer[i] = prefix  # Product of nums[:i]
+            prefix *= nums[i]
+        suffix = 1
+        for i in range(n - 1, -1, -1):
+            answer[i] *= suffix  # Times the product of nums[i + 1:]
+            suffix *= nums[i]
+        return answer
+
+
+# [Vectorized - NumPy cumprod Passes with Zero Handling]
+# Time complexity: O(n) - The same two passes as Solution, run by NumPy in C:
+#                  - Bounding |product| (one float64 reduction, which is 0 only if there is a
+#                    zero; zeros are counted only then): O(n)
+#                  - Prefix pass: multiply.accumulate of nums[:-1] into output[1:]: O(n)
+#                  - Suffix pass: the same accumulate over reversed blocks of SUFFIX_BLOCK elements,
+#                    each seeded with the product of everything to its right, multiplied into the
+#                    output: O(n)
+#                  - Total: O(n), a few ns per element instead of ~100 ns of interpreter overhead
+# Space complexity: O(n) - The int64 output (8 bytes per element) plus one SUFFIX_BLOCK buffer;
+#                   int64 ndarrays and buffers such as array('q') are read without a copy
+# Explanation: With at least two zeros every answer is 0, and with exactly one zero only the answer
+#              at the zero's index is non-zero (the product of everything else), so both cases are
+#              settled without any scan. Otherwise answer = prefix products × suffix products as in
+#              Solution. NumPy integers wrap around silently instead of growing like Python ints,
+#              so the scans only run in int64 when the float64 product of all |nums| is below
+#              2^62: every prefix, suffix and answer is at most that product (each |x| >= 1), so
+#              none of them can overflow. Larger products fall back to Solution's exact Python
+#              ints, unless an overflow-safe mode is asked for:
+#              - modulus=m returns every product mod m. cumprod cannot reduce between steps, so the
+#                scan runs over a (sqrt n) × (sqrt n) grid: one vectorized multiply-and-reduce per
+#                column scans every row block at once, then each block is multiplied by the
+#                (recursively scanned) product of the blocks before it.
+#              - log_product_except_self() returns sign and log|product| per index: log|answer[i]|
+#                is the sum of all log|x| minus log|nums[i]|, with zeros counted separately like
+#                above. Works for floats too, e.g. products of many probabilities that would
+#                underflow to 0.0.
+# Why this complexity: Still two linear passes, but in compiled code over contiguous int64 memory.
+#                      Small inputs (below NUMPY_MIN_SIZE, where NumPy's fixed per-call cost
+#                      dominates) and environments without NumPy use Solution. Float arrays take
+#                      the same passes in float64, in the same multiplication order as Solution.
+# Note: returns an ndarray for ndarray / buffer input and a list for list input; products beyond
+#       int64 are returned as a list of Python ints by the exact fallback.
+import math
+import os
+import sys
+
+np = None  # NumPy is optional and costs ~100 ms to import, so _numpy() imports it on first use
+try:
+    from data_structures_algorithms._compat import is_ndarray as _is_ndarray, load_numpy
+except ImportError:  # Run as a script from a source checkout: the package sits next to this directory
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from data_structures_algorithms._compat import is_ndarray as _is_ndarray, load_numpy
+
+
+def _numpy():
+    # The numpy module, imported the first time a vectorized path runs; None if it is not installed
+    return load_numpy(globals())  # Also binds it as this module's `np`
+
+NUMPY_MIN_SIZE = 512  # Measured crossover on lists (~120 on int64 arrays, which need no conversion)
+SUFFIX_BLOCK = 1 << 16              # Elements per block of the suffix pass (512 KB of int64)
+INT64_SAFE_PRODUCT = float(1 << 62)  # Below this every partial product fits in int64 (with margin
+                                     # for the float64 rounding of the bound itself)
+MAX_MODULUS = 3_037_000_500         # (MAX_MODULUS - 1)² < 2^63: two residues multiply in int64
+
+
+def _magnitude_bound(values):
+    # |product of values| in float64: inf (not a warning) when it overflows, nan for inf × 0
+    with np.errstate(over="ignore", invalid="ignore"):
+        return abs(float(np.prod(values, dtype=np.float64)))
+
+
+def _fill_products(values, out, left=1, right=1):
+    # out[i] = left × product(values[:i]) × product(values[i + 1:]) × right
+    n = len(values)
+    out[0] = left
+    np.multiply.accumulate(values[:-1], out=out[1:])  # Prefix products
+    if left != 1:
+        out[1:] *= left
+    buffer = np.empty(min(n, SUFFIX_BLOCK), dtype=out.dtype)
+    carry = out.dtype.type(right)        # Product of everything right of the current block
+    for stop in range(n, 0, -SUFFIX_BLOCK):
+        start = max(stop - SUFFIX_BLOCK, 0)
+        suffix = buffer[:stop - start]
+        suffix[-1] = carry
+        suffix[:-1] = values[start + 1:stop]
+        np.multiply.accumulate(suffix[::-1], out=suffix[::-1])  # Suffix products of the block
+        out[start:stop] *= suffix
+        carry = suffix[0] * values[start]
+    return out
+
+
+def _mod_cumprod(values, modulus):
+    # Inclusive prefix products mod `modulus`. The values are laid out as `rows` blocks of `width`
+    # and stored transposed, so grid[j] holds the j-th element of every block contiguously
+    n = len(values)
+    width = max(1, math.isqrt(n))
+    rows = -(-n // width)
+    full = n // width
+    grid = np.ones((width, rows), dtype=np.int64)
+    grid.T[:full] = values[:full * width].reshape(full, width)
+    if rows > full:  # Last, partial block; its padding of ones does not change any product
+        grid.T[full, :n - full * width] = values[full * width:]
+    for j in range(1, width):  # Scan every block at once, one column at a time
+        np.multiply(grid[j], grid[j - 1], out=grid[j])
+        np.remainder(grid[j], modulus, out=grid[j])
+    if rows > 1:  # Carry in the product of all earlier blocks
+        carry = np.ones(rows, dtype=np.int64)
+        carry[1:] = _mod_cumprod(grid[-1, :-1], modulus)
+        grid *= carry
+        grid %= modulus
+    out = np.empty(n, dtype=np.int64)
+    out[:full * width].reshape(full, width)[:] = grid.T[:full]
+    if rows > full:
+        out[full * width:] = grid.T[full, :n - full * width]
+    return out
+
+
+class NumpySolution:
+    def productExceptSelf(self, nums, modulus=None):
+        n = len(nums)
+        if modulus is not None and not 2 <= modulus <= MAX_MODULUS:
+            raise ValueError(f"modulus must be in [2, {MAX_MODULUS}], got {modulus}")
+        if (n < NUMPY_MIN_SIZE and not _is_ndarray(nums)) or n < 2 or _numpy() is None:
+            answer = Solution().productExceptSelf(nums)
+            return answer if modulus is None else [product % modulus for product in answer]
+
+        # Accepts lists, ndarrays and anything exposing a numeric buffer (e.g. array('q'))
+        values = np.asarray(nums)
+        as_list = isinstance(nums, list)
+        if values.dtype.kind == "f" and modulus is None:
+            with np.errstate(over="ignore", invalid="ignore"):  # inf / nan, as with Python floats
+                out = _fill_products(values, np.empty(n, dtype=np.float64))
+            return out.tolist() if as_list else out
+        if values.dtype.kind not in "biu":
+            answer = Solution().productExceptSelf(nums)
+            return answer if modulus is None else [product % modulus for product in answer]
+
+        if modulus is not None:
+            out = self._modular(values, modulus)
+            return out.tolist() if as_list else out
+
+        # |product of everything| bounds every prefix, suffix and answer (all non-zero |x| >= 1),
+        # and is 0 exactly when there is a zero (integers cannot underflow), or nan = inf × 0 when
+        # the product had already overflowed float64 before the zero
+        bound = _magnitude_bound(values)
+        if bound == 0 or math.isnan(bound):
+            # With two or more zeros every answer is 0, with one only its own answer is not
+            zero_count = n - np.count_nonzero(values)
+            out = np.zeros(n, dtype=np.int64)
+            if zero_count == 1:
+                zero = int(np.argmax(values == 0))
+                rest = np.concatenate((values[:zero], values[zero + 1:]))
+                if _magnitude_bound(rest) < INT64_SAFE_PRODUCT:
+                    out[zero] = np.prod(rest.astype(np.int64))
+                else:  # The one non-zero answer does not fit in int64
+                    answer = [0] * n
+                    answer[zero] = math.prod(rest.tolist())
+                    return answer
+            return out.tolist() if as_list else out
+        if bound >= INT64_SAFE_PRODUCT:
+            return Solution().productExceptSelf(values.tolist())  # Exact Python ints
+        if values.dtype != np.int64:
+            values = values.astype(np.int64)
+        out = _fill_products(values, np.empty(n, dtype=np.int64))
+        return out.tolist() if as_list else out
+
+    def _modular(self, values, modulus):
+        # Every answer mod `modulus`; a residue of 0 behaves exactly like a zero
+        residues = np.remainder(values, modulus, dtype=np.int64) if values.dtype != np.uint64 \
+            else (values % np.uint64(modulus)).astype(np.int64)
+        n = len(residues)
+        zero_count = n - np.count_nonzero(residues)
+        out = np.zeros(n, dtype=np.int64)
+        if zero_count >= 2:
+            return out
+        if zero_count == 1:
+            zero = int(np.argmax(residues == 0))
+            rest = np.concatenate((residues[:zero], residues[zero + 1:]))
+            out[zero] = _mod_cumprod(rest, modulus)[-1] if len(rest) else 1
+            return out
+        out[0] = 1
+        out[1:] = _mod_cumprod(residues[:-1], modulus)          # Product of residues[:i]
+        suffix = _mod_cumprod(residues[:0:-1], modulus)[::-1]   # Product of residues[i + 1:]
+        out[:-1] *= suffix
+        out %= modulus
+        return out
+
+    def log_product_except_self(self, nums):
+        # (signs, logs): signs[i] in {-1, 0, 1} and logs[i] = ln|answer[i]| (-inf where it is 0).
+        # The absolute error of logs is about 1e-16 × sum of all |ln|x||, from the subtraction
+        if _numpy() is None:
+            answer = Solution().productExceptSelf(nums)
+            return ([(product > 0) - (product < 0) for product in answer],
+                    [math.log(abs(product)) if product else -math.inf for product in answer])
+        values = np.asarray(nums, dtype=np.float64)
+        n = len(values)
+        magnitudes = np.abs(values)
+        is_zero = magnitudes == 0
+        zero_count = int(np.count_nonzero(is_zero))
+        logs = np.log(magnitudes, out=np.zeros(n), where=~is_zero)  # Zeros contribute ln 1 = 0
+        total = logs.sum()  # Pairwise summation
+        is_negative = values < 0
+        negative_count = int(np.count_nonzero(is_negative))
+        signs = np.zeros(n, dtype=np.int8)
+        if zero_count == 0:
+            np.subtract(total, logs, out=logs)
+            # Sign of everything else: odd number of other negatives -> -1
+            signs[:] = 1 - 2 * ((negative_count - is_negative) & 1)
+            return signs, logs
+        logs.fill(-np.inf)
+        if zero_count == 1:
+            zero = int(np.argmax(is_zero))
+            logs[zero] = total
+            signs[zero] = 1 - 2 * (negative_count & 1)
+        return signs, logs
+
+
+# [Parallel - Per-Chunk Products + Prefix Scan over Chunks, Process Pool + Shared Memory]
+# Time complexity: O(n / p + c) wall time with p worker processes and c chunks, O(n) work:
+#                  - Copying nums into shared memory: O(n), in the parent
+#                  - Pass 1, in parallel: every chunk reports its zero count, its product and a
+#                    float64 bound on |product|: O(n / c) per chunk
+#                  - In the parent: exclusive prefix and suffix scans over the c chunk products
+#                    give each chunk the product of everything left and right of it: O(c)
+#                  - Pass 2, in parallel: each chunk runs NumpySolution's two cumprod passes over
+#                    its own slice, seeded with those two products: O(n / c) per chunk
+#                  - Total wall time ≈ O(n) memcpy in the parent + O(n / p) per core
+# Space complexity: O(n) - One shared block holding the int64 input and output (16 bytes per
+#                   element), read and written by the workers without pickling, plus one
+#                   SUFFIX_BLOCK buffer per worker
+# Explanation: answer[i] = (product left of i) × (product right of i), and for an element inside
+#              chunk k "left of i" splits into "all chunks before k" × "left of i within k". So the
+#              chunks first compute their own products independently, a tiny scan over c numbers
+#              turns those into per-chunk left/right factors, and then every chunk can fill its
+#              part of the output independently as well. Zeros and the int64 bound are decided from
+#              pass 1 alone: with any zero, pass 2 is not needed at all.
+# Why this complexity: Both O(n) passes are split across cores; what stays serial is the copy into
+#                      shared memory and out of it, which bounds the speedup on memory bandwidth.
+#                      Process start-up costs tens of milliseconds, so below PARALLEL_MIN_SIZE (and
+#                      for non-integer input, or without NumPy) this falls back to NumpySolution,
+#                      as it does when the products do not fit in int64.
+# Note: workers look this module up by name. That works with the default "fork" start method on
+#       Linux; with "spawn" the module must be importable in the child.
+
+PARALLEL_MIN_SIZE = 1 << 22
+CHUNKS_PER_WORKER = 2   # More chunks than workers: a slow worker holds up less of the pass
+
+
+def _shared_arrays(shm, n):
+    # (input, output) int64 views of a shared block laid out as [input | output]
+    values = np.ndarray((n,), dtype=np.int64, buffer=shm.buf)
+    out = np.ndarray((n,), dtype=np.int64, buffer=shm.buf, offset=n * 8)
+    return values, out
+
+
+def _chunk_summary(shm_name, n, start, stop):
+    # Worker pass 1: (zero count, first zero index or -1, product of non-zeros, |product| bound)
+    from multiprocessing import shared_memory
+
+    np = _numpy()  # Not inherited by "spawn" workers
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        values = _shared_arrays(shm, n)[0][start:stop]
+        zero_count = len(values) - int(np.count_nonzero(values))
+        first_zero = -1
+        if zero_count:
+            first_zero = start + int(np.argmax(values == 0))
+            values = values[values != 0]
+        bound = _magnitude_bound(values)
+        product = int(np.prod(values, dtype=np.int64))  # Only exact when the bound is small
+        del values  # Release the view before closing the shared block
+        return zero_count, first_zero, product, bound
+    finally:
+        shm.close()
+
+
+def _chunk_products(shm_name, n, start, stop, left, right):
+    # Worker pass 2: out[start:stop] = answers of the chunk, given the products outside it
+    from multiprocessing import shared_memory
+
+    _numpy()
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        values, out = _shared_arrays(shm, n)
+        _fill_products(values[start:stop], out[start:stop], left, right)
+        del values, out
+    finally:
+        shm.close()
+
+
+class ParallelSolution:
+    def productExceptSelf(self, nums, workers=None):
+        if len(nums) < PARALLEL_MIN_SIZE or _numpy() is None:
+            return NumpySolution().productExceptSelf(nums)
+        values = np.asarray(nums)
+        # Integers that fit in int64 only (uint64 may not)
+        if values.dtype.kind not in "biu" or values.dtype == np.uint64:
+            return NumpySolution().productExceptSelf(nums)
+
+        # Imported here: multiprocessing is only worth its import time when this path runs
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+
+        n = len(values)
+        workers = workers or os.cpu_count() or 1
+        chunks = min(workers * CHUNKS_PER_WORKER, n)
+        bounds = [n * k // chunks for k in range(chunks + 1)]
+        spans = list(zip(bounds[:-1], bounds[1:]))
+        shm = shared_memory.SharedMemory(create=True, size=2 * n * 8)
+        try:
+            # Temporary views only: the block cannot be closed while a view of it is alive
+            np.copyto(_shared_arrays(shm, n)[0], values, casting="unsafe")
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_chunk_summary, shm.name, n, start, stop)
+                           for start, stop in spans]
+                summaries = [future.result() for future in futures]
+                zero_count = sum(summary[0] for summary in summaries)
+                if math.prod(summary[3] for summary in summaries) >= INT64_SAFE_PRODUCT \
+                        and zero_count < 2:
+                    return NumpySolution().productExceptSelf(nums)  # Needs exact Python ints
+                if zero_count:
+                    out = np.zeros(n, dtype=np.int64)
+                    if zero_count == 1:
+                        zero = next(summary[1] for summary in summaries if summary[0])
+                        out[zero] = math.prod(summary[2] for summary in summaries)
+                    return out.tolist() if isinstance(nums, list) else out
+
+                # Exclusive scans over the chunk products: everything left / right of each chunk
+                products = [summary[2] for summary in summaries]
+                lefts, rights = [1] * chunks, [1] * chunks
+                for k in range(1, chunks):
+                    lefts[k] = lefts[k - 1] * products[k - 1]
+                    rights[chunks - 1 - k] = rights[chunks - k] * products[chunks - k]
+                futures = [pool.submit(_chunk_products, shm.name, n, start, stop, left, right)
+                           for (start, stop), left, right in zip(spans, lefts, rights)]
+                for future in futures:
+                    future.result()
+            out = _shared_arrays(shm, n)[1].copy()
+            return out.tolist() if isinstance(nums, list) else out
+        finally:
+            shm.close()
+            shm.unlink()
+
+
+# Test Cases
+# Test Case 1: Basic example
+nums1 = [1, 2, 3, 4]
+# Output: [24, 12, 8, 6]
+# Explanation: answer[0] = 2 × 3 × 4 = 24, answer[1] = 1 × 3 × 4 = 12, answer[2] = 1 × 2 × 4 = 8,
+#              answer[3] = 1 × 2 × 3 = 6
+
+# Test Case 2: A single zero
+nums2 = [-1, 1, 0, -3, 3]
+# Output: [0, 0, 9, 0, 0]
+# Explanation: Every product except the zero's own includes the zero; the zero's answer is
+#              -1 × 1 × -3 × 3 = 9
+
+# Test Case 3: Two zeros
+nums3 = [0, 4, 0]
+# Output: [0, 0, 0]
+# Explanation: Every product leaves out at most one of the two zeros
+
+# Test Case 4: Two elements
+nums4 = [5, -2]
+# Output: [-2, 5]
+# Explanation: Each answer is simply the other element
+
+# Test Case 5: Products beyond int64 (NumpySolution)
+nums5 = [2] * 100
+# Output: [2 ** 99] * 100
+# Explanation: The bound 2^100 >= 2^62, so NumpySolution returns Solution's exact Python ints
+#              instead of wrapped-around int64; productExceptSelf(nums5, modulus=10**9 + 7)
+#              returns [pow(2, 99, 10**9 + 7)] * 100 as int64 instead
+
+# Test Case 6: Log space (NumpySolution.log_product_except_self)
+if __name__ == "__main__":  # Built only when run as a script, not on import
+    nums6 = [0.5] * 2000 + [-4.0]
+# Output: signs == [-1] * 2000 + [1], logs == [1999 × ln 0.5 + ln 4] * 2000 + [2000 × ln 0.5]
+# Explanation: 0.5^2000 underflows to 0.0 as a float, but its logarithm (-1386.3) does not
+
+# Test Case 7: Parallel chunks on a large array
+# nums7 = [1, -1] * 2_500_000 + [3]  (built on demand, not at import: 5M elements)
+# Output: [3, -3] * 2_500_000 + [1]
+# Explanation: There are 2_500_000 (an even number of) -1s, so leaving out a 1 gives 3 and
+#              leaving out a -1 gives -3. Each chunk reports its own product; the scans give
+#              every chunk the product of the chunks before and after it, and pass 2 fills each
+#              chunk's slice of the output independently
+
+
+# Summary of Approaches
+# | Approach             | Time      | Space | Pros                                | Cons                            |
+# |----------------------|-----------|-------|-------------------------------------|---------------------------------|
+# | Brute Force          | O(n²)     | O(1)  | Simplest, no helper arrays          | Quadratic, too slow beyond ~1e4 |
+# | Prefix/Suffix Arrays | O(n)      | O(n)  | Linear, easy to reason about        | Two helper arrays of n products |
+# | Prefix + Running     | O(n)      | O(1)* | Linear, no helper arrays, no        | Interpreter loop, ~100 ns per   |
+# | Suffix (Solution)    |           |       | division, exact Python ints         | element                         |
+# | NumPy cumprod        | O(n)      | O(n)  | C speed, zero cases without a scan, | int64 only when the products    |
+# |                      |           |       | modular and log-space modes         | fit, else exact (slow) fallback |
+# | Parallel Chunks      | O(n / p)  | O(n)  | Uses every core, no pickling of     | Needs NumPy, process start-up,  |
+# |                      | + O(c)    |       | data, zeros settled after pass 1    | serial copies in the parent     |
+#
+# * Excluding the output array, as the problem states
+#
+# Winner: Solution (prefix + running suffix) - O(n) time, O(1) extra space and no division, which
+#         is exactly what the problem asks for. For large numeric arrays, NumpySolution runs the same
+#         two passes in C; ParallelSolution only pays off with several cores and inputs of tens of
+#         millions of elements.
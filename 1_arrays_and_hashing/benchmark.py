@@ -0,0 +1,459 @@
+# [BENCHMARK HARNESS]
+# Every problem file in this folder ends with a "Summary of Approaches" table of Big-O claims.
+# This script measures them: it loads each problem module, discovers every *Solution class,
+# generates inputs at increasing sizes (1e2 .. 1e7 by default) and reports, per class:
+#   - wall time (best of `repeat` runs, fresh input for each run)
+#   - peak memory (tracemalloc, separate run so it does not skew the timings)
+#   - the fitted growth exponent: slope of log(time) vs log(n), e.g. ~1.0 for O(n), ~2.0 for O(n²)
+# and, per problem, the measured crossover points where one approach overtakes another.
+#
+# Slow approaches are not run at sizes they cannot finish: once a run exceeds the time budget,
+# or the fitted exponent predicts it would, larger sizes are skipped for that class.
+#
+# Usage:
+#   python 1_arrays_and_hashing/benchmark.py
+#   python 1_arrays_and_hashing/benchmark.py --problem top_k_frequent_elements --max-size 1000000
+#   python 1_arrays_and_hashing/benchmark.py --budget 5 --no-memory --json results.json
+#   python 1_arrays_and_hashing/benchmark.py --problem group_anagrams --override PARALLEL_MIN_SIZE=0
+#   python 1_arrays_and_hashing/benchmark.py --imports
+#   python 1_arrays_and_hashing/benchmark.py --problem product_of_array_except_self --max-size 100000000 --budget 30
+
+import argparse
+import ast
+import importlib.util
+import inspect
+import json
+import math
+import random
+import re
+import string
+import subprocess
+import sys
+import time
+import tracemalloc
+from array import array
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+
+# Problem files look like "1E_two_sum.py" / "4M_group_anagrams.py" (number, difficulty, name)
+PROBLEM_FILE = re.compile(r"^\d+[EMH]_(?P<name>\w+)\.py$")
+
+DEFAULT_SIZES = [10 ** e for e in range(2, 8)]  # 1e2 .. 1e7
+
+# Runs faster than this are dominated by timer noise and are left out of the exponent fit
+FIT_FLOOR_SECONDS = 1e-4
+
+
+# [MODULE DISCOVERY]
+# The problem modules start with a digit, so they cannot be imported with a normal import
+# statement. Load them by file path instead.
+def load_module(path):
+    path = Path(path)
+    match = PROBLEM_FILE.match(path.name)
+    name = match.group("name") if match else path.stem
+    spec = importlib.util.spec_from_file_location(f"dsa_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def discover_problems(directory=HERE):
+    """Return {problem_name: path} for every problem file in `directory`, in file order."""
+    problems = {}
+    for path in sorted(Path(directory).iterdir()):
+        match = PROBLEM_FILE.match(path.name)
+        if match:
+            problems[match.group("name")] = path
+    return problems
+
+
+def discover_solutions(module, method):
+    """Return {class_name: class} for the module's *Solution classes that implement `method`."""
+    solutions = {}
+    for name, cls in inspect.getmembers(module, inspect.isclass):
+        # Match case-insensitively so misspelled names (e.g. "BruteForceSsolution") are found too
+        if cls.__module__ != module.__name__ or not name.lower().endswith("solution"):
+            continue
+        if callable(getattr(cls, method, None)):
+            solutions[name] = cls
+    return solutions
+
+
+# [INPUT GENERATORS]
+# One generator per LeetCode method name. Each returns a fresh tuple of positional arguments
+# for a problem of size n. Inputs are worst cases for the early-exit approaches (the answer is
+# at the very end, or there is no duplicate at all), so the Big-O claims are actually exercised.
+# A fresh input is built for every run because some solutions mutate it (SortingSolution sorts
+# nums in place in 3E_contains_duplicate.py).
+def gen_two_sum(n, rng):
+    # Fillers are multiples of 4 and the answer is 1 + 2 = 3, so no other pair can reach 3:
+    # filler+filler ≡ 0, filler+1 ≡ 1, filler+2 ≡ 2 (mod 4). The pair sits at the last two indices.
+    nums = [4 * i for i in range(max(n - 2, 0))]
+    rng.shuffle(nums)
+    return nums + [1, 2], 3
+
+
+def gen_valid_anagram(n, rng):
+    # A true anagram: every character must be counted before the answer is known
+    s = "".join(rng.choices(string.ascii_lowercase, k=n))
+    t = list(s)
+    rng.shuffle(t)
+    return s, "".join(t)
+
+
+def gen_contains_duplicate(n, rng):
+    # All values distinct: no early exit
+    return (rng.sample(range(10 * n), n),)
+
+
+def gen_group_anagrams(n, rng):
+    # n words of length 3..8, drawn as permutations of ~n/4 base words (groups of ~4)
+    bases = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8)))
+             for _ in range(max(n // 4, 1))]
+    words = []
+    for _ in range(n):
+        chars = list(rng.choice(bases))
+        rng.shuffle(chars)
+        words.append("".join(chars))
+    return (words,)
+
+
+def gen_top_k_frequent(n, rng, k=10):
+    # Zipf-like skew over ~n/10 distinct values, the common shape of real event streams
+    distinct = max(n // 10, k)
+    weights = [1.0 / (rank + 1) for rank in range(distinct)]
+    return rng.choices(range(distinct), weights=weights, k=n), k
+
+
+def gen_encode_decode(n, rng):
+    # n short words that include the characters the text encodings have to escape or parse
+    alphabet = string.ascii_lowercase + ":/#0123456789"
+    return (["".join(rng.choices(alphabet, k=rng.randint(0, 12))) for _ in range(n)],)
+
+
+def gen_product_except_self(n, rng):
+    # No zeros (they would settle most answers without a scan), and at most 30 factors of ±2/±3
+    # among ±1s, so every product fits in int64 and Python ints stay small. Returned as array('q'):
+    # at 1e8 elements a list would take 800 MB of pointers before any work starts
+    block = array("q", rng.choices((1, -1), k=4096))
+    nums = block * (n // len(block))
+    nums.extend(block[:n % len(block)])
+    for _ in range(min(n, 30)):
+        nums[rng.randrange(n)] = rng.choice((2, -2, 3, -3))
+    return (nums,)
+
+
+GENERATORS = {
+    "twoSum": gen_two_sum,
+    "isAnagram": gen_valid_anagram,
+    "containsDuplicate": gen_contains_duplicate,
+    "groupAnagrams": gen_group_anagrams,
+    "topKFrequent": gen_top_k_frequent,
+    "encode": gen_encode_decode,
+    "productExceptSelf": gen_product_except_self,
+}
+
+# Codecs are timed as a full round trip, method -> inverse: decode(encode(*args))
+ROUND_TRIPS = {"encode": "decode"}
+
+
+def problem_method(module):
+    """Return the LeetCode method name that `module` solves (the first one we can generate)."""
+    for method in GENERATORS:
+        if any(callable(getattr(cls, method, None))
+               for cls in discover_solutions(module, method).values()):
+            return method
+    return None
+
+
+# [MEASUREMENT]
+def time_call(fn, make_args, repeat):
+    """Best wall time of `repeat` calls of fn(*make_args()); input generation is not timed."""
+    best = math.inf
+    for _ in range(repeat):
+        args = make_args()
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(fn, make_args):
+    """Peak bytes allocated while running fn(*make_args()), excluding the input itself."""
+    args = make_args()
+    tracemalloc.start()
+    try:
+        fn(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def fit_exponent(points):
+    """Least-squares slope of log(seconds) vs log(n) over [(n, seconds), ...]; None if < 2 points."""
+    usable = [(math.log(n), math.log(t)) for n, t in points if t >= FIT_FLOOR_SECONDS]
+    if len(usable) < 2:
+        return None
+    mean_x = sum(x for x, _ in usable) / len(usable)
+    mean_y = sum(y for _, y in usable) / len(usable)
+    var_x = sum((x - mean_x) ** 2 for x, _ in usable)
+    if var_x == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in usable) / var_x
+
+
+def predict_seconds(points, n):
+    """Extrapolate the time at size n from the measured points (assume linear if unknown)."""
+    last_n, last_t = points[-1]
+    exponent = fit_exponent(points) or 1.0
+    return last_t * (n / last_n) ** exponent
+
+
+def benchmark_class(cls, method, generator, sizes, repeat=3, budget=1.0, memory=True, seed=0):
+    """Measure one Solution class across `sizes`.
+
+    Returns {"times": {n: seconds}, "memory": {n: bytes}, "exponent": float | None,
+    "skipped": [n, ...]}. Sizes are skipped once a run exceeds `budget` seconds or is
+    predicted to.
+    """
+    fn = getattr(cls(), method)
+    if method in ROUND_TRIPS:
+        forward, inverse = fn, getattr(cls(), ROUND_TRIPS[method])
+        fn = lambda *args: inverse(forward(*args))
+    times, memory_peaks, skipped = {}, {}, []
+    for n in sizes:
+        points = sorted(times.items())
+        if points and (points[-1][1] > budget or predict_seconds(points, n) > budget):
+            skipped.append(n)
+            continue
+        rng = random.Random(seed)
+        make_args = lambda: generator(n, rng)
+        times[n] = time_call(fn, make_args, repeat)
+        if memory:
+            memory_peaks[n] = peak_memory(fn, make_args)
+    return {
+        "times": times,
+        "memory": memory_peaks,
+        "exponent": fit_exponent(sorted(times.items())),
+        "skipped": skipped,
+    }
+
+
+def find_crossovers(results):
+    """Find sizes where the faster of two approaches changes.
+
+    `results` is {class_name: benchmark_class(...) result}. Returns a list of
+    (faster_after, slower_after, n_low, n_high, n_estimate): between n_low and n_high
+    `faster_after` overtakes `slower_after`; n_estimate interpolates in log-log space.
+    """
+    crossovers = []
+    names = list(results)
+    for i, a in enumerate(names):
+        for b in names[i + 1:]:
+            ta, tb = results[a]["times"], results[b]["times"]
+            common = sorted(set(ta) & set(tb))
+            for lo, hi in zip(common, common[1:]):
+                before = ta[lo] - tb[lo]
+                after = ta[hi] - tb[hi]
+                if before == 0 or after == 0 or (before > 0) == (after > 0):
+                    continue
+                # log(ta/tb) changes sign between lo and hi: interpolate where it is zero
+                r_lo = math.log(ta[lo] / tb[lo])
+                r_hi = math.log(ta[hi] / tb[hi])
+                frac = r_lo / (r_lo - r_hi)
+                estimate = round(math.exp(math.log(lo) + frac * (math.log(hi) - math.log(lo))))
+                winner, loser = (a, b) if after < 0 else (b, a)
+                crossovers.append((winner, loser, lo, hi, estimate))
+    return crossovers
+
+
+def benchmark_problem(path, sizes=DEFAULT_SIZES, classes=None, overrides=None, **options):
+    """Benchmark every Solution class of one problem file.
+
+    Returns (method, {class_name: result}). `classes` optionally restricts which classes run;
+    `overrides` sets module constants first (e.g. {"NUMPY_MIN_SIZE": 0} to time a fast path below
+    its fallback threshold; names the module does not define are ignored); `options` are passed
+    through to benchmark_class.
+    """
+    module = load_module(path)
+    for name, value in (overrides or {}).items():
+        if hasattr(module, name):
+            setattr(module, name, value)
+    method = problem_method(module)
+    if method is None:
+        return None, {}
+    results = {}
+    for name, cls in discover_solutions(module, method).items():
+        if classes and name not in classes:
+            continue
+        results[name] = benchmark_class(cls, method, GENERATORS[method], sizes, **options)
+    return method, results
+
+
+# [IMPORT COST]
+# Short-lived workers pay for module import on every start, so measure it the way they see it:
+# a fresh interpreter per module, timing the import and reading peak RSS afterwards. The
+# "(interpreter)" row is the same probe with nothing imported, i.e. the floor.
+PACKAGE = "data_structures_algorithms.arrays_and_hashing"
+
+IMPORT_PROBE = """
+import resource, sys, time
+start = time.perf_counter()
+if sys.argv[1]:
+    __import__(sys.argv[1])
+elapsed = time.perf_counter() - start
+try:  # VmHWM is this process's own peak; ru_maxrss can carry over the parent's across exec
+    with open("/proc/self/status") as f:
+        rss = next(int(line.split()[1]) for line in f if line.startswith("VmHWM:")) * 1024
+except OSError:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+print(elapsed, rss, "numpy" in sys.modules, "multiprocessing" in sys.modules)
+"""
+
+
+def measure_import(module_name, repeat=5):
+    """Return {seconds, rss, numpy, multiprocessing} for importing `module_name` in a fresh
+    interpreter (best time of `repeat` runs); an empty name measures the bare interpreter."""
+    best = None
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", IMPORT_PROBE, module_name], cwd=HERE.parent,
+            capture_output=True, text=True, check=True,
+        ).stdout.split()
+        seconds, rss = float(out[0]), int(out[1])
+        if best is None or seconds < best["seconds"]:
+            best = {"seconds": seconds, "rss": rss,
+                    "numpy": out[2] == "True", "multiprocessing": out[3] == "True"}
+    return best
+
+
+def import_costs(problems, repeat=5):
+    costs = {"(interpreter)": measure_import("", repeat)}
+    for problem in problems:
+        costs[problem] = measure_import(f"{PACKAGE}.{problem}", repeat)
+    return costs
+
+
+# [REPORTING]
+def format_seconds(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f}ms"
+    return f"{seconds:.2f}s"
+
+
+def format_bytes(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+
+
+def format_size(n):
+    exponent = math.log10(n)
+    return f"1e{exponent:.0f}" if exponent.is_integer() else str(n)
+
+
+def report(problem, method, results, sizes):
+    lines = [f"# {problem} ({method})"]
+    header = ["Approach".ljust(22)] + [format_size(n).rjust(19) for n in sizes] + ["  Exponent"]
+    lines.append("# | " + " | ".join(header) + " |")
+    for name, result in results.items():
+        cells = [name.ljust(22)]
+        for n in sizes:
+            if n in result["times"]:
+                cell = format_seconds(result["times"][n])
+                if n in result["memory"]:
+                    cell += " / " + format_bytes(result["memory"][n])
+            else:
+                cell = "skipped"
+            cells.append(cell.rjust(19))
+        exponent = result["exponent"]
+        cells.append(f"n^{exponent:.2f}".rjust(10) if exponent is not None else "—".rjust(10))
+        lines.append("# | " + " | ".join(cells) + " |")
+    for winner, loser, lo, hi, estimate in find_crossovers(results):
+        lines.append(f"# Crossover: {winner} overtakes {loser} at n ≈ {estimate} "
+                     f"(between {format_size(lo)} and {format_size(hi)})")
+    return "\n".join(lines)
+
+
+def report_imports(costs):
+    lines = [f"# Import cost ({PACKAGE}.*)",
+             "# | " + " | ".join(["Module".ljust(26), "Import".rjust(9), "Peak RSS".rjust(9),
+                                  "NumPy", "multiprocessing"]) + " |"]
+    for name, cost in costs.items():
+        cells = [name.ljust(26), format_seconds(cost["seconds"]).rjust(9),
+                 format_bytes(cost["rss"]).rjust(9), ("yes" if cost["numpy"] else "no").ljust(5),
+                 ("yes" if cost["multiprocessing"] else "no").ljust(15)]
+        lines.append("# | " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the *Solution classes.")
+    parser.add_argument("--problem", action="append",
+                        help="problem name, e.g. two_sum (repeatable; default: all)")
+    parser.add_argument("--solution", action="append",
+                        help="only run this Solution class (repeatable; default: all)")
+    parser.add_argument("--min-size", type=int, default=DEFAULT_SIZES[0])
+    parser.add_argument("--max-size", type=int, default=DEFAULT_SIZES[-1])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per size, best is kept")
+    parser.add_argument("--budget", type=float, default=1.0,
+                        help="seconds per run before larger sizes are skipped")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc runs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--override", action="append", default=[], metavar="NAME=VALUE",
+                        help="set a module constant before timing, e.g. PARALLEL_MIN_SIZE=0")
+    parser.add_argument("--imports", action="store_true",
+                        help="measure import time and peak RSS of each problem module instead")
+    parser.add_argument("--json", help="also write raw results to this file")
+    args = parser.parse_args(argv)
+
+    overrides = {}
+    for item in args.override:
+        name, sep, value = item.partition("=")
+        if not sep:
+            parser.error(f"--override expects NAME=VALUE, got {item!r}")
+        overrides[name] = ast.literal_eval(value)
+
+    sizes = []
+    n = args.min_size
+    while n <= args.max_size:
+        sizes.append(n)
+        n *= 10
+
+    problems = discover_problems()
+    selected = args.problem or list(problems)
+    for problem in selected:
+        if problem not in problems:
+            parser.error(f"unknown problem {problem!r}; choose from {', '.join(problems)}")
+
+    if args.imports:
+        raw = import_costs(selected, repeat=args.repeat)
+        print(report_imports(raw))
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(raw, f, indent=2)
+        return
+
+    raw = {}
+    for problem in selected:
+        method, results = benchmark_problem(
+            problems[problem], sizes, classes=args.solution, overrides=overrides,
+            repeat=args.repeat, budget=args.budget, memory=not args.no_memory, seed=args.seed,
+        )
+        if not results:
+            continue
+        print(report(problem, method, results, sizes), end="\n\n", flush=True)
+        raw[problem] = {"method": method, "results": results}
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(raw, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
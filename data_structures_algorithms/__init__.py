@@ -0,0 +1,23 @@
+"""Importable entry point for the problem collection.
+
+Each topic is a subpackage (``arrays_and_hashing``, ...) imported on first attribute access,
+so ``import data_structures_algorithms`` itself costs next to nothing.
+"""
+
+import importlib
+
+TOPICS = ("arrays_and_hashing",)
+
+__all__ = list(TOPICS)
+
+
+def __getattr__(name):
+    if name in TOPICS:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module  # Cache it: later lookups skip __getattr__
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,39 @@
+"""Optional dependencies shared by the problem files.
+
+NumPy is optional and costs ~100 ms to import, so the problem files import it the first time a
+vectorized path runs, through load_numpy(), rather than at module import.
+"""
+
+import sys
+
+_numpy = None
+_numpy_checked = False
+
+
+def load_numpy(namespace=None):
+    # The numpy module, imported on the first call; None if it is not installed. With a module's
+    # globals() as `namespace`, also binds it there as `np`, so that module's engines (and process
+    # pool workers) can keep using np.* directly.
+    global _numpy, _numpy_checked
+    if not _numpy_checked:
+        _numpy_checked = True
+        try:
+            import numpy as _numpy
+        except ImportError:
+            _numpy = None
+    if namespace is not None:
+        namespace["np"] = _numpy
+    return _numpy
+
+
+def all_ints(nums):
+    # True if every element is a plain int: the exact check before handing a list to an int64
+    # NumPy path, where floats would be rounded or truncated, big ints overflow to object arrays,
+    # and tuples become 2D. map(type, ...) runs in C; bools are not plain ints here
+    return set(map(type, nums)) <= {int}
+
+
+def is_ndarray(x):
+    # An ndarray can only exist if NumPy was already imported, so this never imports it
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(x, numpy.ndarray)
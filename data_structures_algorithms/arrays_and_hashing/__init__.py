@@ -0,0 +1,34 @@
+"""Arrays & Hashing problems under stable, importable module names.
+
+The problem files keep their numbered names (``1E_two_sum.py``, ...), which are not valid
+identifiers. Each submodule here runs one of them, so its engines are reachable as e.g.
+``arrays_and_hashing.two_sum.Solution``. Submodules are imported on first attribute access,
+and NumPy / multiprocessing are only imported by the engines that use them.
+"""
+
+import importlib
+
+# Stable module name -> problem file
+PROBLEMS = {
+    "two_sum": "1E_two_sum.py",
+    "valid_anagram": "2E_valid_anagram.py",
+    "contains_duplicate": "3E_contains_duplicate.py",
+    "group_anagrams": "4M_group_anagrams.py",
+    "top_k_frequent_elements": "5M_top_k_frequent_elements.py",
+    "encode_decode_strings": "6M_encode_decode_strings.py",
+    "product_of_array_except_self": "7M_product_of_array_except_self.py",
+}
+
+__all__ = list(PROBLEMS)
+
+
+def __getattr__(name):
+    if name in PROBLEMS:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,33 @@
+"""Run a numbered problem file inside the namespace of a stable-named module."""
+
+import os
+from importlib.machinery import SourceFileLoader
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+# Installed wheel: files are bundled under problems/; source checkout: the repo's topic directory
+_SEARCH_DIRS = (
+    os.path.join(_HERE, "problems"),
+    os.path.join(os.path.dirname(os.path.dirname(_HERE)), "1_arrays_and_hashing"),
+)
+
+
+def problem_path(filename):
+    for directory in _SEARCH_DIRS:
+        path = os.path.join(directory, filename)
+        if os.path.isfile(path):
+            return path
+    raise ModuleNotFoundError(f"problem file {filename!r} not found in {list(_SEARCH_DIRS)}")
+
+
+def exec_problem(namespace, filename):
+    # Executed in the importing module's globals, so classes and functions get its stable
+    # __module__ (picklable for process pools). SourceFileLoader reuses the __pycache__ bytecode
+    # instead of recompiling the file on every worker start, and keeps the real path in tracebacks.
+    # os.path rather than pathlib: pathlib alone costs more to import than most problem files.
+    path = problem_path(filename)
+    code = SourceFileLoader(namespace["__name__"], path).get_code(namespace["__name__"])
+    exec(code, namespace)
+    if os.environ.get("DSA_INSTRUMENT"):  # Opt-in; see data_structures_algorithms.instrumentation
+        from ..instrumentation import instrument_from_env
+
+        instrument_from_env(namespace)
@@ -0,0 +1,5 @@
+"""Engines from 3E_contains_duplicate.py."""
+
+from ._loader import exec_problem
+
+exec_problem(globals(), "3E_contains_duplicate.py")
@@ -0,0 +1,5 @@
+"""Engines from 6M_encode_decode_strings.py."""
+
+from ._loader import exec_problem
+
+exec_problem(globals(), "6M_encode_decode_strings.py")
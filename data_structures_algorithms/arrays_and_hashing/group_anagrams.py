@@ -0,0 +1,5 @@
+"""Engines from 4M_group_anagrams.py."""
+
+from ._loader import exec_problem
+
+exec_problem(globals(), "4M_group_anagrams.py")
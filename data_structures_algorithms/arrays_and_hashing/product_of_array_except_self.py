@@ -0,0 +1,5 @@
+"""Engines from 7M_product_of_array_except_self.py."""
+
+from ._loader import exec_problem
+
+exec_problem(globals(), "7M_product_of_array_except_self.py")
@@ -0,0 +1,5 @@
+"""Engines from 5M_top_k_frequent_elements.py."""
+
+from ._loader import exec_problem
+
+exec_problem(globals(), "5M_top_k_frequent_elements.py")
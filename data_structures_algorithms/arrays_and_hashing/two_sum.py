@@ -0,0 +1,5 @@
+"""Engines from 1E_two_sum.py."""
+
+from ._loader import exec_problem
+
+exec_problem(globals(), "1E_two_sum.py")
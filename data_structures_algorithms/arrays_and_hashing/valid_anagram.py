@@ -0,0 +1,5 @@
+"""Engines from 2E_valid_anagram.py."""
+
+from ._loader import exec_problem
+
+exec_problem(globals(), "2E_valid_anagram.py")
@@ -0,0 +1,384 @@
+"""Adaptive engine dispatch: run each call on the engine measured fastest for inputs like it.
+
+Which engine wins depends on the input, not just on its size. The quadratic BruteForce
+classes skip all allocation and beat the hash maps on a handful of elements. Sorting pays
+off on already-sorted data. The 26-slot counters only work on lowercase ASCII. NumPy only
+pays off past a few hundred elements. So a Dispatcher works in three steps:
+  1. profile   - size, dtype, value range and sortedness (numbers) or alphabet (strings),
+                 read from an evenly spaced sample of at most SAMPLE_SIZE elements: O(1)
+  2. look up   - the engine that won a one-time on-machine calibration for that input shape
+                 ("variant") at the nearest calibrated size (log scale)
+  3. run       - with guards the sample cannot give: ndarray input goes to the NumPy engine,
+                 lowercase-only engines are used only after a full (C-speed) alphabet check,
+                 int-only engines (NumPy, sorting, int64 tables) only after a full type check,
+                 and an engine that rejects the input (TypeError, ...) is retried on Solution
+Every choice is emitted to a sink (see instrumentation) for later inspection.
+
+Calibration takes ~10-30 s and is stored per machine in a JSON cache file:
+    python -m data_structures_algorithms.dispatch --calibrate
+    python -m data_structures_algorithms.dispatch --show
+Without a cache, every call goes to the problem's Solution class (reason "uncalibrated").
+
+Usage:
+    from data_structures_algorithms.dispatch import dispatcher
+    two_sum = dispatcher("two_sum")
+    two_sum.twoSum([3, 4, 5, 6], 7)
+    two_sum.sink.records[-1]  # {"problem": "two_sum", "engine": "BruteForceSsolution", ...}
+"""
+
+import argparse
+import importlib
+import json
+import math
+import os
+import random
+import string
+import sys
+import time
+
+from ._compat import all_ints as _all_ints, is_ndarray as _is_ndarray
+from .instrumentation import MemorySink
+
+CACHE_VERSION = 1
+ENV_CACHE = "DSA_DISPATCH_CACHE"
+
+SAMPLE_SIZE = 64
+CALIBRATION_SIZES = (16, 128, 1024, 8192, 65536)
+CALIBRATION_BUDGET = 0.25  # Seconds; an engine predicted to exceed it skips the larger sizes
+CALIBRATION_REPEAT = 3
+CALIBRATION_MARGIN = 0.9  # Another engine must beat Solution by 10% to replace it (timer noise)
+
+
+# [INPUT PROFILES]
+def _sample(seq):
+    # At most SAMPLE_SIZE evenly spaced elements (a slice: O(SAMPLE_SIZE), no full copy)
+    step = max(len(seq) // SAMPLE_SIZE, 1)
+    return seq[::step][:SAMPLE_SIZE]
+
+
+def _alphabet(text):
+    # "lower" (a-z only), "ascii" or "unicode"
+    if not text.isascii():
+        return "unicode"
+    return "lower" if not text or (text.isalpha() and text.islower()) else "ascii"
+
+
+def profile_numbers(nums):
+    profile = {"size": len(nums)}
+    if _is_ndarray(nums):
+        profile["dtype"] = f"ndarray:{nums.dtype.kind}"
+        profile["variant"] = "ndarray"
+        return profile
+    sample = _sample(nums)
+    kinds = {type(x) for x in sample}
+    profile["dtype"] = kinds.pop().__name__ if len(kinds) == 1 else "mixed"
+    if profile["dtype"] not in ("int", "float") or not sample:
+        profile["variant"] = "random"
+        return profile
+    lo, hi = min(sample), max(sample)
+    profile["range"] = [lo, hi]
+    profile["sorted"] = all(a <= b for a, b in zip(sample, sample[1:]))
+    if profile["sorted"] and len(sample) > 1:
+        profile["variant"] = "sorted"
+    elif profile["dtype"] == "int" and hi - lo < len(nums) // 2:
+        profile["variant"] = "dense"  # Many repeats: duplicates / heavy hitters come early
+    else:
+        profile["variant"] = "random"
+    return profile
+
+
+def profile_strings(strings):
+    # One string (sampled characters) or a list of strings (sampled words)
+    sample = _sample(strings)
+    text = sample if isinstance(sample, str) else "".join(sample)
+    alphabet = _alphabet(text)
+    return {"size": len(strings), "dtype": "str", "alphabet": alphabet, "variant": alphabet}
+
+
+def _all_lowercase(*parts):
+    # Exact check behind the lowercase-only engines; the sample alone could miss one character
+    return all(_alphabet(p if isinstance(p, str) else "".join(p)) == "lower" for p in parts)
+
+
+# [CALIBRATION INPUTS]
+# One generator per problem: (variant, n, rng) -> args. Variants are the shapes profile_* reports.
+_LETTERS = {
+    "lower": string.ascii_lowercase,
+    "ascii": string.ascii_letters + string.digits + string.punctuation,
+    "unicode": string.ascii_lowercase + "éèàüößçñ日本語中文한국어",
+}
+
+
+def _ints(variant, n, rng):
+    if variant == "dense":
+        return [rng.randrange(max(n // 8, 2)) for _ in range(n)]
+    nums = rng.sample(range(n * 4), n)  # Distinct: the no-early-exit worst case
+    return sorted(nums) if variant == "sorted" else nums
+
+
+def gen_two_sum(variant, n, rng):
+    nums = rng.sample(range(n * 4), n)
+    if variant == "sorted":
+        nums.sort()
+    nums[-1] = 10 * n * 4 + 1  # Only the last two elements reach the target: full scan
+    nums[-2] = 10 * n * 4 + 2
+    return nums, nums[-1] + nums[-2]
+
+
+def gen_valid_anagram(variant, n, rng):
+    s = "".join(rng.choices(_LETTERS[variant], k=n))
+    t = list(s)
+    rng.shuffle(t)
+    return s, "".join(t)
+
+
+def gen_contains_duplicate(variant, n, rng):
+    return (_ints(variant, n, rng),)
+
+
+def gen_group_anagrams(variant, n, rng):
+    bases = ["".join(rng.choices(_LETTERS[variant], k=rng.randint(3, 8))) for _ in range(max(n // 4, 1))]
+    words = []
+    for _ in range(n):
+        letters = list(rng.choice(bases))
+        rng.shuffle(letters)
+        words.append("".join(letters))
+    return (words,)
+
+
+def gen_top_k_frequent(variant, n, rng):
+    nums = _ints(variant, n, rng)
+    return nums, min(10, len(set(nums)))
+
+
+# [PROBLEMS]
+class Problem:
+    # What the dispatcher needs to know about one problem module
+    def __init__(self, name, method, engines, profile, generator, variants, lowercase_only=(),
+                 int_only=()):
+        self.name = name
+        self.method = method
+        self.engines = engines  # Candidate class names: same signature and result, no input mutation
+        self.profile = profile  # args -> profile dict with "size" and "variant"
+        self.generator = generator
+        self.variants = variants  # Calibrated input shapes
+        self.lowercase_only = frozenset(lowercase_only)
+        self.int_only = frozenset(int_only)  # Right answers only on a list of plain ints
+
+    def module(self):
+        return importlib.import_module(f"data_structures_algorithms.arrays_and_hashing.{self.name}")
+
+    def eligible(self, variant):
+        if variant in ("ascii", "unicode"):
+            return [e for e in self.engines if e not in self.lowercase_only]
+        return list(self.engines)
+
+
+PROBLEMS = {
+    problem.name: problem for problem in (
+        Problem("two_sum", "twoSum",
+                ["BruteForceSsolution", "SortingSolution", "Solution", "NumpySolution"],
+                lambda nums, target: profile_numbers(nums), gen_two_sum, ("random", "sorted"),
+                int_only=["SortingSolution", "NumpySolution"]),
+        Problem("valid_anagram", "isAnagram",
+                ["BruteForceSolution", "OptimizedSolution", "Solution", "UnicodeSolution"],
+                lambda s, t: profile_strings(s), gen_valid_anagram, ("lower", "ascii", "unicode"),
+                lowercase_only=["Solution"]),
+        # SortingSolution sorts the caller's list in place, so it is not a candidate
+        Problem("contains_duplicate", "containsDuplicate",
+                ["BruteForceSolution", "NonMutatingSortingSolution", "Solution", "CompactHashSetSolution"],
+                profile_numbers, gen_contains_duplicate, ("random", "sorted", "dense"),
+                int_only=["NonMutatingSortingSolution", "CompactHashSetSolution"]),
+        Problem("group_anagrams", "groupAnagrams",
+                ["BruteForceSolution", "SortingSolution", "Solution", "NumpySolution", "PackedKeySolution"],
+                profile_strings, gen_group_anagrams, ("lower", "ascii", "unicode"),
+                lowercase_only=["Solution", "NumpySolution"]),  # NumpySolution: Solution below its threshold
+        Problem("top_k_frequent_elements", "topKFrequent",
+                ["BruteForceSolution", "HeapSolution", "Solution", "NumpySolution", "AdaptiveSolution"],
+                lambda nums, k: profile_numbers(nums), gen_top_k_frequent, ("random", "dense"),
+                int_only=["NumpySolution"]),
+    )
+}
+
+
+# [CALIBRATION]
+def _machine():
+    # Calibrations are only valid on the machine and interpreter that produced them
+    machine = os.uname().machine if hasattr(os, "uname") else sys.platform
+    return {"python": "%d.%d" % sys.version_info[:2], "machine": machine, "cpus": os.cpu_count()}
+
+
+def cache_path():
+    if os.environ.get(ENV_CACHE):
+        return os.environ[ENV_CACHE]
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(root, "data_structures_algorithms", "dispatch.json")
+
+
+def _load_cache(path=None):
+    # The whole cache file, or None if missing / stale / from another machine
+    try:
+        with open(path or cache_path(), encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cache.get("version") != CACHE_VERSION or cache.get("machine") != _machine():
+        return None
+    return cache
+
+
+def load_table(path=None):
+    # {problem: {variant: [[size, engine], ...]}}, or None if there is no usable cache
+    cache = _load_cache(path)
+    return cache["winners"] if cache else None
+
+
+def _time_engine(engine, method, args):
+    # Best of CALIBRATION_REPEAT batches, each long enough (>= 2 ms) to rise above timer noise
+    call = getattr(engine(), method)
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            call(*args)
+        elapsed = time.perf_counter() - start
+        if elapsed >= 2e-3:
+            break
+        number *= 10 if elapsed < 2e-4 else 2
+    best = elapsed
+    for _ in range(CALIBRATION_REPEAT - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            call(*args)
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+def calibrate(problems=None, sizes=CALIBRATION_SIZES, budget=CALIBRATION_BUDGET, path=None, seed=0):
+    """Time every eligible engine per problem, variant and size; write and return the cache.
+
+    An engine is dropped for the remaining sizes once its fitted growth predicts a run longer
+    than `budget` seconds (it cannot win there). The cache also keeps all timings.
+    """
+    rng = random.Random(seed)
+    winners, timings = {}, {}
+    for name in problems or PROBLEMS:
+        problem = PROBLEMS[name]
+        module = problem.module()
+        for variant in problem.variants:
+            engines = [e for e in problem.eligible(variant) if hasattr(module, e)]
+            history = {e: [] for e in engines}  # engine -> [(size, seconds)]
+            table = winners.setdefault(name, {}).setdefault(variant, [])
+            for n in sizes:
+                args = problem.generator(variant, n, rng)
+                measured = {}
+                for engine in engines:
+                    points = history[engine]
+                    if points:
+                        (n0, t0), (n1, t1) = points[-2] if len(points) > 1 else (1, 0), points[-1]
+                        exponent = math.log(t1 / t0) / math.log(n1 / n0) if t0 > 0 and t1 > 0 else 2.0
+                        if t1 * (n / n1) ** min(max(exponent, 1.0), 3.0) > budget:
+                            continue
+                    seconds = _time_engine(getattr(module, engine), problem.method, args)
+                    points.append((n, seconds))
+                    measured[engine] = seconds
+                if measured:
+                    winner = min(measured, key=measured.get)
+                    if "Solution" in measured and measured[winner] > CALIBRATION_MARGIN * measured["Solution"]:
+                        winner = "Solution"
+                    table.append([n, winner])
+                timings.setdefault(name, {}).setdefault(variant, {})[str(n)] = measured
+    cache = {"version": CACHE_VERSION, "machine": _machine(), "winners": winners, "timings": timings}
+    previous = _load_cache(path)
+    if previous:  # Calibrating a subset keeps the other problems' winners and timings
+        cache["winners"] = {**previous["winners"], **winners}
+        cache["timings"] = {**previous.get("timings", {}), **timings}
+    path = path or cache_path()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=1)
+    os.replace(tmp_path, path)
+    return cache["winners"]
+
+
+# [DISPATCH]
+class Dispatcher:
+    def __init__(self, problem, table=None, sink=None):
+        self.problem = PROBLEMS[problem]
+        self.table = (table or {}).get(problem, {})
+        self.sink = sink if sink is not None else MemorySink(maxlen=10_000)
+        self._module = self.problem.module()
+        setattr(self, self.problem.method, self.__call__)  # e.g. dispatcher.twoSum(nums, target)
+
+    def choose(self, *args):
+        # (engine name, profile, reason)
+        profile = self.problem.profile(*args)
+        variant = profile["variant"]
+        if variant == "ndarray":
+            engine = "NumpySolution" if "NumpySolution" in self.problem.engines else "Solution"
+            return engine, profile, "ndarray"
+        entries = self.table.get(variant) or self.table.get("random")  # e.g. "dense" two_sum input
+        if not entries:
+            return "Solution", profile, "uncalibrated"
+        size = max(profile["size"], 1)
+        engine = min(entries, key=lambda entry: abs(math.log(entry[0] / size)))[1]
+        if engine in self.problem.lowercase_only and not _all_lowercase(*self._texts(args)):
+            # The sample looked lowercase but the input is not: best general engine instead
+            general = self.table.get("ascii") or [[1, "Solution"]]
+            engine = min(general, key=lambda entry: abs(math.log(entry[0] / size)))[1]
+            return engine, profile, "not-lowercase"
+        if engine in self.problem.int_only and not _all_ints(args[0]):
+            # The sample looked like ints (or the variant table only ever saw ints), but the input
+            # is not a list of plain ints: the int-only engine could return a wrong answer
+            return "Solution", profile, "not-int"
+        return engine, profile, "calibrated"
+
+    def _texts(self, args):
+        return args[:2] if self.problem.name == "valid_anagram" else args[:1]
+
+    def __call__(self, *args):
+        engine, profile, reason = self.choose(*args)
+        try:
+            result = getattr(getattr(self._module, engine)(), self.problem.method)(*args)
+        except (TypeError, ValueError, OverflowError) as exc:
+            if engine == "Solution":
+                raise
+            # A restricted engine (NumPy, int64 hash set) rejected the input: the reference engine
+            reason = f"fallback:{type(exc).__name__} from {engine}"
+            engine = "Solution"
+            result = getattr(self._module.Solution(), self.problem.method)(*args)
+        self.sink.emit({"problem": self.problem.name, "engine": engine, "reason": reason,
+                        "size": profile["size"], "variant": profile["variant"], "profile": profile})
+        return result
+
+
+def dispatcher(problem, path=None, sink=None):
+    """Dispatcher for one problem using the calibration cache at `path` (default: cache_path())."""
+    return Dispatcher(problem, load_table(path), sink)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calibrate or show the engine dispatch table.")
+    parser.add_argument("--calibrate", action="store_true", help="run the on-machine calibration")
+    parser.add_argument("--show", action="store_true", help="print the cached winners")
+    parser.add_argument("--problem", action="append", choices=list(PROBLEMS),
+                        help="restrict calibration to this problem (repeatable)")
+    parser.add_argument("--cache", help=f"cache file (default: ${ENV_CACHE} or {cache_path()})")
+    args = parser.parse_args(argv)
+    if not (args.calibrate or args.show):
+        parser.error("nothing to do: pass --calibrate and/or --show")
+    if args.calibrate:
+        calibrate(args.problem, path=args.cache)
+    table = load_table(args.cache)
+    if args.show:
+        if table is None:
+            print("no calibration for this machine; run with --calibrate")
+            return
+        for problem, variants in table.items():
+            for variant, entries in variants.items():
+                print(f"{problem:<26} {variant:<8} " + "  ".join(f"{n}:{engine}" for n, engine in entries))
+
+
+if __name__ == "__main__":
+    main()
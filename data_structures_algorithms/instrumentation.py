@@ -0,0 +1,611 @@
+"""Opt-in instrumentation for the *Solution engines.
+
+The Big-O tables in the problem files claim operation counts ("O(n) dict lookups",
+"heap of size k"); this module makes them observable on real traffic. It patches the public
+methods of every *Solution class in a problem module and sends one record per call to a sink.
+Nothing is patched until instrument() runs, so when disabled it costs exactly nothing.
+
+Every call records latency and element count. A sampled fraction of calls (`deep_rate`) also
+runs under an opcode tracer plus tracemalloc and records:
+  - probes:           dict/set operations - `in`, `d[k]`, `d[k] = v`, `del d[k]` on a hash
+                      container, and calls such as dict.get / set.add
+  - sequence_ops:     the same syntax on anything else (list indexing, `x in list`, ...)
+  - unresolved_ops:   `in` / subscripts whose container could not be identified statically
+  - comparisons:      comparison operators executed in Python code
+  - sort_calls:       calls to sorted / list.sort / heapq's C functions; the comparisons inside
+  - sorted_elements:  them happen in C and cannot be counted, so their input sizes are recorded
+  - peak_bytes:       tracemalloc peak during the call (None when the caller was already
+                      tracing and the call stayed below that session's peak)
+Deep calls are 10-100x slower, so their latency is kept out of the histogram. Opcode counting
+is written against the CPython 3.11-3.13 bytecode; on other versions instrument() warns and
+records latency only. Generator methods (e.g. groupAnagramsStream) are timed across their
+iteration, not just their creation, and emit one record when exhausted or closed.
+
+Usage:
+    from data_structures_algorithms import instrumentation
+    from data_structures_algorithms.arrays_and_hashing import two_sum
+    sink = instrumentation.PrometheusSink()
+    handle = instrumentation.instrument(two_sum, sink, deep_rate=0.01)
+    ...
+    print(sink.render()); handle.disable()
+
+or, without code changes, through the environment (read when a problem module is imported):
+    DSA_INSTRUMENT=jsonl:/tmp/calls.jsonl | prometheus:/tmp/dsa.prom | memory
+    DSA_INSTRUMENT_DEEP=0.01
+"""
+
+import atexit
+import dis
+import functools
+import inspect
+import json
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+import warnings
+from collections import deque
+
+ENV_SINK = "DSA_INSTRUMENT"
+ENV_DEEP_RATE = "DSA_INSTRUMENT_DEEP"
+
+# Prometheus-style latency buckets: 1µs .. 10s in 1-2.5-5 steps
+LATENCY_BUCKETS = tuple(m * 10.0 ** e for e in range(-6, 1) for m in (1, 2.5, 5)) + (10.0,)
+
+DEEP_COUNTERS = ("probes", "sequence_ops", "unresolved_ops", "comparisons", "sort_calls",
+                 "sorted_elements")
+
+
+# [SINKS]
+# A sink receives one dict per call: {"engine", "seconds", "elements", "error", "deep", ...}
+# plus the DEEP_COUNTERS and "peak_bytes" for deep calls. emit() may be called from any thread.
+class MemorySink:
+    def __init__(self, maxlen=100_000):
+        self.records = deque(maxlen=maxlen)  # Oldest records are dropped first
+
+    def emit(self, record):
+        self.records.append(record)  # deque.append is atomic
+
+
+class JsonLinesSink:
+    def __init__(self, target):
+        # `target` is a path (appended to) or an open text file
+        self._owned = isinstance(target, (str, os.PathLike))
+        self._file = open(target, "a", encoding="utf-8") if self._owned else target
+        self._lock = threading.Lock()
+
+    def emit(self, record):
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self):
+        if self._owned:
+            self._file.close()
+
+
+class PrometheusSink:
+    # Aggregates in memory; render() returns the text exposition format
+    def __init__(self, buckets=LATENCY_BUCKETS, prefix="dsa"):
+        self.buckets = tuple(buckets)
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._series = {}  # engine -> aggregated counters
+
+    def emit(self, record):
+        with self._lock:
+            series = self._series.get(record["engine"])
+            if series is None:
+                series = self._series[record["engine"]] = {
+                    "buckets": [0] * len(self.buckets), "count": 0, "sum": 0.0, "calls": 0,
+                    "elements": 0, "errors": 0, "deep_calls": 0, "peak_bytes": 0,
+                    **dict.fromkeys(DEEP_COUNTERS, 0),
+                }
+            series["calls"] += 1
+            series["elements"] += record["elements"] or 0
+            series["errors"] += record["error"] is not None
+            if record["deep"]:
+                series["deep_calls"] += 1
+                for name in DEEP_COUNTERS:
+                    series[name] += record[name]
+                if record["peak_bytes"] is not None:
+                    series["peak_bytes"] = max(series["peak_bytes"], record["peak_bytes"])
+            else:
+                seconds = record["seconds"]
+                series["count"] += 1
+                series["sum"] += seconds
+                for i, bound in enumerate(self.buckets):
+                    if seconds <= bound:
+                        series["buckets"][i] += 1
+                        break
+
+    def render(self):
+        p = self.prefix
+        with self._lock:
+            series = {engine: dict(s, buckets=list(s["buckets"])) for engine, s in self._series.items()}
+        lines = [f"# HELP {p}_call_duration_seconds Latency of instrumented engine calls (deep calls excluded).",
+                 f"# TYPE {p}_call_duration_seconds histogram"]
+        for engine, s in series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, s["buckets"]):
+                cumulative += count
+                lines.append(f'{p}_call_duration_seconds_bucket{{engine="{engine}",le="{bound:g}"}} {cumulative}')
+            lines.append(f'{p}_call_duration_seconds_bucket{{engine="{engine}",le="+Inf"}} {s["count"]}')
+            lines.append(f'{p}_call_duration_seconds_sum{{engine="{engine}"}} {s["sum"]!r}')
+            lines.append(f'{p}_call_duration_seconds_count{{engine="{engine}"}} {s["count"]}')
+        for name, help_text in (("calls", "Instrumented calls."),
+                                ("elements", "Input elements (len of the first argument)."),
+                                ("errors", "Calls that raised."),
+                                ("deep_calls", "Calls sampled for operation counting."),
+                                *((c, f"{c.replace('_', ' ').capitalize()} in deep calls.") for c in DEEP_COUNTERS)):
+            lines.append(f"# HELP {p}_{name}_total {help_text}")
+            lines.append(f"# TYPE {p}_{name}_total counter")
+            lines.extend(f'{p}_{name}_total{{engine="{engine}"}} {s[name]}' for engine, s in series.items())
+        lines.append(f"# HELP {p}_peak_memory_bytes Largest tracemalloc peak seen in a deep call.")
+        lines.append(f"# TYPE {p}_peak_memory_bytes gauge")
+        lines.extend(f'{p}_peak_memory_bytes{{engine="{engine}"}} {s["peak_bytes"]}' for engine, s in series.items())
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        # Write-then-rename, so a scraper (e.g. node_exporter's textfile collector) never sees half a file
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+
+# [STATIC ANALYSIS]
+# `x in c`, `c[k]`, `c[k] = v` and `del c[k]` are single opcodes whose container sits on the
+# value stack, where a tracer cannot see it. For each such opcode, walk the straight-line code
+# before it to find the instruction that pushed the container; when that is a local / global /
+# `obj.attr` load, the tracer can fetch the same object from the frame and check its type.
+_HASH_TYPES = (dict, set, frozenset)  # Counter / defaultdict are dict subclasses
+_CONTAINER_DEPTH = {"CONTAINS_OP": 0, "BINARY_SUBSCR": 1, "STORE_SUBSCR": 1, "DELETE_SUBSCR": 1}
+_PROBE_METHODS = frozenset(("get", "setdefault", "pop", "add", "discard", "remove",
+                            "__contains__", "__getitem__", "__setitem__", "__delitem__"))
+_SORT_FUNCTIONS = frozenset(("sorted", "sort", "heappush", "heappop", "heapreplace", "heappushpop",
+                             "heapify"))
+_NO_STACK_EFFECT = frozenset(("NOP", "RESUME", "PRECALL", "KW_NAMES", "CACHE"))
+_LOCAL_LOADS = frozenset(("LOAD_FAST", "LOAD_FAST_CHECK", "LOAD_DEREF", "LOAD_NAME", "LOAD_CLOSURE"))
+
+# The opcode tables below cover CPython 3.11-3.13. Later versions rename or merge the opcodes
+# counted here (3.14 folds BINARY_SUBSCR into BINARY_OP), so deep sampling is refused there
+# instead of reporting zeros.
+_PY = sys.version_info[:2]
+DEEP_SUPPORTED = (3, 11) <= _PY <= (3, 13)
+# 3.13 pushes a call's NULL / self *after* the callable: LOAD_GLOBAL's name is then its second output
+_NULL_ABOVE_CALLABLE = _PY >= (3, 13)
+
+
+def _stack_effect(ins):
+    # (pops, pushes) for the opcodes that appear inside the expressions we walk through;
+    # None for anything else (the walk gives up rather than guess)
+    name = ins.opname
+    if name in _LOCAL_LOADS or name in ("LOAD_CONST", "PUSH_NULL"):
+        return 0, 1
+    if name == "LOAD_FAST_LOAD_FAST":  # 3.13: two locals at once
+        return 0, 2
+    if name == "LOAD_GLOBAL":
+        return 0, 2 if ins.arg & 1 else 1  # Low bit also pushes NULL for a call
+    if name == "LOAD_ATTR":
+        return 1, 2 if _PY >= (3, 12) and ins.arg & 1 else 1  # 3.12+: low bit = method load
+    if name.startswith("UNARY_") or name in ("TO_BOOL", "STORE_FAST_LOAD_FAST"):
+        return 1, 1
+    if name == "LOAD_METHOD":
+        return 1, 2
+    if name in ("BINARY_OP", "BINARY_SUBSCR", "COMPARE_OP", "CONTAINS_OP", "IS_OP"):
+        return 2, 1
+    if name == "BINARY_SLICE":
+        return 3, 1
+    if name == "CALL":
+        return ins.arg + 2, 1
+    if name == "CALL_KW":  # 3.13: the keyword names tuple is on the stack too
+        return ins.arg + 3, 1
+    if name in ("BUILD_TUPLE", "BUILD_LIST", "BUILD_SET"):
+        return ins.arg, 1
+    if name in _NO_STACK_EFFECT:
+        return 0, 0
+    return None
+
+
+def _producer(instructions, index, depth):
+    # Index of the instruction that pushed stack slot `depth` (0 = top) as seen by
+    # instructions[index], and that slot's position among its outputs (0 = last pushed)
+    for k in range(index - 1, -1, -1):
+        ins = instructions[k]
+        if ins.opname in ("COPY", "SWAP"):  # Augmented assignment: `c[k] += 1`
+            if ins.opname == "COPY":
+                depth = ins.arg - 1 if depth == 0 else depth - 1
+            elif depth in (0, ins.arg - 1):
+                depth = ins.arg - 1 - depth
+            if ins.is_jump_target:
+                return None
+            continue
+        effect = _stack_effect(ins)
+        if effect is None:
+            return None
+        pops, pushes = effect
+        if depth < pushes:
+            return k, depth
+        depth += pops - pushes
+        if ins.is_jump_target:  # Another path joins here: the stack is ambiguous
+            return None
+    return None
+
+
+def _source(instructions, index, depth):
+    # Where the value in stack slot `depth` before instructions[index] was loaded from:
+    # ("local" | "global", name) or ("attr", local_name, attr_name); None if unknown
+    found = _producer(instructions, index, depth)
+    if found is None:
+        return None
+    k, slot = found
+    ins = instructions[k]
+    if ins.opname in _LOCAL_LOADS and slot == 0:
+        return "local", ins.argval
+    if ins.opname in ("LOAD_FAST_LOAD_FAST", "STORE_FAST_LOAD_FAST"):
+        # argval is (first, second); the second name is pushed last
+        names = ins.argval
+        return "local", names[1] if slot == 0 else names[0]
+    if ins.opname == "LOAD_GLOBAL":
+        if slot == (1 if _NULL_ABOVE_CALLABLE and ins.arg & 1 else 0):
+            return "global", ins.argval
+        return None
+    if ins.opname == "LOAD_ATTR" and slot == 0 and not (_PY >= (3, 12) and ins.arg & 1):
+        owner = _producer(instructions, k, 0)
+        if owner is not None and instructions[owner[0]].opname in _LOCAL_LOADS:
+            return "attr", instructions[owner[0]].argval, ins.argval
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _opcode_plan(code):
+    # offset -> ("comparison",) | ("container", source) | ("sorted", source) for the opcodes
+    # the tracer counts; "sorted" marks `sorted(x)` calls, whose input size the C call hides
+    instructions = list(dis.get_instructions(code))
+    plan = {}
+    for i, ins in enumerate(instructions):
+        if ins.opname == "COMPARE_OP":
+            plan[ins.offset] = ("comparison",)
+        elif ins.opname in _CONTAINER_DEPTH:
+            plan[ins.offset] = ("container", _source(instructions, i, _CONTAINER_DEPTH[ins.opname]))
+        elif ins.opname == "CALL" and ins.arg and \
+                _source(instructions, i, ins.arg + _NULL_ABOVE_CALLABLE) == ("global", "sorted"):
+            plan[ins.offset] = ("sorted", _source(instructions, i, ins.arg - 1))  # First argument
+    return plan
+
+
+# [TRACING]
+# Opcodes are observed with sys.settrace on 3.11 and with sys.monitoring (PEP 669) from 3.12 on,
+# where settrace is emulated on top of monitoring and drops the opcode events of the first traced
+# call in a process. C calls go through sys.setprofile on every version.
+_MONITORING_TOOLS = (2, 3, 4)  # PROFILER_ID and the two unassigned ids
+
+
+class _OpCounter:
+    # Counts for one deep call, accumulated over every `with` block it is entered in
+    def __init__(self):
+        self.counts = dict.fromkeys(DEEP_COUNTERS, 0)
+
+    def _resolve(self, frame, source):
+        if source is None:
+            return None
+        try:
+            if source[0] == "local":
+                return frame.f_locals[source[1]]
+            if source[0] == "global":
+                name = source[1]
+                return frame.f_globals[name] if name in frame.f_globals else frame.f_builtins[name]
+            return getattr(frame.f_locals[source[1]], source[2])
+        except (KeyError, AttributeError):
+            return None
+
+    def trace(self, frame, event, arg):
+        if event == "call":
+            if frame.f_code.co_filename == __file__:
+                return None  # The counter's own teardown
+            frame.f_trace_opcodes = True
+            return self.trace
+        if event == "opcode":
+            step = _opcode_plan(frame.f_code).get(frame.f_lasti)
+            if step is not None:
+                self._count(frame, step)
+        return self.trace
+
+    def _count(self, frame, step):
+        if step[0] == "comparison":
+            self.counts["comparisons"] += 1
+        elif step[0] == "sorted":
+            values = self._resolve(frame, step[1])
+            if hasattr(values, "__len__"):
+                self.counts["sorted_elements"] += len(values)
+        else:
+            container = self._resolve(frame, step[1])
+            if container is None:
+                self.counts["unresolved_ops"] += 1
+            elif isinstance(container, _HASH_TYPES):
+                self.counts["probes"] += 1
+            else:
+                self.counts["sequence_ops"] += 1
+
+    def _on_start(self, code, offset):
+        # PY_START / PY_RESUME: enable per-instruction events for code run by the traced thread
+        if threading.get_ident() == self._thread and code.co_filename != __file__ \
+                and code not in self._codes:
+            self._codes.add(code)
+            sys.monitoring.set_local_events(self._tool, code, sys.monitoring.events.INSTRUCTION)
+
+    def _on_instruction(self, code, offset):
+        if threading.get_ident() != self._thread:
+            return  # Local events are per code object, not per thread
+        step = _opcode_plan(code).get(offset)
+        if step is not None:
+            self._count(sys._getframe(1), step)
+
+    def _start_monitoring(self):
+        monitoring = sys.monitoring
+        self._tool = next((t for t in _MONITORING_TOOLS if monitoring.get_tool(t) is None), None)
+        if self._tool is None:
+            return  # Every id taken (debugger, coverage, other threads): only C calls are counted
+        monitoring.use_tool_id(self._tool, "dsa-instrumentation")
+        self._thread = threading.get_ident()
+        self._codes = set()
+        events = monitoring.events
+        monitoring.register_callback(self._tool, events.PY_START, self._on_start)
+        monitoring.register_callback(self._tool, events.PY_RESUME, self._on_start)
+        monitoring.register_callback(self._tool, events.INSTRUCTION, self._on_instruction)
+        monitoring.set_events(self._tool, events.PY_START | events.PY_RESUME)
+
+    def _stop_monitoring(self):
+        monitoring = sys.monitoring
+        if self._tool is None:
+            return
+        for code in self._codes:
+            monitoring.set_local_events(self._tool, code, 0)
+        monitoring.set_events(self._tool, 0)
+        for event in (monitoring.events.PY_START, monitoring.events.PY_RESUME, monitoring.events.INSTRUCTION):
+            monitoring.register_callback(self._tool, event, None)
+        monitoring.free_tool_id(self._tool)
+
+    def profile(self, frame, event, arg):
+        if event == "c_call":
+            name = getattr(arg, "__name__", "")
+            owner = getattr(arg, "__self__", None)
+            if name in _PROBE_METHODS and isinstance(owner, _HASH_TYPES):
+                self.counts["probes"] += 1
+            elif name in _SORT_FUNCTIONS:
+                self.counts["sort_calls"] += 1
+                if name == "sort" and isinstance(owner, list):
+                    self.counts["sorted_elements"] += len(owner)
+        return None
+
+    def __enter__(self):
+        self._saved = sys.gettrace(), sys.getprofile()
+        if _PY >= (3, 12):
+            self._start_monitoring()
+        else:
+            sys.settrace(self.trace)
+        sys.setprofile(self.profile)
+        return self
+
+    def __exit__(self, *exc):
+        trace, profile = self._saved
+        if _PY >= (3, 12):
+            self._stop_monitoring()
+        else:
+            sys.settrace(trace)
+        sys.setprofile(profile)
+
+
+class _DeepStep:
+    # One traced stretch of a deep call: opcode counting into `counter` plus tracemalloc.
+    # tracemalloc is only started / stopped here when nobody else is tracing; a caller's session
+    # is left running with its peak untouched, so the call's own peak is only known when it
+    # raised that session's peak (peak_bytes is None otherwise).
+    def __init__(self, counter, local):
+        self.counter = counter
+        self.local = local
+        self.peak = None
+
+    def __enter__(self):
+        self.was_tracing = tracemalloc.is_tracing()
+        if self.was_tracing:
+            self.baseline, self.outer_peak = tracemalloc.get_traced_memory()
+        else:
+            tracemalloc.start()
+        self.local.active = True
+        self.counter.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        self.counter.__exit__(*exc)
+        self.local.active = False
+        current, peak = tracemalloc.get_traced_memory()
+        if not self.was_tracing:
+            tracemalloc.stop()
+            self.peak = peak
+        elif peak > self.outer_peak:
+            self.peak = peak - self.baseline
+
+
+# [INSTRUMENTATION]
+class Instrumentation:
+    # Handle returned by instrument(): owns the patched methods and can restore them
+    def __init__(self, sink, deep_rate=0.0):
+        self.sink = sink
+        self.deep_rate = deep_rate
+        self._patched = []  # (class, attribute name, original function)
+        self._local = threading.local()  # Nested engine calls inside a deep call are not re-traced
+
+    def _wrap(self, engine, method):
+        if inspect.isgeneratorfunction(method):
+            return self._wrap_generator(engine, method)
+        sink = self.sink
+        local = self._local
+        rng = random.random
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            data = args[1] if len(args) > 1 else next(iter(kwargs.values()), None)
+            elements = len(data) if hasattr(data, "__len__") else None
+            deep = self.deep_rate > 0 and not getattr(local, "active", False) and rng() < self.deep_rate
+            if not deep:
+                error = None
+                start = time.perf_counter()
+                try:
+                    return method(*args, **kwargs)
+                except BaseException as exc:
+                    error = type(exc).__name__
+                    raise
+                finally:
+                    sink.emit({"engine": engine, "seconds": time.perf_counter() - start,
+                               "elements": elements, "error": error, "deep": False})
+            return self._deep_call(engine, method, args, kwargs, elements)
+
+        return wrapper
+
+    def _deep_call(self, engine, method, args, kwargs, elements):
+        error = None
+        counter = _OpCounter()
+        step = _DeepStep(counter, self._local)
+        start = time.perf_counter()
+        try:
+            with step:
+                return method(*args, **kwargs)
+        except BaseException as exc:
+            error = type(exc).__name__
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            self.sink.emit({"engine": engine, "seconds": seconds, "elements": elements,
+                            "error": error, "deep": True, **counter.counts, "peak_bytes": step.peak})
+
+    def _wrap_generator(self, engine, method):
+        # Calling a generator function only creates the generator; the work happens as it is
+        # iterated. Time each step (not the consumer's code in between) and emit one record when
+        # the generator finishes or is closed. A deep call traces every step; peak_bytes is then
+        # the largest peak of a single step.
+        sink = self.sink
+        local = self._local
+        rng = random.random
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            data = args[1] if len(args) > 1 else next(iter(kwargs.values()), None)
+            elements = len(data) if hasattr(data, "__len__") else None
+            deep = self.deep_rate > 0 and not getattr(local, "active", False) and rng() < self.deep_rate
+            counter = _OpCounter() if deep else None
+            peak = None
+            seconds = 0.0
+            error = None
+            gen = method(*args, **kwargs)
+            resume, value = gen.send, None
+            try:
+                while True:
+                    start = time.perf_counter()
+                    try:
+                        if deep:
+                            step = _DeepStep(counter, local)
+                            with step:
+                                item = resume(value)
+                            if step.peak is not None:
+                                peak = step.peak if peak is None else max(peak, step.peak)
+                        else:
+                            item = resume(value)
+                    except StopIteration as stop:
+                        return stop.value
+                    finally:
+                        seconds += time.perf_counter() - start
+                    try:
+                        resume, value = gen.send, (yield item)
+                    except GeneratorExit:
+                        raise
+                    except BaseException as exc:  # Thrown in by the consumer: forward it
+                        resume, value = gen.throw, exc
+            except GeneratorExit:
+                raise  # Closed early by the consumer: not an error
+            except BaseException as exc:
+                error = type(exc).__name__
+                raise
+            finally:
+                gen.close()
+                record = {"engine": engine, "seconds": seconds, "elements": elements,
+                          "error": error, "deep": deep}
+                if deep:
+                    record.update(counter.counts, peak_bytes=peak)
+                sink.emit(record)
+
+        return wrapper
+
+    def add_class(self, cls, prefix=None):
+        # Patch the public methods `cls` defines itself (inherited ones belong to their own class)
+        prefix = prefix or cls.__module__.rsplit(".", 1)[-1]
+        for name, method in list(vars(cls).items()):
+            if name.startswith("_") or not callable(method) or isinstance(method, (staticmethod, classmethod, type)):
+                continue
+            self._patched.append((cls, name, method))
+            setattr(cls, name, self._wrap(f"{prefix}.{cls.__name__}.{name}", method))
+
+    def disable(self):
+        # Restore the original methods; the classes are then exactly as before instrument()
+        while self._patched:
+            cls, name, method = self._patched.pop()
+            setattr(cls, name, method)
+
+
+def solution_classes(module):
+    # The *Solution classes a problem module defines (same rule as benchmark.discover_solutions)
+    namespace = module if isinstance(module, dict) else vars(module)
+    return [obj for name, obj in namespace.items()
+            if isinstance(obj, type) and name.lower().endswith("solution")
+            and obj.__module__ == namespace.get("__name__")]
+
+
+def instrument(target, sink, deep_rate=0.0):
+    """Instrument a problem module (all its *Solution classes), a class, or a list of either.
+
+    `deep_rate` is the fraction of calls that also collect operation counts and tracemalloc peak.
+    Returns an Instrumentation handle; handle.disable() restores the original methods.
+    """
+    if deep_rate > 0 and not DEEP_SUPPORTED:
+        warnings.warn(f"deep sampling supports CPython 3.11-3.13, not {sys.version.split()[0]}; "
+                      "only latency is recorded", RuntimeWarning, stacklevel=2)
+        deep_rate = 0.0
+    handle = Instrumentation(sink, deep_rate)
+    for item in target if isinstance(target, (list, tuple)) else [target]:
+        for cls in [item] if isinstance(item, type) else solution_classes(item):
+            handle.add_class(cls)
+    return handle
+
+
+# [ENVIRONMENT]
+# Enables instrumentation of every problem module imported through the package, without touching
+# the calling code. All modules share one sink per process.
+_env_sink = None
+
+
+def sink_from_spec(spec):
+    # "memory" | "jsonl:<path>" | "prometheus:<path>" (rendered to <path> at exit)
+    kind, _, path = spec.partition(":")
+    if kind == "memory":
+        return MemorySink()
+    if kind == "jsonl" and path:
+        return JsonLinesSink(path)
+    if kind == "prometheus" and path:
+        sink = PrometheusSink()
+        atexit.register(sink.write, path)
+        return sink
+    raise ValueError(f"{ENV_SINK} must be memory, jsonl:<path> or prometheus:<path>, got {spec!r}")
+
+
+def instrument_from_env(namespace):
+    global _env_sink
+    spec = os.environ.get(ENV_SINK)
+    if not spec:
+        return None
+    if _env_sink is None:
+        _env_sink = sink_from_spec(spec)
+    return instrument(namespace, _env_sink, deep_rate=float(os.environ.get(ENV_DEEP_RATE, "0")))